@@ -0,0 +1,44 @@
+# coding=utf-8
+"""
+Microbenchmark for formatter dispatch in Generator.format.
+
+Compares Generator.format, which calls the formatter straight from the
+generator's formatter table, with the previous dispatch, which went through
+get_formatter and built a new functools.partial for every call.
+
+    python benchmarks/formatter_dispatch.py
+"""
+
+from __future__ import print_function
+
+import functools
+import timeit
+
+from faker import Factory
+
+NUMBER = 200000
+FORMATTERS = ('random_digit', 'last_name', 'company_suffix')
+
+
+def partial_get_formatter(generator, formatter, num=1, sparsity=0, unique=False, options={}, multiple=False):
+    return functools.partial(getattr(generator, formatter), **options)
+
+
+def partial_format(generator, formatter, *args, **kwargs):
+    """Generator.format as it used to dispatch formatters."""
+    return partial_get_formatter(generator, formatter)(*args, **kwargs)
+
+
+def main():
+    fake = Factory.create()
+    fake.seed(0)
+
+    for name in FORMATTERS:
+        table = timeit.timeit(lambda: fake.format(name), number=NUMBER)
+        partial = timeit.timeit(lambda: partial_format(fake, name), number=NUMBER)
+        print('{0:<15} table: {1:6.3f}us  partial: {2:6.3f}us  ({3:.2f}x)'.format(
+            name, table / NUMBER * 1e6, partial / NUMBER * 1e6, partial / table))
+
+
+if __name__ == '__main__':
+    main()
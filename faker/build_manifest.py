@@ -0,0 +1,84 @@
+# coding=utf-8
+
+"""
+Generates faker/manifest.py, the list of the providers of
+faker.config.META_PROVIDERS_MODULES, of the locales of the localized ones
+and of their formatters, which faker.config reads instead of importing and
+scanning every provider package on import, and which lazy generators (see
+Factory.create) register their formatters from. Run it again whenever a provider or a locale
+is added or removed:
+
+    python -m faker.build_manifest
+"""
+
+from __future__ import print_function
+
+from importlib import import_module
+import os
+import pprint
+import sys
+
+MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'manifest.py')
+
+
+def write_manifest(fh, meta_providers_modules=None):
+    from faker.config import DEFAULT_LOCALE, META_PROVIDERS_MODULES
+    from faker.utils.loading import find_available_providers, list_module
+
+    modules = meta_providers_modules or META_PROVIDERS_MODULES
+    providers = find_available_providers([import_module(path) for path in modules])
+    locales = {}
+    default_locales = {}
+    formatters = {}
+    locale_formatters = {}
+    for provider_path in providers:
+        provider_module = import_module(provider_path)
+        if not getattr(provider_module, 'localized', False):
+            formatters[provider_path] = _formatters(provider_module.Provider)
+            continue
+
+        locales[provider_path] = sorted(list_module(provider_module))
+        default_locale = getattr(provider_module, 'default_locale', DEFAULT_LOCALE)
+        if default_locale != DEFAULT_LOCALE:
+            default_locales[provider_path] = default_locale
+
+        # the formatters of all the locales, and those of some locales only
+        names = dict((locale, _formatters(import_module(provider_path + '.' + locale).Provider))
+                     for locale in locales[provider_path])
+        common = set.intersection(*[set(locale_names) for locale_names in names.values()])
+        formatters[provider_path] = sorted(common)
+        for locale, locale_names in names.items():
+            extra = [name for name in locale_names if name not in common]
+            if extra:
+                locale_formatters[provider_path + '.' + locale] = extra
+
+    fh.write('# coding=utf-8\n'
+             '# Generated by `python -m faker.build_manifest`, do not edit.\n\n')
+    fh.write('PROVIDERS = {0}\n\n'.format(pprint.pformat(providers)))
+    fh.write('LOCALES = {0}\n\n'.format(pprint.pformat(locales)))
+    fh.write('DEFAULT_LOCALES = {0}\n\n'.format(pprint.pformat(default_locales)))
+    fh.write('# the formatters of each provider (but those of BaseProvider), in all its locales\n')
+    fh.write('FORMATTERS = {0}\n\n'.format(pprint.pformat(formatters)))
+    fh.write('# the formatters of the locales of the providers that only they have\n')
+    fh.write('LOCALE_FORMATTERS = {0}\n'.format(pprint.pformat(locale_formatters)))
+
+
+def _formatters(provider_class):
+    # the public methods of a provider class, but those of BaseProvider
+    from faker.providers import BaseProvider
+
+    names = []
+    for name in dir(provider_class):
+        if name.startswith('_'):
+            continue
+        for cls in provider_class.__mro__:
+            if name in cls.__dict__:
+                break
+        if cls not in (BaseProvider, object) and callable(getattr(provider_class, name)):
+            names.append(name)
+    return sorted(names)
+
+
+if __name__ == "__main__":
+    with open(sys.argv[1] if len(sys.argv) > 1 else MANIFEST_PATH, 'w') as fh:
+        write_manifest(fh)
@@ -65,7 +65,8 @@ def print_doc(provider_or_field=None,
               args=None, lang=DEFAULT_LOCALE, output=None, includes=None, definition=None, num=1):
     args = args or []
     output = output or sys.stdout
-    fake = Faker(locale=lang, includes=includes)
+    # the providers are only all needed to document them
+    fake = Faker(locale=lang, includes=includes, lazy=bool(provider_or_field))
 
     from faker.providers import BaseProvider
     base_provider_formatters = [f for f in dir(BaseProvider)]
@@ -118,6 +119,20 @@ def print_doc(provider_or_field=None,
                 print_provider(d, p, fs, output=output)
 
 
+def write_profiles(definition, num, lang=DEFAULT_LOCALE, output=None, includes=None, sep='\n',
+                   checkpoint=None, resume=False):
+    """
+    Write num profiles of a definition to output one by one, each followed
+    by sep, saving the state of the run to the checkpoint file; with
+    resume=True, an interrupted run continues where it was checkpointed.
+    """
+    output = output or sys.stdout
+    fake = Faker(locale=lang, includes=includes, lazy=True)
+    for profile in fake.iter_profiles(definition, num=num, checkpoint=checkpoint, resume=resume,
+                                      output_file=output):
+        print(text_type(profile), end=sep, file=output)
+
+
 class Command(object):
 
     def __init__(self, argv=None):
@@ -145,8 +160,6 @@ class Command(object):
                             version="%(prog)s {0}".format(VERSION))
 
         parser.add_argument('-o', metavar="output",
-                            type=argparse.FileType('w'),
-                            default=sys.stdout,
                             help="redirect output to a file")
 
         parser.add_argument('-l', '--lang',
@@ -158,6 +171,12 @@ class Command(object):
                             default='\n')
 
         parser.add_argument('-d', '--definition')
+        parser.add_argument('--checkpoint', metavar="file",
+                            help="write the profiles of a definition one by one, saving the "
+                                 "state of the run to this file to be able to resume it")
+        parser.add_argument('--resume', action='store_true',
+                            help="resume an interrupted run from its checkpoint (by default, "
+                                 "the output file's name followed by '.checkpoint')")
 
         parser.add_argument('-i', '--include', default=META_PROVIDERS_MODULES, nargs='*')
 
@@ -165,6 +184,14 @@ class Command(object):
 
         arguments = parser.parse_args(self.argv[1:])
 
+        if arguments.resume and not arguments.o:
+            parser.error('an output file (-o) is required to resume a run')
+        if arguments.checkpoint and not arguments.o:
+            parser.error('an output file (-o) is required to checkpoint a run')
+        checkpoint = arguments.checkpoint
+        if arguments.resume and not checkpoint:
+            checkpoint = arguments.o + '.checkpoint'
+
         if arguments.definition:
             fileobj = open(arguments.definition)
             definition = load(fileobj, Loader=Loader)
@@ -176,29 +203,54 @@ class Command(object):
         # command line arguments override the file definition
         if fake and fake != 'profile':
             definition = None
-
-        if definition:
-            print_doc(provider_or_field='profile',
-                      args=arguments.fake[1:],
-                      lang=arguments.lang,
-                      output=arguments.o,
-                      includes=arguments.include,
-                      definition=definition,
-                      num=arguments.repeat
-                      )
+        # only the profiles of a definition are written one by one
+        if checkpoint and not definition:
+            parser.error('a profile definition (-d) is required to checkpoint a run')
+
+        if not arguments.o:
+            output = sys.stdout
+        elif arguments.resume and os.path.exists(arguments.o):
+            # the profiles written before the checkpoint are kept
+            output = open(arguments.o, 'r+')
         else:
-            for i in range(arguments.repeat):
-                print_doc(provider_or_field=fake,
+            output = open(arguments.o, 'w')
+
+        try:
+            if definition and checkpoint:
+                write_profiles(definition,
+                               num=arguments.repeat,
+                               lang=arguments.lang,
+                               output=output,
+                               includes=arguments.include,
+                               sep=arguments.sep,
+                               checkpoint=checkpoint,
+                               resume=arguments.resume
+                               )
+            elif definition:
+                print_doc(provider_or_field='profile',
                           args=arguments.fake[1:],
                           lang=arguments.lang,
-                          output=arguments.o,
-                          includes=arguments.include
+                          output=output,
+                          includes=arguments.include,
+                          definition=definition,
+                          num=arguments.repeat
                           )
-                print(arguments.sep, file=arguments.o)
-
-                if not fake:
-                    # repeat not supported for all docs
-                    break
+            else:
+                for i in range(arguments.repeat):
+                    print_doc(provider_or_field=fake,
+                              args=arguments.fake[1:],
+                              lang=arguments.lang,
+                              output=output,
+                              includes=arguments.include
+                              )
+                    print(arguments.sep, file=output)
+
+                    if not fake:
+                        # repeat not supported for all docs
+                        break
+        finally:
+            if output is not sys.stdout:
+                output.close()
 
 
 def execute_from_command_line(argv=None):
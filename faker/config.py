@@ -1,6 +1,6 @@
 # coding=utf-8
 from importlib import import_module
-from faker.utils.loading import find_available_locales, find_available_providers
+from faker.utils.loading import find_available_locales, find_available_providers, load_manifest
 
 DEFAULT_LOCALE = 'en_US'
 
@@ -8,6 +8,15 @@ META_PROVIDERS_MODULES = [
     'faker.providers',
 ]
 
-PROVIDERS = find_available_providers([import_module(path) for path in META_PROVIDERS_MODULES])
+# the providers and locales are listed in a manifest generated ahead of time,
+# so that importing faker doesn't need to import and scan all the providers
+_manifest = load_manifest()
 
-AVAILABLE_LOCALES = find_available_locales(PROVIDERS)
+if _manifest is not None:
+    PROVIDERS = list(_manifest.PROVIDERS)
+
+    AVAILABLE_LOCALES = set(locale for locales in _manifest.LOCALES.values() for locale in locales)
+else:
+    PROVIDERS = find_available_providers([import_module(path) for path in META_PROVIDERS_MODULES])
+
+    AVAILABLE_LOCALES = find_available_locales(PROVIDERS)
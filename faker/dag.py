@@ -2,6 +2,15 @@
 
 import copy
 import multiprocessing
+from multiprocessing.pool import ThreadPool
+import sys
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+from faker.utils import transport
 
 
 class Node(object):
@@ -19,63 +28,250 @@ class Node(object):
     def add_child(self, child_id):
         self.children.append(child_id)
 
+    def get_node(self):
+        return Node(self.id, copy.deepcopy(self.parents), copy.deepcopy(self.children))
+
 
-class ProcessNode(Node, multiprocessing.Process):
-    def __init__(self, id, worker, done_event, results):
+class TaskNode(Node):
+    def __init__(self, id, worker, local=False):
         Node.__init__(self, id=id)
-
-        multiprocessing.Process.__init__(self, target=worker)
         self.worker = worker
-        self.done_event = done_event
-        self.parent_events = []
-        self.results = results
+        # whether the worker must run in the calling process, e.g. because
+        # it keeps state across runs
+        self.local = local
 
-    def __str__(self):
-        return self.id
 
-    def get_node(self):
-        return Node(self.id, copy.deepcopy(self.parents), copy.deepcopy(self.children))
+try:
+    # the workers are closures, which are only handed to processes by forking
+    _fork = multiprocessing.get_context('fork')
+except AttributeError:
+    # Python 2 forks wherever it can
+    _fork = multiprocessing if sys.platform != 'win32' else None
+except ValueError:
+    _fork = None
+
+# the nodes of the pool a worker process belongs to, set by _init_worker
+# when it is forked
+_nodes = {}
+
+
+def _init_worker(nodes):
+    global _nodes
+    _nodes = nodes
+
+
+def _run_node(id, dependency_handles, arguments, nodes=None):
+    # columns go through shared memory; only their handles are pickled
+    try:
+        dependency_values = dict((parameter, transport.read_column(handle))
+                                 for parameter, handle in dependency_handles.items())
+        dependency_values.update(arguments)
+        worker = (_nodes if nodes is None else nodes)[id].worker
+        return id, True, transport.write_column(worker(**dependency_values))
+    except Exception as e:
+        return id, False, e
+
+
+def _run_thread_node(id, dependency_values, nodes):
+    try:
+        return id, True, nodes[id].worker(**dependency_values)
+    except Exception as e:
+        return id, False, e
+
+
+EXECUTORS = ('serial', 'threads', 'processes')
+
+
+class ProcessPool(object):
+    """
+    The worker processes of the 'processes' executor of run(), to be kept
+    across runs: they are forked with the nodes of a run, and run the
+    following runs of the same nodes (the same dict) without forking again.
+    A run of other nodes forks new processes. Close it once done.
+    """
 
-    def add_parent(self, parameter, dependency, parent_event):
-        Node.add_parent(self, parameter, dependency)
-        self.parent_events.append(parent_event)
+    def __init__(self):
+        self._pool = None
+        self._nodes = None
+        self._processes = None
 
-    def run(self):
-        for event in self.parent_events:
-            event.wait()
+    def get(self, nodes, processes):
+        """The pool of processes to run nodes on."""
+        if self._pool is None or nodes is not self._nodes or processes != self._processes:
+            self.close()
+            transport.prepare()
+            # each pool has its own table of nodes, so runs can be concurrent
+            self._pool = _fork.Pool(processes, initializer=_init_worker, initargs=(nodes,))
+            self._nodes = nodes
+            self._processes = processes
+        return self._pool
 
-        dependency_values = {}
-        for parameter in self.parents:
-            parent = self.parents[parameter]
-            dependency_values[parameter] = self.results[parent]
-        self.results[self.id] = self.worker(**dependency_values)
+    def close(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+            self._nodes = None
 
-        self.done_event.set()
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def run(nodes, processes=None, order=None, executor='processes', pool=None, arguments=None):
+    """
+    Runs the worker of every node once its parents' workers are done, passing
+    it their results as keyword arguments (by parameter name), and returns
+    the results by node id.
+
+    executor is one of:
+    - 'processes': ready nodes run on a pool of at most processes worker
+      processes (by default, one per CPU), forked for this run unless a
+      ProcessPool is given. Results are passed between processes through
+      shared memory (see faker.utils.transport). The workers of local nodes
+      always run in this process. Where processes can't be forked, this is
+      the same as 'threads'.
+    - 'threads': ready nodes run on a pool of at most processes threads.
+    - 'serial': the workers run in this process, in topological order, one
+      after the other. This is also the case with a single process, or a
+      single node.
+    No more nodes are submitted to a pool than it has workers to run them.
+    The first exception raised by a worker stops the run and is raised
+    again here.
+
+    order is the topological order of the nodes, if already known (see
+    validate); otherwise the nodes are validated first. arguments are more
+    keyword arguments of the workers of this run, by node id.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError('Unknown executor "{0}", must be one of: {1}'.format(executor, ', '.join(EXECUTORS)))
+    if order is None:
+        order = validate(nodes)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    processes = max(1, min(processes, len(nodes)))
+    if executor == 'processes' and _fork is None:
+        executor = 'threads'
+
+    def node_arguments(id):
+        return arguments.get(id, {}) if arguments else {}
+
+    results = {}
+    if executor == 'serial' or processes == 1:
+        for id in order:
+            node = nodes[id]
+            results[id] = node.worker(**dict(_dependency_values(node, results), **node_arguments(id)))
+        return results
+
+    if executor == 'threads':
+        thread_pool = ThreadPool(processes)
+        try:
+            _schedule(nodes, order, processes, results,
+                      lambda id, values, callbacks: thread_pool.apply_async(
+                          _run_thread_node, (id, dict(values, **node_arguments(id)), nodes), **callbacks))
+        finally:
+            thread_pool.terminate()
+            thread_pool.join()
+        return results
+
+    own_pool = pool is None
+    if own_pool:
+        pool = ProcessPool()
+    process_pool = pool.get(nodes, processes)
+    handles = {}
+
+    def submit(id, dependency_handles, callbacks):
+        if nodes[id].local:
+            callbacks['callback'](_run_node(id, dependency_handles, node_arguments(id), nodes))
+        else:
+            process_pool.apply_async(_run_node, (id, dependency_handles, node_arguments(id)), **callbacks)
+
+    try:
+        _schedule(nodes, order, processes, handles, submit)
+        for id in handles:
+            results[id] = transport.read_column(handles[id])
+    except BaseException:
+        # the nodes still running would write to a run that is over
+        pool.close()
+        raise
+    finally:
+        if own_pool:
+            pool.close()
+        for handle in handles.values():
+            transport.release(handle)
+
+    return results
+
+
+def _schedule(nodes, order, size, outputs, submit):
+    # submits ready nodes, at most size at a time, and collects their
+    # outputs until all nodes are done
+    done = queue.Queue()
+    callbacks = {'callback': done.put}
+    if sys.version_info[0] >= 3:
+        # e.g. a result that cannot be pickled
+        callbacks['error_callback'] = lambda e: done.put((None, False, e))
+
+    waiting = dict((id, set(nodes[id].parents.values())) for id in order)
+    ready = [id for id in order if not waiting[id]]
+    running = 0
+
+    while ready or running:
+        while ready and running < size:
+            id = ready.pop(0)
+            del waiting[id]
+            submit(id, _dependency_values(nodes[id], outputs), callbacks)
+            running += 1
+
+        id, ok, value = done.get()
+        running -= 1
+        if not ok:
+            raise value
+        outputs[id] = value
+
+        for child_id in nodes[id].children:
+            parents = waiting.get(child_id)
+            if parents is not None:
+                parents.discard(id)
+                if not parents and child_id not in ready:
+                    ready.append(child_id)
+
+
+def _dependency_values(node, results):
+    return dict((parameter, results[parent]) for parameter, parent in node.parents.items())
 
 
 def validate(nodes):
     # Validate that this set of nodes is indeed a DAG
-    # by traversing the graph in topological order
+    # by traversing the graph in topological order,
+    # and return the node ids in that order
 
     all_nodes = {}
     for id in nodes:
         all_nodes[id] = nodes[id].get_node()
 
     orphan_nodes = list(filter(lambda id: len(all_nodes[id].parents) == 0, all_nodes))
+    order = []
 
     while len(orphan_nodes) > 0:
         id = orphan_nodes.pop()
         node = all_nodes[id]
+        order.append(id)
 
         for child_id in node.children:
             child = all_nodes[child_id]
 
             parameters = list(child.parents.keys())
+            removed = False
             for parameter in parameters:
                 if child.parents[parameter] == id:
                     del child.parents[parameter]
+                    removed = True
 
-            if len(child.parents) == 0:
+            # a child depending on a node through several parameters is listed once per parameter
+            if removed and len(child.parents) == 0:
                 orphan_nodes.append(child_id)
 
         del all_nodes[id]
@@ -83,3 +279,5 @@ def validate(nodes):
     if len(all_nodes) > 0:
         raise SyntaxError('Loop(s) detected on the following nodes: '
                           + ', '.join(str(node_id) for node_id in all_nodes))
+
+    return order
@@ -8,13 +8,50 @@ import locale as pylocale
 
 from faker import Generator
 from faker.config import DEFAULT_LOCALE, PROVIDERS, AVAILABLE_LOCALES
-from faker.utils.loading import list_module
+from faker.generator import LazyFormatter
+from faker.providers import BaseProvider
+from faker.utils.loading import get_provider_locales, load_manifest
 
 
 class Factory(object):
 
+    # generators built by create, by (locale, providers, includes, lazy),
+    # cloned to create the next generators with the same providers
+    _generators = {}
+
+    @classmethod
+    def create(cls, locale=None, providers=None, generator=None, includes=None, num=1, lazy=False, **config):
+        """
+        Creates a generator with the given providers (by default, all the
+        providers of faker) and includes, in the given locale.
+
+        The first generator created for a set of providers is kept, and the
+        next ones are clones of it (see Generator.clone), unless a generator
+        or a configuration is given.
+
+        With lazy=True, the formatters of the providers listed in the
+        manifest (see faker.build_manifest) are registered without importing
+        the providers: each provider is imported and created the first time
+        one of its formatters is used. Until then, it is not in the
+        generator's providers.
+        """
+        if generator is None and not config:
+            key = (locale, tuple(providers or ()), tuple(includes or ()), lazy)
+            try:
+                built = cls._generators[key]
+            except KeyError:
+                built = cls._generators[key] = cls._build(locale, providers, Generator(), includes, lazy)
+            return built.clone()
+
+        return cls._build(locale, providers, generator or Generator(**config), includes, lazy)
+
     @classmethod
-    def create(cls, locale=None, providers=None, generator=None, includes=None, num=1, **config):
+    def clear_cache(cls):
+        """Forgets the generators kept by create."""
+        cls._generators.clear()
+
+    @classmethod
+    def _build(cls, locale, providers, faker, includes, lazy):
         if includes is None:
             includes = []
 
@@ -25,24 +62,51 @@ class Factory(object):
             msg = 'Invalid configuration for faker locale "{0}"'.format(locale)
             raise AttributeError(msg)
 
-        providers = providers or PROVIDERS
-
-        providers += includes
+        # copied, not to add the includes to the default providers
+        providers = list(providers or PROVIDERS) + list(includes)
 
-        faker = generator or Generator(**config)
+        manifest = load_manifest() if lazy else None
+        if manifest is not None:
+            # the formatters every provider has
+            faker.add_provider(BaseProvider)
 
         for prov_name in providers:
             if prov_name == 'faker.providers':
                 continue
 
-            prov_cls, lang_found = cls._get_provider_class(prov_name, locale)
-            provider = prov_cls(faker)
-            provider.__provider__ = prov_name
-            provider.__lang__ = lang_found
-            faker.add_provider(provider)
+            if manifest is not None and prov_name in manifest.FORMATTERS:
+                cls._add_lazy_provider(faker, manifest, prov_name, locale)
+                continue
+
+            faker.add_provider(cls._create_provider(faker, prov_name, locale))
 
         return faker
 
+    @classmethod
+    def _create_provider(cls, faker, prov_name, locale):
+        prov_cls, lang_found = cls._get_provider_class(prov_name, locale)
+        provider = prov_cls(faker)
+        provider.__provider__ = prov_name
+        provider.__lang__ = lang_found
+        return provider
+
+    @classmethod
+    def _add_lazy_provider(cls, faker, manifest, prov_name, locale):
+        # registers stubs for the formatters of a provider, the way
+        # Generator.add_provider would register the provider's methods
+        module = prov_name
+        if prov_name in manifest.LOCALES:
+            if locale not in manifest.LOCALES[prov_name]:
+                locale = manifest.DEFAULT_LOCALES.get(prov_name, DEFAULT_LOCALE)
+            module = prov_name + '.' + locale
+
+        def create(generator):
+            return cls._create_provider(generator, prov_name, locale)
+
+        load = LazyFormatter.loader(faker, create)
+        for name in manifest.FORMATTERS[prov_name] + manifest.LOCALE_FORMATTERS.get(module, []):
+            faker.set_formatter(name, LazyFormatter(faker, name, load, create))
+
     @classmethod
     def _get_provider_class(cls, provider, locale=''):
 
@@ -71,7 +135,7 @@ class Factory(object):
         provider_module = import_module(provider_path)
 
         if getattr(provider_module, 'localized', False):
-            available_locales = list_module(provider_module)
+            available_locales = get_provider_locales(provider_path, provider_module)
             if not locale or locale not in available_locales:
                 locale = getattr(provider_module, 'default_locale', DEFAULT_LOCALE)
 
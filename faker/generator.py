@@ -2,15 +2,105 @@
 
 from __future__ import unicode_literals
 
+from array import array
 import functools
+import hashlib
 import re
-import random
+import random as mod_random
+import types
 
-from faker.providers import BaseProvider
+# shared random number generator, used by providers that are not attached to
+# a generator. It is created before the imports below, so that the
+# modules importing it get this instance and not the random module.
+random = mod_random.Random()
+
+from faker.utils.datasets import ListColumn, group_rows
+from faker.utils.text import join_columns
+from faker.utils.unique import BACKENDS, MAX_RETRIES, UniqueValues
 import faker.utils.stats as stats
 
 _re_token = re.compile(r'\{\{(\s?)(\w+)(\s?)\}\}')
-random = random.Random()
+
+# maximum number of compiled format strings kept by a generator
+MAX_TEMPLATES = 4096
+
+
+def shard_seed(seed, shard):
+    """
+    Derive the seed of a shard's stream from the job's seed. Hashing the pair
+    gives seeds that are unrelated to each other even for consecutive shards.
+    """
+    key = '{0}:{1}'.format(seed, shard).encode('utf-8')
+    return int(hashlib.sha512(key).hexdigest(), 16)
+
+
+def _method_owner(method):
+    """The class (for classmethods) or instance a method is bound to."""
+    return getattr(method, '__self__', None)
+
+
+def _defining_class(method, name):
+    """The class in the MRO of the method's owner that defines it."""
+    owner = _method_owner(method)
+    if owner is None:
+        return None
+    if not isinstance(owner, type):
+        owner = type(owner)
+    for cls in owner.__mro__:
+        if name in cls.__dict__:
+            return cls
+    return None
+
+
+class LazyFormatter(object):
+    """
+    Stands for the formatter of a provider that has not been created yet
+    (see Factory.create(lazy=True)): the first time it is called (or
+    resolved), load is called to create the provider and register its
+    formatters in place of their LazyFormatters. create is the function
+    creating the provider for a generator, to make the same stubs for
+    another generator (see Generator.clone).
+    """
+    __slots__ = ('generator', 'name', 'load', 'create')
+
+    def __init__(self, generator, name, load, create):
+        self.generator = generator
+        self.name = name
+        self.load = load
+        self.create = create
+
+    @staticmethod
+    def loader(generator, create):
+        """
+        Returns a function that, the first time it is called, creates the
+        provider for the generator and replaces the LazyFormatters loading
+        it that are still registered by the provider's formatters.
+        """
+        done = []
+
+        def load():
+            if done:
+                return
+            done.append(True)
+            provider = create(generator)
+            generator.providers.insert(0, provider)
+            for name, formatter in list(generator._formatters.items()):
+                # unless another provider's formatter replaced it since
+                if isinstance(formatter, LazyFormatter) and formatter.load is load:
+                    generator.set_formatter(name, getattr(provider, name))
+
+        return load
+
+    def resolve(self):
+        """The formatter this stands for."""
+        self.load()
+        formatter = self.generator._formatters.get(self.name, self)
+        if isinstance(formatter, LazyFormatter):
+            raise AttributeError('Formatter "{0}" was not registered by its provider'.format(self.name))
+        return formatter
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
 
 
 class Generator(object):
@@ -19,6 +109,10 @@ class Generator(object):
 
     def __init__(self, **config):
         self.providers = []
+        self._random = mod_random.Random()
+        self._formatters = {}
+        self._templates = {}
+        self._batch_formatters = {}
         self.__config = dict(
             list(self.__config.items()) + list(config.items()))
         self._num = 1
@@ -64,24 +158,85 @@ class Generator(object):
 
     @property
     def random(self):
-        return random
+        """The random number generator owned by this generator."""
+        return self._random
 
-    def seed(self, seed=None):
-        """Calls random.seed"""
-        random.seed(seed)
+    def seed(self, seed=None, shard=None, num_shards=None):
+        """
+        Calls random.seed on this generator's random number generator.
+
+        shard: index of the part of a job this generator works on. Each
+               (seed, shard) pair seeds its own independent stream, so a
+               shard always generates the same values, no matter which
+               process generates it or how many processes share the job.
+        num_shards: the number of parts the job is split into, used to
+                    check the shard index.
+        """
+        if shard is not None:
+            if seed is None:
+                raise ValueError('A seed is required to seed a shard')
+            if shard < 0 or (num_shards is not None and shard >= num_shards):
+                raise ValueError('Shard {0} is out of range for {1} shards'.format(shard, num_shards))
+            seed = shard_seed(seed, shard)
+        self._random.seed(seed)
+
+    def clone(self, seed=None):
+        """
+        Returns a new generator with the same providers and formatters as
+        this one, but its own random number generator, seeded with seed if
+        given. The providers are copied rather than created again, so they
+        share their data with this generator's, and their formatters are
+        rebound to the copies instead of being looked up again.
+        """
+        clone = self.__class__(**self.__config)
+        clone._num = self._num
+
+        owners = {}
+        for provider in self.providers:
+            copy = provider._clone(clone)
+            owners[id(provider)] = copy
+            # the owner of the provider's classmethods
+            owners[id(type(provider))] = type(copy)
+            clone.providers.append(copy)
+
+        formatters = clone._formatters
+        loaders = {}
+        for name, formatter in self._formatters.items():
+            owner = owners.get(id(getattr(formatter, '__self__', None)))
+            if owner is not None:
+                formatter = types.MethodType(formatter.__func__, owner)
+            elif isinstance(formatter, LazyFormatter):
+                # the clone loads its own provider, the first time it is used
+                if formatter.load not in loaders:
+                    loaders[formatter.load] = LazyFormatter.loader(clone, formatter.create)
+                formatter = LazyFormatter(clone, name, loaders[formatter.load], formatter.create)
+            formatters[name] = formatter
+        # what set_formatter does for each of them
+        clone.__dict__.update(formatters)
+
+        if seed is not None:
+            clone.seed(seed)
+        return clone
 
     def format(self, formatter, *args, **kwargs):
         """
         This is a secure way to make a fake from another Provider.
         """
         # TODO: data export?
-        return self.get_formatter(formatter)(*args, **kwargs)
+        try:
+            method = self._formatters[formatter]
+        except KeyError:
+            method = self.get_formatter(formatter)
+        return method(*args, **kwargs)
 
     def get_formatter(self, formatter, num=1, sparsity=0, unique=False, options={}, multiple=False):
         """
         Generate num values, where each value can itself be an array of values.
 
         num: the number of values to generate.
+        unique: whether the values must be unique; True keeps track of them in memory, or the name of
+                another backend in faker.utils.unique.BACKENDS ('disk') can be given. A set from one
+                of the backends can also be given, to keep the values unique across calls.
         multiple: - If defined as a dictionary, this argument signifies that each generated value should be
                     an array of values. The fields of the dictionary define the shape of the array.
                   - Otherwise this argument should be set to False, signifying that each generated value
@@ -98,63 +253,120 @@ class Generator(object):
         normal_var = stats.RandomNormalVar(min=multiple['min'],
                                            max=multiple['max'],
                                            variance=multiple['variance'],
-                                           mean=multiple['mean'])
+                                           mean=multiple['mean'],
+                                           random=self._random)
 
-        # only one value is requested (and this value is an array of values)
+        single_value_provider = self._get_formatter_no_multiples(formatter=formatter, options=options)
+
+        # only one value is requested (and this value is an array of values),
+        # returned as a list whatever its length
         if num < 2:
-            return self._get_formatter_no_multiples(formatter=formatter,
-                                                    num=normal_var.get_int(),
-                                                    sparsity=0,
-                                                    unique=(not multiple['duplicates']),
-                                                    options=options)
+            def one_value(**args):
+                length = normal_var.get_int()
+                if length > 1:
+                    return self._get_formatter_no_multiples(formatter=formatter,
+                                                            num=length,
+                                                            unique=(not multiple['duplicates']),
+                                                            options=options)(**args)
+                return [single_value_provider(**args) for _ in range(length)]
+
+            return one_value
 
         # num>1 values requested, and each of them is itself an array of values
         def n_values(**args):
-            res = []
-            if len(args):
-                for i in range(num):
-                    if sparsity and random.randint(1, 100) <= sparsity:
-                        res.append(None)
-                    else:
-                        arg_set = {}
+            # the lengths of all the arrays are drawn at once, and their values
+            # generated as one flat batch, returned as a ListColumn
+            if sparsity:
+                rows = [i for i in range(num) if self._random.randint(1, 100) > sparsity]
+            else:
+                rows = list(range(num))
+            lengths = normal_var.get_int_list(num)
+
+            valid = bytearray(num)
+            for i in rows:
+                valid[i] = 1
+            offsets = array('q', [0]) * (num + 1)
+            end = 0
+            for i in range(num):
+                if valid[i]:
+                    end += max(lengths[i], 0)
+                offsets[i + 1] = end
+
+            # the arguments of each value are its array's
+            list_keys = [key for key in args if isinstance(args[key], list)]
+            value_args = args.copy()
+            for key in list_keys:
+                value_args[key] = [args[key][i] for i in rows for _ in range(offsets[i + 1] - offsets[i])]
+
+            if end > 1:
+                values = self._get_formatter_no_multiples(formatter=formatter, num=end,
+                                                          options=options)(**value_args)
+            elif end == 1:
+                values = [single_value_provider(**dict((key, value_args[key][0] if key in list_keys else args[key])
+                                                       for key in args))]
+            else:
+                values = []
 
-                        for key in args:
-                            arg_set[key] = args[key][i]
+            if not multiple['duplicates']:
+                for i in rows:
+                    start, stop = offsets[i], offsets[i + 1]
+                    if stop - start < 2:
+                        continue
+                    row_args = dict((key, args[key][i] if key in list_keys else args[key]) for key in args)
+                    self._deduplicate(values, start, stop, lambda: single_value_provider(**row_args), formatter)
 
-                        res.append(self._get_formatter_no_multiples(formatter=formatter,
-                                                                    sparsity=0,
-                                                                    unique=(not multiple['duplicates']),
-                                                                    options=options,
-                                                                    num=normal_var.get_int())(**arg_set))
-            else:
-                for _ in range(num):
-                    if sparsity and random.randint(1, 100) <= sparsity:
-                        res.append(None)
-                    else:
-                        res.append(self._get_formatter_no_multiples(formatter=formatter,
-                                                                    sparsity=0,
-                                                                    unique=(not multiple['duplicates']),
-                                                                    options=options,
-                                                                    num=normal_var.get_int())())
-            return res
+            return ListColumn(offsets, values, valid)
 
         return n_values
 
+    @staticmethod
+    def _deduplicate(values, start, stop, generate, name):
+        # replaces the repeated values in values[start:stop] by new ones
+        seen = set()
+        for j in range(start, stop):
+            value = values[j]
+            attempts = 0
+            while value in seen:
+                if attempts >= MAX_RETRIES:
+                    raise ValueError('No new value for unique "{0}" after {1} attempts; '
+                                     'it may have run out of values ({2} generated)'.format(
+                                         name, MAX_RETRIES, len(seen)))
+                value = generate()
+                attempts += 1
+            seen.add(value)
+            values[j] = value
+
     def _get_formatter_no_multiples(self, formatter, num=1, sparsity=0, unique=False, options={}):
         """
         Generate num values, where each value is actually a single value, not an array.
         """
-        if num < 2:
-            try:
-                return functools.partial(getattr(self, formatter), **options)
-            except AttributeError:
-                raise AttributeError('Unknown formatter "{0}"'.format(formatter))
+        if num < 2 and hasattr(unique, 'add'):
+            return self.unique(formatter, seen=unique, **options)
 
-        if unique:
+        if num < 2:
             try:
-                unique_getter = functools.partial(getattr(self, formatter + "_unique"), n=num, **options)
-            except AttributeError:
-                raise AttributeError('No formatter for unique "{0}"'.format(formatter))
+                method = self._formatters[formatter]
+            except KeyError:
+                try:
+                    method = getattr(self, formatter)
+                except AttributeError:
+                    raise AttributeError('Unknown formatter "{0}"'.format(formatter))
+            if isinstance(method, LazyFormatter):
+                method = method.resolve()
+            if options:
+                return functools.partial(method, **options)
+            return method
+
+        if unique or hasattr(unique, 'add'):
+            if hasattr(unique, 'add'):
+                # a set of values generated before, e.g. by earlier calls
+                unique_getter = self._get_unique_values(formatter, num, options, unique)
+            else:
+                try:
+                    unique_getter = functools.partial(getattr(self, formatter + "_unique"), n=num, **options)
+                except AttributeError:
+                    backend = unique if unique in BACKENDS else 'memory'
+                    unique_getter = self._get_unique_values(formatter, num, options, BACKENDS[backend]())
 
             if sparsity == 0:
                 return unique_getter
@@ -163,55 +375,147 @@ class Generator(object):
                 values = unique_getter(**args)
 
                 for i in range(len(values)):
-                    if random.randint(1, 100) <= sparsity:
+                    if self._random.randint(1, 100) <= sparsity:
                         values[i] = None
 
                 return values
 
             return sparserator
 
-        def n_values_wrapper(**wrapper_args):
-            try:
-                # if the formatter takes the n argument, then it knows how to generate n values
-                # (presumably it's a more efficient method than generating values one by one)
-                combined_args = wrapper_args.copy()
-                combined_args.update(options)
-                return getattr(self, formatter)(n=num, **combined_args)
-            except:
-                # otherwise we generate the n values one at a time
+        # fail early on unknown formatters
+        single_value_provider = self._get_formatter_no_multiples(formatter=formatter, options=options)
+
+        def n_values(**args):
+            res = [None] * num
+            if sparsity:
+                rows = [i for i in range(num) if self._random.randint(1, 100) > sparsity]
+            else:
+                rows = range(num)
+
+            list_keys = [key for key in args if isinstance(args[key], list)]
+            if list_keys:
+                # each value is generated with its own arguments; the rows sharing
+                # the same arguments are generated together, in one batch
+                rows = list(rows)
+                if len(list_keys) == 1:
+                    keys = args[list_keys[0]]
+                else:
+                    keys = list(zip(*[args[key] for key in list_keys]))
+                sparse = len(rows) < num
                 try:
-                    single_value_provider = functools.partial(getattr(self, formatter), **options)
-                except AttributeError:
-                    raise AttributeError('Unknown formatter "{0}"'.format(formatter))
+                    groups = group_rows([keys[i] for i in rows] if sparse else keys)
+                except TypeError:
+                    # unhashable arguments
+                    groups = None
+
+                if groups is None:
+                    for i in rows:
+                        arg_set = {}
+
+                        for key in args:
+                            if isinstance(args[key], list):
+                                arg_set[key] = args[key][i]
+                            else:
+                                # if a list of arguments wasn't given, then each value is generated using the same arguments
+                                arg_set[key] = args[key]
 
-                def n_values(**args):
-                    res = []
-                    if len(args):
-                        if sparsity and random.randint(1, 100) <= sparsity:
-                            res.append(None)
-                        else:
-                            for i in range(num):
-                                arg_set = {}
-
-                                for key in args:
-                                    if isinstance(args[key], list):
-                                        arg_set[key] = args[key][i]
-                                    else:
-                                        # if a list of arguments wasn't given, then each value is generated using the same arguments
-                                        arg_set[key] = args[key]
-
-                                res.append(single_value_provider(**arg_set))
-                        return res
-                    for _ in range(num):
-                        if sparsity and random.randint(1, 100) <= sparsity:
-                            res.append(None)
-                        else:
-                            res.append(single_value_provider())
+                        res[i] = single_value_provider(**arg_set)
                     return res
 
-                return n_values(**wrapper_args)
+                for key, group in groups.items():
+                    arg_set = options.copy()
+                    arg_set.update(args)
+                    arg_set.update(zip(list_keys, (key,) if len(list_keys) == 1 else key))
+                    values = self.batch(formatter, len(group), **arg_set)
+                    if sparse:
+                        group = [rows[j] for j in group]
+                    for i, value in zip(group, values):
+                        res[i] = value
+                return res
+
+            combined_args = args.copy()
+            combined_args.update(options)
+            for i, value in zip(rows, self.batch(formatter, len(rows), **combined_args)):
+                res[i] = value
+            return res
+
+        return n_values
+
+    def _get_unique_values(self, formatter, num, options, seen):
+        """
+        Generate num unique values of a formatter without a '<formatter>_unique' method.
+        """
+        unique_values = self.unique(formatter, seen=seen, **options)
+
+        def unique_getter(**args):
+            if any(isinstance(args[key], list) for key in args):
+                res = []
+                for i in range(num):
+                    arg_set = {}
+                    for key in args:
+                        arg_set[key] = args[key][i] if isinstance(args[key], list) else args[key]
+                    res.append(unique_values(**arg_set))
+                return res
+            return unique_values.take(num, **args)
 
-        return n_values_wrapper
+        return unique_getter
+
+    def unique(self, formatter, max_retries=MAX_RETRIES, seen=None, **options):
+        """
+        Returns a UniqueValues wrapper around the given formatter: every call
+        (or take(n)) returns values it has not returned before, until
+        max_retries attempts in a row fail to produce a new one.
+        Only 64-bit hashes of the values are kept, to keep memory bounded: in
+        a HashSet, or in seen if given (e.g. a DiskSet, for more values than
+        fit in memory).
+        """
+        single_value_provider = self._get_formatter_no_multiples(formatter, options=options)
+
+        def batch(n, **kwargs):
+            kwargs.update(options)
+            return self.batch(formatter, n, **kwargs)
+
+        return UniqueValues(single_value_provider, max_retries=max_retries, name=formatter, batch=batch, seen=seen)
+
+    def batch(self, formatter, n, **kwargs):
+        """
+        Generate a list of n values of the given formatter.
+
+        A provider can implement a formatter's batch version as a method
+        named '<formatter>_batch', taking the formatter's arguments and n,
+        and returning a list of n values. It is used if it is defined by the
+        same provider as the formatter, and not overridden by a subclass
+        that only redefines the formatter; otherwise the formatter is called
+        n times.
+        """
+        batch_formatter = self._get_batch_formatter(formatter)
+        if batch_formatter is not None:
+            return batch_formatter(n=n, **kwargs)
+        single_value_provider = self._get_formatter_no_multiples(formatter)
+        return [single_value_provider(**kwargs) for _ in range(n)]
+
+    def _get_batch_formatter(self, formatter):
+        try:
+            return self._batch_formatters[formatter]
+        except KeyError:
+            pass
+
+        batch_formatter = self._formatters.get(formatter + '_batch')
+        if isinstance(batch_formatter, LazyFormatter):
+            batch_formatter = batch_formatter.resolve()
+        if isinstance(self._formatters.get(formatter), LazyFormatter):
+            self._formatters[formatter].resolve()
+        if batch_formatter is not None:
+            # the batch method must be at least as specific as the formatter
+            batch_class = _defining_class(batch_formatter, formatter + '_batch')
+            formatter_class = _defining_class(self._formatters.get(formatter), formatter)
+            if (batch_class is None or formatter_class is None or
+                    not issubclass(batch_class, formatter_class) or
+                    _method_owner(batch_formatter) is not _method_owner(self._formatters[formatter])):
+                batch_formatter = None
+
+        self._batch_formatters[formatter] = batch_formatter
+        return batch_formatter
 
     def set_formatter(self, name, method):
         """
@@ -219,15 +523,73 @@ class Generator(object):
         Override this method to add some decoration or logging stuff.
         """
         setattr(self, name, method)
+        self._formatters[name] = method
+        # compiled templates and batch methods may refer to the formatter being replaced
+        self._templates.clear()
+        self._batch_formatters.clear()
 
     def parse(self, text):
         """
         Replaces tokens (like '{{ tokenName }}' or '{{tokenName}}')
         with the result from the token method call.
         """
-        return _re_token.sub(self.__format_token, text)
+        try:
+            template = self._templates[text]
+        except KeyError:
+            template = self._compile_template(text)
+        return template()
 
-    def __format_token(self, matches):
-        formatter = list(matches.groups())
-        formatter[1] = self.format(formatter[1])
-        return ''.join(formatter)
+    def _compile_template(self, text):
+        """
+        Split a format string into literal segments and the formatters for
+        its tokens, once, so that parse doesn't need to scan it again.
+        """
+        parts = _re_token.split(text)
+
+        # parts are [literal, space, token, space, literal, space, ...]
+        literals = [parts[0]]
+        formatters = []
+        for i in range(1, len(parts), 4):
+            literals[-1] += parts[i]
+            formatters.append(self.get_formatter(parts[i + 1]))
+            literals.append(parts[i + 2] + parts[i + 3])
+
+        if len(self._templates) >= MAX_TEMPLATES:
+            self._templates.clear()
+        template = self._templates[text] = Template(literals, formatters, parts[2::4])
+        return template
+
+    def parse_batch(self, text, n):
+        """
+        Batch version of parse: generates n strings from the same format
+        string, generating the values of each token as a batch.
+        """
+        try:
+            template = self._templates[text]
+        except KeyError:
+            template = self._compile_template(text)
+
+        if not template.names:
+            return [text] * n
+        return join_columns(template.literals, [self.batch(name, n) for name in template.names])
+
+
+class Template(object):
+    """
+    A compiled format string (e.g. '{{first_name}} {{last_name}}'): its
+    literal segments, and the formatters to call for the tokens between them.
+    """
+    __slots__ = ('literals', 'formatters', 'names')
+
+    def __init__(self, literals, formatters, names):
+        self.literals = literals
+        self.formatters = formatters
+        self.names = names
+
+    def __call__(self):
+        literals = self.literals
+        res = [literals[0]]
+        for i, formatter in enumerate(self.formatters):
+            res.append(formatter())
+            res.append(literals[i + 1])
+        return ''.join(res)
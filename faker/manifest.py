@@ -0,0 +1,467 @@
+# coding=utf-8
+# Generated by `python -m faker.build_manifest`, do not edit.
+
+PROVIDERS = ['faker.providers.address',
+ 'faker.providers.barcode',
+ 'faker.providers.color',
+ 'faker.providers.company',
+ 'faker.providers.credit_card',
+ 'faker.providers.currency',
+ 'faker.providers.date_time',
+ 'faker.providers.file',
+ 'faker.providers.internet',
+ 'faker.providers.job',
+ 'faker.providers.lorem',
+ 'faker.providers.medical',
+ 'faker.providers.misc',
+ 'faker.providers.person',
+ 'faker.providers.phone_number',
+ 'faker.providers.profile',
+ 'faker.providers.python',
+ 'faker.providers.ssn',
+ 'faker.providers.user_agent']
+
+LOCALES = {'faker.providers.address': ['cs_CZ',
+                             'de_DE',
+                             'el_GR',
+                             'en',
+                             'en_AU',
+                             'en_CA',
+                             'en_GB',
+                             'en_US',
+                             'es',
+                             'es_ES',
+                             'es_MX',
+                             'fa_IR',
+                             'fi_FI',
+                             'fr_FR',
+                             'hi_IN',
+                             'hr_HR',
+                             'it_IT',
+                             'ja_JP',
+                             'ko_KR',
+                             'ne_NP',
+                             'nl_NL',
+                             'no_NO',
+                             'pl_PL',
+                             'pt_BR',
+                             'pt_PT',
+                             'sk_SK',
+                             'sl_SI',
+                             'sv_SE',
+                             'zh_CN',
+                             'zh_TW'],
+ 'faker.providers.color': ['en_US'],
+ 'faker.providers.company': ['bg_BG',
+                             'cs_CZ',
+                             'de_DE',
+                             'en_US',
+                             'es_MX',
+                             'fa_IR',
+                             'fi_FI',
+                             'fr_FR',
+                             'hr_HR',
+                             'it_IT',
+                             'ja_JP',
+                             'ko_KR',
+                             'no_NO',
+                             'pt_BR',
+                             'pt_PT',
+                             'sk_SK',
+                             'sl_SI',
+                             'sv_SE',
+                             'zh_CN',
+                             'zh_TW'],
+ 'faker.providers.internet': ['bg_BG',
+                              'bs_BA',
+                              'cs_CZ',
+                              'de_AT',
+                              'de_DE',
+                              'el_GR',
+                              'en_AU',
+                              'en_US',
+                              'fa_IR',
+                              'fi_FI',
+                              'fr_FR',
+                              'hr_HR',
+                              'ja_JP',
+                              'ko_KR',
+                              'no_NO',
+                              'pt_BR',
+                              'pt_PT',
+                              'sk_SK',
+                              'sl_SI',
+                              'sv_SE'],
+ 'faker.providers.job': ['en_US', 'fa_IR', 'fr_FR', 'pl_PL', 'ru_RU', 'uk_UA'],
+ 'faker.providers.lorem': ['el_GR', 'la', 'ru_RU'],
+ 'faker.providers.person': ['bg_BG',
+                            'cs_CZ',
+                            'de_AT',
+                            'de_DE',
+                            'dk_DK',
+                            'el_GR',
+                            'en',
+                            'en_US',
+                            'es_ES',
+                            'es_MX',
+                            'fa_IR',
+                            'fi_FI',
+                            'fr_FR',
+                            'hi_IN',
+                            'hr_HR',
+                            'it_IT',
+                            'ja_JP',
+                            'ko_KR',
+                            'lt_LT',
+                            'lv_LV',
+                            'ne_NP',
+                            'nl_NL',
+                            'no_NO',
+                            'pl_PL',
+                            'pt_BR',
+                            'pt_PT',
+                            'ru_RU',
+                            'sl_SI',
+                            'sv_SE',
+                            'tr_TR',
+                            'uk_UA',
+                            'zh_CN',
+                            'zh_TW'],
+ 'faker.providers.phone_number': ['bg_BG',
+                                  'bs_BA',
+                                  'cs_CZ',
+                                  'de_DE',
+                                  'dk_DK',
+                                  'el_GR',
+                                  'en_AU',
+                                  'en_CA',
+                                  'en_GB',
+                                  'en_US',
+                                  'es_ES',
+                                  'es_MX',
+                                  'fa_IR',
+                                  'fi_FI',
+                                  'fr_FR',
+                                  'hi_IN',
+                                  'hr_HR',
+                                  'it_IT',
+                                  'ja_JP',
+                                  'ko_KR',
+                                  'lt_LT',
+                                  'lv_LV',
+                                  'ne_NP',
+                                  'nl_NL',
+                                  'no_NO',
+                                  'pl_PL',
+                                  'pt_BR',
+                                  'pt_PT',
+                                  'ru_RU',
+                                  'sk_SK',
+                                  'sl_SI',
+                                  'sv_SE',
+                                  'tr_TR',
+                                  'uk_UA',
+                                  'zh_CN',
+                                  'zh_TW'],
+ 'faker.providers.ssn': ['en_CA',
+                         'en_US',
+                         'fi_FI',
+                         'it_IT',
+                         'ko_KR',
+                         'nl_NL',
+                         'pt_BR',
+                         'sv_SE',
+                         'uk_UA',
+                         'zh_CN',
+                         'zh_TW']}
+
+DEFAULT_LOCALES = {'faker.providers.lorem': 'la'}
+
+# the formatters of each provider (but those of BaseProvider), in all its locales
+FORMATTERS = {'faker.providers.address': ['address',
+                             'address_batch',
+                             'building_number',
+                             'building_number_batch',
+                             'city',
+                             'city_batch',
+                             'city_suffix',
+                             'country',
+                             'country_code',
+                             'geo_coordinate',
+                             'latitude',
+                             'longitude',
+                             'postcode',
+                             'postcode_batch',
+                             'street_address',
+                             'street_address_batch',
+                             'street_name',
+                             'street_name_batch',
+                             'street_suffix'],
+ 'faker.providers.barcode': ['ean', 'ean13', 'ean8'],
+ 'faker.providers.color': ['color_name',
+                           'hex_color',
+                           'rgb_color',
+                           'rgb_color_list',
+                           'rgb_css_color',
+                           'safe_color_name',
+                           'safe_hex_color'],
+ 'faker.providers.company': ['company', 'company_batch', 'company_suffix'],
+ 'faker.providers.credit_card': ['credit_card_expire',
+                                 'credit_card_full',
+                                 'credit_card_number',
+                                 'credit_card_provider',
+                                 'credit_card_security_code'],
+ 'faker.providers.currency': ['currency_code'],
+ 'faker.providers.date_time': ['am_pm',
+                               'century',
+                               'date',
+                               'date_batch',
+                               'date_time',
+                               'date_time_ad',
+                               'date_time_batch',
+                               'date_time_between',
+                               'date_time_between_batch',
+                               'date_time_between_dates',
+                               'date_time_this_century',
+                               'date_time_this_decade',
+                               'date_time_this_month',
+                               'date_time_this_year',
+                               'day_of_month',
+                               'day_of_week',
+                               'iso8601',
+                               'iso8601_batch',
+                               'month',
+                               'month_name',
+                               'time',
+                               'time_delta',
+                               'timezone',
+                               'unix_time',
+                               'unix_time_batch',
+                               'year'],
+ 'faker.providers.file': ['file_extension', 'file_name', 'mime_type'],
+ 'faker.providers.internet': ['company_email',
+                              'domain_name',
+                              'domain_name_batch',
+                              'domain_word',
+                              'domain_word_batch',
+                              'email',
+                              'email_batch',
+                              'free_email',
+                              'free_email_domain',
+                              'free_email_domain_batch',
+                              'image_url',
+                              'ipv4',
+                              'ipv6',
+                              'mac_address',
+                              'safe_email',
+                              'slug',
+                              'tld',
+                              'tld_batch',
+                              'uri',
+                              'uri_extension',
+                              'uri_page',
+                              'uri_path',
+                              'url',
+                              'user_name',
+                              'user_name_batch'],
+ 'faker.providers.job': ['job'],
+ 'faker.providers.lorem': ['paragraph',
+                           'paragraphs',
+                           'sentence',
+                           'sentences',
+                           'text',
+                           'word',
+                           'words'],
+ 'faker.providers.medical': ['icd9',
+                             'icd9_unique',
+                             'mrn',
+                             'mrn_sequence',
+                             'mrn_unique',
+                             'mrn_unique_stream'],
+ 'faker.providers.misc': ['boolean',
+                          'country_code',
+                          'language_code',
+                          'locale',
+                          'md5',
+                          'null_boolean',
+                          'password',
+                          'sha1',
+                          'sha256',
+                          'uuid4'],
+ 'faker.providers.person': ['birthdate',
+                            'first_name',
+                            'first_name_batch',
+                            'first_name_female',
+                            'first_name_male',
+                            'gender',
+                            'last_name',
+                            'last_name_batch',
+                            'last_name_female',
+                            'last_name_male',
+                            'name',
+                            'name_batch',
+                            'name_female',
+                            'name_male',
+                            'prefix',
+                            'prefix_female',
+                            'prefix_male',
+                            'suffix',
+                            'suffix_female',
+                            'suffix_male'],
+ 'faker.providers.phone_number': ['phone_number', 'phone_number_batch'],
+ 'faker.providers.profile': ['choice',
+                             'choice_batch',
+                             'compile_profile',
+                             'constant',
+                             'constant_batch',
+                             'default_profile',
+                             'iter_profiles',
+                             'profile',
+                             'simple_profile',
+                             'spec_profile'],
+ 'faker.providers.python': ['pybool',
+                            'pydecimal',
+                            'pydict',
+                            'pyfloat',
+                            'pyint',
+                            'pyiterable',
+                            'pylist',
+                            'pyset',
+                            'pystr',
+                            'pystruct',
+                            'pytuple'],
+ 'faker.providers.ssn': ['ssn'],
+ 'faker.providers.user_agent': ['chrome',
+                                'firefox',
+                                'internet_explorer',
+                                'linux_platform_token',
+                                'linux_processor',
+                                'mac_platform_token',
+                                'mac_processor',
+                                'opera',
+                                'safari',
+                                'user_agent',
+                                'windows_platform_token']}
+
+# the formatters of the locales of the providers that only they have
+LOCALE_FORMATTERS = {'faker.providers.address.cs_CZ': ['city_name',
+                                   'state',
+                                   'street_suffix_long',
+                                   'street_suffix_short'],
+ 'faker.providers.address.de_DE': ['city_name',
+                                   'state',
+                                   'street_suffix_long',
+                                   'street_suffix_short'],
+ 'faker.providers.address.el_GR': ['latlng',
+                                   'line_address',
+                                   'region',
+                                   'street',
+                                   'street_prefix',
+                                   'street_prefix_long',
+                                   'street_prefix_short'],
+ 'faker.providers.address.en_AU': ['city_prefix',
+                                   'secondary_address',
+                                   'state',
+                                   'state_abbr'],
+ 'faker.providers.address.en_CA': ['city_prefix',
+                                   'postal_code_letter',
+                                   'postalcode',
+                                   'province',
+                                   'province_abbr',
+                                   'secondary_address'],
+ 'faker.providers.address.en_GB': ['city_prefix', 'secondary_address'],
+ 'faker.providers.address.en_US': ['city_prefix',
+                                   'military_apo',
+                                   'military_dpo',
+                                   'military_ship',
+                                   'military_state',
+                                   'postalcode',
+                                   'postalcode_plus4',
+                                   'secondary_address',
+                                   'secondary_address_batch',
+                                   'state',
+                                   'state_abbr',
+                                   'zipcode',
+                                   'zipcode_batch',
+                                   'zipcode_plus4'],
+ 'faker.providers.address.es_ES': ['secondary_address',
+                                   'state',
+                                   'state_name',
+                                   'street_prefix'],
+ 'faker.providers.address.es_MX': ['city_adjetive',
+                                   'city_prefix',
+                                   'secondary_address',
+                                   'state',
+                                   'state_abbr',
+                                   'street_prefix'],
+ 'faker.providers.address.fa_IR': ['city_prefix', 'secondary_address', 'state'],
+ 'faker.providers.address.fi_FI': ['city_name', 'fruit', 'state'],
+ 'faker.providers.address.fr_FR': ['department',
+                                   'department_name',
+                                   'department_number',
+                                   'region',
+                                   'street_prefix'],
+ 'faker.providers.address.hi_IN': ['city_name', 'state'],
+ 'faker.providers.address.hr_HR': ['city_name', 'state'],
+ 'faker.providers.address.it_IT': ['city_prefix',
+                                   'secondary_address',
+                                   'state',
+                                   'state_abbr'],
+ 'faker.providers.address.ja_JP': ['ban',
+                                   'building_name',
+                                   'chome',
+                                   'gou',
+                                   'prefecture',
+                                   'town',
+                                   'zipcode'],
+ 'faker.providers.address.ko_KR': ['secondary_address', 'state'],
+ 'faker.providers.address.ne_NP': ['building_prefix', 'district'],
+ 'faker.providers.address.nl_NL': ['province'],
+ 'faker.providers.address.pt_BR': ['bairro',
+                                   'estado',
+                                   'estado_nome',
+                                   'estado_sigla',
+                                   'street_prefix'],
+ 'faker.providers.address.pt_PT': ['city_name', 'street_prefix'],
+ 'faker.providers.address.sk_SK': ['city_name',
+                                   'state',
+                                   'street_suffix_long',
+                                   'street_suffix_short'],
+ 'faker.providers.address.sl_SI': ['city_name', 'state'],
+ 'faker.providers.address.sv_SE': ['city_name', 'state', 'street_prefix'],
+ 'faker.providers.address.zh_CN': ['city_name', 'state'],
+ 'faker.providers.address.zh_TW': ['city_name', 'secondary_address'],
+ 'faker.providers.company.en_US': ['bs', 'catch_phrase'],
+ 'faker.providers.company.es_MX': ['bs', 'catch_phrase', 'company_prefix'],
+ 'faker.providers.company.fi_FI': ['company_business_id', 'company_vat'],
+ 'faker.providers.company.fr_FR': ['catch_phrase',
+                                   'catch_phrase_attribute',
+                                   'catch_phrase_noun',
+                                   'catch_phrase_verb',
+                                   'siren',
+                                   'siret'],
+ 'faker.providers.company.it_IT': ['bs', 'catch_phrase'],
+ 'faker.providers.company.ja_JP': ['company_prefix'],
+ 'faker.providers.company.ko_KR': ['bs', 'catch_phrase'],
+ 'faker.providers.company.pt_BR': ['catch_phrase',
+                                   'catch_phrase_attribute',
+                                   'catch_phrase_noun',
+                                   'catch_phrase_verb'],
+ 'faker.providers.company.zh_CN': ['company_prefix'],
+ 'faker.providers.company.zh_TW': ['company_prefix'],
+ 'faker.providers.person.en_US': ['age',
+                                  'first_name_female_batch',
+                                  'first_name_male_batch'],
+ 'faker.providers.person.ja_JP': ['first_kana_name',
+                                  'first_kana_name_female',
+                                  'first_kana_name_male',
+                                  'first_romanized_name',
+                                  'first_romanized_name_female',
+                                  'first_romanized_name_male',
+                                  'kana_name',
+                                  'last_kana_name',
+                                  'last_romanized_name',
+                                  'romanized_name'],
+ 'faker.providers.phone_number.en_AU': ['area_code'],
+ 'faker.providers.phone_number.zh_CN': ['phonenumber_prefix'],
+ 'faker.providers.ssn.pt_BR': ['cpf']}
@@ -5,7 +5,10 @@ import re
 import string
 
 from faker.generator import random
-from faker.utils.distribution import choice_distribution
+from faker.utils.datasets import group_rows
+from faker.utils.distribution import WeightedChoice, cached_choice
+from faker.utils.text import join_columns
+from faker.utils.unique import UniqueSequence
 import faker.utils.stats as stats
 
 
@@ -14,6 +17,9 @@ _re_perc = re.compile(r'%')
 _re_excl = re.compile(r'!')
 _re_at = re.compile(r'@')
 _re_qm = re.compile(r'\?')
+_re_numerify = re.compile(r'([#%!@])')
+_re_lexify = re.compile(r'(\?)')
+_re_bothify = re.compile(r'([#%!@?])')
 
 
 class BaseProvider(object):
@@ -21,9 +27,62 @@ class BaseProvider(object):
     __provider__ = 'base'
     __lang__ = None
 
+    # random number generator used by the provider's methods; a provider
+    # created for a generator draws from that generator's own RNG instead
+    random = random
+
+    def __new__(cls, generator=None, *args, **kwargs):
+        generator_random = getattr(generator, 'random', None)
+        if generator_random is not None:
+            cls = cls._bind_random(generator_random)
+        return super(BaseProvider, cls).__new__(cls)
+
     def __init__(self, generator):
         self.generator = generator
 
+    def _clone(self, generator):
+        """
+        Returns a copy of this provider for another generator, drawing from
+        that generator's random number generator.
+        """
+        provider = object.__new__(self._bind_random(generator.random))
+        provider.__dict__.update(self.__dict__)
+        provider.generator = generator
+        return provider
+
+    @classmethod
+    def _bind_random(cls, random):
+        """
+        Returns a subclass of this provider whose methods (including the
+        classmethods) use the given random number generator.
+        """
+        if random is cls.random:
+            return cls
+        # a provider bound to another generator is rebound from its own class
+        cls = cls.__dict__.get('_unbound_class', cls)
+        if random is cls.random:
+            return cls
+        return type(cls.__name__, (cls,), {
+            'random': random,
+            '_bound_classes': {},
+            '_unbound_class': cls,
+            '__module__': cls.__module__,
+            '__doc__': cls.__doc__,
+        })
+
+    @classmethod
+    def _bound(cls, provider_class):
+        """
+        Returns provider_class bound to the same random number generator as
+        this provider, to call another provider's classmethods with.
+        """
+        if provider_class.random is cls.random:
+            return provider_class
+        bound_classes = cls.__dict__['_bound_classes']
+        if provider_class not in bound_classes:
+            bound_classes[provider_class] = provider_class._bind_random(cls.random)
+        return bound_classes[provider_class]
+
     @classmethod
     def random_int(cls, min=0, max=9999):
         """
@@ -33,13 +92,21 @@ class BaseProvider(object):
         :param max: upper bound value (inclusive; default=9999)
         :returns: random integer between min and max
         """
-        return random.randint(min, max)
+        return cls.random.randint(min, max)
+
+    @classmethod
+    def random_int_batch(cls, min=0, max=9999, n=2):
+        """
+        Returns a list of n random integers between two values (inclusive).
+        """
+        randint = cls.random.randint
+        return [randint(min, max) for _ in range(n)]
 
     @classmethod
     def random_int_unique(cls, min=0, max=9999, n=2):
         """
         Generate n unique random integers uniformly distributed
-        in the specified range.
+        in the specified range (inclusive).
         """
 
         if (max - min + 1) < n:
@@ -47,33 +114,73 @@ class BaseProvider(object):
                             n, min, max))
 
         if n < 2:
-            return cls.random_int(min=min, max=max, variance=variance, mean=mean)
+            return cls.random_int(min=min, max=max)
+
+        return stats.sample_range(min, max, n, random=cls.random)
+
+    @classmethod
+    def random_int_unique_stream(cls, min=0, max=9999):
+        """
+        Returns an iterator over unique random integers in the specified
+        range (inclusive), generated lazily.
+        """
+        return stats.unique_sampling(min, max, random=cls.random)
 
-        return stats.reservoir_sampling(iter(range(min, max)), n)
+    @classmethod
+    def random_int_sequence(cls, min=0, max=9999, key=None):
+        """
+        Returns a UniqueSequence over the integers in the specified range
+        (inclusive). Sequences created with the same key yield the same
+        values in the same order; by default the key is drawn at random.
+        """
+        return UniqueSequence(max - min + 1, key=key, transform=lambda i: i + min, random=cls.random)
 
     @classmethod
     def random_normal(cls, min=0, max=9999, mean=0, variance=1, n=1):
         """
         Draw an random number from a truncated normal distribution.
         """
-        return stats.RandomNormalVar(min, max, mean, variance).get(n)
+        return stats.RandomNormalVar(mean, variance, min, max, random=cls.random).get(n)
+
+    @classmethod
+    def random_normal_batch(cls, min=0, max=9999, mean=0, variance=1, n=2):
+        """
+        Draw a list of n random numbers from a truncated normal distribution.
+        """
+        return stats.RandomNormalVar(mean, variance, min, max, random=cls.random).get_list(n)
 
     @classmethod
     def random_normal_int(cls, min=0, max=9999, mean=0, variance=1, n=1):
         """
         Draw an integer from a truncated normal distribution.
         """
-        return stats.RandomNormalVar(min, max, mean, variance).get_int(n)
+        return stats.RandomNormalVar(mean, variance, min, max, random=cls.random).get_int(n)
+
+    @classmethod
+    def random_normal_int_batch(cls, min=0, max=9999, mean=0, variance=1, n=2):
+        """
+        Draw a list of n integers from a truncated normal distribution.
+        """
+        return stats.RandomNormalVar(mean, variance, min, max, random=cls.random).get_int_list(n)
 
     @classmethod
     def random_digits(cls, digits=1):
         """
         Return a random string of digits of specified length.
         """
-        res = str(random.randint(0, pow(10, digits) - 1))
+        res = str(cls.random.randint(0, pow(10, digits) - 1))
         n_zeros = digits - len(res)
         return '0' * n_zeros + res
 
+    @classmethod
+    def random_digits_batch(cls, digits=1, n=2):
+        """
+        Return a list of n random strings of digits of specified length.
+        """
+        randint = cls.random.randint
+        fmt = '{0:0' + str(digits) + 'd}'
+        return [fmt.format(randint(0, pow(10, digits) - 1)) for _ in range(n)]
+
     @classmethod
     def random_digits_unique(cls, digits=1, n=2):
         """
@@ -83,14 +190,27 @@ class BaseProvider(object):
         if n < 2:
             return cls.random_digits(digits)
 
-        res = cls.random_int_unique(min=0, max = pow(10, digits) - 1, n=n)
+        fmt = '{0:0' + str(digits) + 'd}'
+        return [fmt.format(i) for i in cls.random_int_unique(min=0, max=pow(10, digits) - 1, n=n)]
 
-        # if the number has fewer digits than needed, add leading zeros
-        for i in range(n):
-            res[i] = str(res[i])
-            n_zeros = digits - len(res[i])
-            res[i] = '0' * n_zeros + res[i]
-        return res
+    @classmethod
+    def random_digits_unique_stream(cls, digits=1):
+        """
+        Returns an iterator over unique random strings of digits of specified
+        length, generated lazily.
+        """
+        fmt = '{0:0' + str(digits) + 'd}'
+        return (fmt.format(i) for i in cls.random_int_unique_stream(min=0, max=pow(10, digits) - 1))
+
+    @classmethod
+    def random_digits_sequence(cls, digits=1, key=None):
+        """
+        Returns a UniqueSequence over the strings of digits of specified
+        length. Sequences created with the same key yield the same values in
+        the same order; by default the key is drawn at random.
+        """
+        fmt = '{0:0' + str(digits) + 'd}'
+        return UniqueSequence(pow(10, digits), key=key, transform=fmt.format, random=cls.random)
 
     @classmethod
     def random_digit(cls):
@@ -98,7 +218,7 @@ class BaseProvider(object):
         Returns a random digit/number
         between 0 and 9.
         """
-        return random.randint(0, 9)
+        return cls.random.randint(0, 9)
 
     @classmethod
     def random_digit_not_null(cls):
@@ -106,7 +226,7 @@ class BaseProvider(object):
         Returns a random non-zero digit/number
         between 1 and 9.
         """
-        return random.randint(1, 9)
+        return cls.random.randint(1, 9)
 
     @classmethod
     def random_digit_or_empty(cls):
@@ -114,8 +234,8 @@ class BaseProvider(object):
         Returns a random digit/number
         between 0 and 9 or an empty string.
         """
-        if random.randint(0, 1):
-            return random.randint(0, 9)
+        if cls.random.randint(0, 1):
+            return cls.random.randint(0, 9)
         else:
             return ''
 
@@ -125,8 +245,8 @@ class BaseProvider(object):
         Returns a random non-zero digit/number
         between 1 and 9 or and empty string.
         """
-        if random.randint(0, 1):
-            return random.randint(1, 9)
+        if cls.random.randint(0, 1):
+            return cls.random.randint(1, 9)
         else:
             return ''
 
@@ -140,13 +260,13 @@ class BaseProvider(object):
         :returns: random number with 0 to given number of digits
         """
         if digits is None:
-            digits = BaseProvider.random_digit()
-        return random.randint(0, pow(10, digits) - 1)
+            digits = cls.random_digit()
+        return cls.random.randint(0, pow(10, digits) - 1)
 
     @classmethod
     def random_letter(cls):
         """Returns a random letter (between a-z and A-Z)."""
-        return random.choice(getattr(string, 'letters', string.ascii_letters))
+        return cls.random.choice(getattr(string, 'letters', string.ascii_letters))
 
     @classmethod
     def random_element(cls, elements=('a', 'b', 'b')):
@@ -164,14 +284,54 @@ class BaseProvider(object):
             * `variable_3`: 20% probability
             * `variable_4`: 10% probability
 
+        The table of a dictionary is looked up by its items on every call;
+        to draw repeatedly from a large one, build a WeightedChoice of it
+        once (see faker.utils.distribution) and pass that instead.
         """
 
+        if isinstance(elements, WeightedChoice):
+            return elements.choice(cls.random)
         if isinstance(elements, dict):
-            choices = elements.keys()
-            probabilities = elements.values()
-            return choice_distribution(list(choices), list(probabilities))
-        else:
-            return random.choice(list(elements))
+            return cached_choice(elements).choice(cls.random)
+        if not hasattr(elements, '__getitem__'):
+            # e.g. sets; sequences are indexed without being copied
+            elements = list(elements)
+        return cls.random.choice(elements)
+
+    @classmethod
+    def random_element_batch(cls, elements=('a', 'b', 'b'), n=2):
+        """
+        Returns a list of n random elements from a passed object, weighted
+        like in random_element if `elements` is a dictionary or a
+        WeightedChoice.
+        """
+        if isinstance(elements, WeightedChoice):
+            return elements.choices(n, cls.random)
+        if isinstance(elements, dict):
+            return cached_choice(elements).choices(n, cls.random)
+        if not hasattr(elements, '__getitem__'):
+            elements = list(elements)
+        choice = cls.random.choice
+        return [choice(elements) for _ in range(n)]
+
+    @classmethod
+    def _format_batch(cls, formats, n, fill):
+        """
+        Batch version of fill(random_element(formats)): picks a format for
+        each of the n values, then fills in all the values that got the same
+        format at once, with fill(format, count).
+        """
+        res = [None] * n
+        for pattern, rows in group_rows(cls.random_element_batch(formats, n)).items():
+            for i, value in zip(rows, fill(pattern, len(rows))):
+                res[i] = value
+        return res
+
+    def _parse_batch(self, formats, n):
+        """
+        Batch version of generator.parse(random_element(formats)).
+        """
+        return self._format_batch(formats, n, self.generator.parse_batch)
 
     @classmethod
     def randomize_nb_elements(cls, number=10, le=False, ge=False):
@@ -187,7 +347,7 @@ class BaseProvider(object):
             return number
         _min = 100 if ge else 60
         _max = 100 if le else 140
-        return int(number * random.randint(_min, _max) / 100) + 1
+        return int(number * cls.random.randint(_min, _max) / 100) + 1
 
     @classmethod
     def numerify(cls, text='###'):
@@ -204,19 +364,27 @@ class BaseProvider(object):
         :returns: string with all numerical placeholders filled in
         """
         text = _re_hash.sub(
-            lambda x: str(BaseProvider.random_digit()),
+            lambda x: str(cls.random_digit()),
             text)
         text = _re_perc.sub(
-            lambda x: str(BaseProvider.random_digit_not_null()),
+            lambda x: str(cls.random_digit_not_null()),
             text)
         text = _re_excl.sub(
-            lambda x: str(BaseProvider.random_digit_or_empty()),
+            lambda x: str(cls.random_digit_or_empty()),
             text)
         text = _re_at.sub(
-            lambda x: str(BaseProvider.random_digit_not_null_or_empty()),
+            lambda x: str(cls.random_digit_not_null_or_empty()),
             text)
         return text
 
+    @classmethod
+    def numerify_batch(cls, text='###', n=2):
+        """
+        Returns a list of n strings, each with all numerical placeholders in
+        the given text filled in as in numerify.
+        """
+        return cls._fill_placeholders_batch(_re_numerify.split(text), n)
+
     @classmethod
     def lexify(cls, text='????'):
         """
@@ -225,7 +393,15 @@ class BaseProvider(object):
         :param text: string to be parsed
         :returns: string with all letter placeholders filled in
         """
-        return _re_qm.sub(lambda x: BaseProvider.random_letter(), text)
+        return _re_qm.sub(lambda x: cls.random_letter(), text)
+
+    @classmethod
+    def lexify_batch(cls, text='????', n=2):
+        """
+        Returns a list of n strings, each with all letter placeholders in the
+        given text filled in as in lexify.
+        """
+        return cls._fill_placeholders_batch(_re_lexify.split(text), n)
 
     @classmethod
     def bothify(cls, text='## ??'):
@@ -235,4 +411,38 @@ class BaseProvider(object):
         :param text: string to be parsed
         :returns: string with all numerical and letter placeholders filled in
         """
-        return BaseProvider.lexify(BaseProvider.numerify(text))
+        return cls.lexify(cls.numerify(text))
+
+    @classmethod
+    def bothify_batch(cls, text='## ??', n=2):
+        """
+        Returns a list of n strings, each with all numerical and letter
+        placeholders in the given text filled in as in bothify.
+        """
+        return cls._fill_placeholders_batch(_re_bothify.split(text), n)
+
+    @classmethod
+    def _fill_placeholders_batch(cls, parts, n):
+        """
+        Fills in n copies of a text, split into [literal, placeholder,
+        literal, ...], by generating a column of values per placeholder.
+        """
+        if len(parts) == 1:
+            return [parts[0]] * n
+
+        rnd = cls.random.random
+        letters = getattr(string, 'letters', string.ascii_letters)
+        columns = []
+        for placeholder in parts[1::2]:
+            if placeholder == '#':
+                column = [string.digits[int(rnd() * 10)] for _ in range(n)]
+            elif placeholder == '%':
+                column = [string.digits[1 + int(rnd() * 9)] for _ in range(n)]
+            elif placeholder == '!':
+                column = ['' if rnd() < 0.5 else string.digits[int(rnd() * 10)] for _ in range(n)]
+            elif placeholder == '@':
+                column = ['' if rnd() < 0.5 else string.digits[1 + int(rnd() * 9)] for _ in range(n)]
+            else:
+                column = [letters[int(rnd() * len(letters))] for _ in range(n)]
+            columns.append(column)
+        return join_columns(parts[::2], columns)
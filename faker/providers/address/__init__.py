@@ -4,7 +4,6 @@ from decimal import Decimal
 
 from .. import BaseProvider
 from .. import date_time
-from faker.generator import random
 
 localized = True
 
@@ -42,6 +41,10 @@ class Provider(BaseProvider):
         """
         return cls.numerify(cls.random_element(cls.building_number_formats))
 
+    @classmethod
+    def building_number_batch(cls, n=2):
+        return cls._format_batch(cls.building_number_formats, n, cls.numerify_batch)
+
     def city(self):
         """
         :example 'Sashabury'
@@ -49,6 +52,9 @@ class Provider(BaseProvider):
         pattern = self.random_element(self.city_formats)
         return self.generator.parse(pattern)
 
+    def city_batch(self, n=2):
+        return self._parse_batch(self.city_formats, n)
+
     def street_name(self):
         """
         :example 'Crist Parks'
@@ -56,6 +62,9 @@ class Provider(BaseProvider):
         pattern = self.random_element(self.street_name_formats)
         return self.generator.parse(pattern)
 
+    def street_name_batch(self, n=2):
+        return self._parse_batch(self.street_name_formats, n)
+
     def street_address(self):
         """
         :example '791 Crist Parks'
@@ -63,6 +72,9 @@ class Provider(BaseProvider):
         pattern = self.random_element(self.street_address_formats)
         return self.generator.parse(pattern)
 
+    def street_address_batch(self, n=2):
+        return self._parse_batch(self.street_address_formats, n)
+
     @classmethod
     def postcode(cls):
         """
@@ -70,6 +82,10 @@ class Provider(BaseProvider):
         """
         return cls.bothify(cls.random_element(cls.postcode_formats)).upper()
 
+    @classmethod
+    def postcode_batch(cls, n=2):
+        return [postcode.upper() for postcode in cls._format_batch(cls.postcode_formats, n, cls.bothify_batch)]
+
     def address(self):
         """
         :example '791 Crist Parks, Sashabury, IL 86039-9874'
@@ -77,6 +93,9 @@ class Provider(BaseProvider):
         pattern = self.random_element(self.address_formats)
         return self.generator.parse(pattern)
 
+    def address_batch(self, n=2):
+        return self._parse_batch(self.address_formats, n)
+
     @classmethod
     def country(cls):
         return cls.random_element(cls.countries)
@@ -91,11 +110,11 @@ class Provider(BaseProvider):
         Optionally center the coord and pick a point within radius.
         """
         if center is None:
-            return Decimal(str(random.randint(-180000000, 180000000) / 1000000.0)).quantize(Decimal('.000001'))
+            return Decimal(str(cls.random.randint(-180000000, 180000000) / 1000000.0)).quantize(Decimal('.000001'))
         else:
             center = float(center)
             radius = float(radius)
-            geo = random.uniform(center - radius, center + radius)
+            geo = cls.random.uniform(center - radius, center + radius)
             return Decimal(str(geo)).quantize(Decimal('.000001'))
 
     @classmethod
@@ -1,9 +1,9 @@
 from __future__ import unicode_literals
 import csv
 from collections import defaultdict
+import os
 
 from ..en import Provider as AddressProvider
-from faker.generator import random
 
 
 class Provider(AddressProvider):
@@ -71,7 +71,7 @@ class Provider(AddressProvider):
 
     state_abbr_to_zipcodes = defaultdict(list)
     zip_to_state_abbr = {}
-    with open('faker/providers/address/en_US/zip_state.csv', mode='r') as f:
+    with open(os.path.join(os.path.dirname(__file__), 'zip_state.csv'), mode='r') as f:
         reader = csv.reader(f)
 
         for row in reader:
@@ -125,6 +125,10 @@ class Provider(AddressProvider):
     def secondary_address(cls):
         return cls.numerify(cls.random_element(cls.secondary_address_formats))
 
+    @classmethod
+    def secondary_address_batch(cls, n=2):
+        return cls._format_batch(cls.secondary_address_formats, n, cls.numerify_batch)
+
     @classmethod
     def state(cls):
         return cls.random_element(cls.states)
@@ -143,23 +147,41 @@ class Provider(AddressProvider):
     def zipcode(cls, state=None, n=1):
         if not state:
             if n == 1:
-                return "%05d" % random.randint(501, 99950)
-            ["%05d" % random.randint(501, 99950) for _ in range(n)]
+                return "%05d" % cls.random.randint(501, 99950)
+            ["%05d" % cls.random.randint(501, 99950) for _ in range(n)]
         else:
             if n == 1:
                 # the zip code table only contains the first 3 digits of the code,
                 # so we'll make up the remaining two
-                try:
-                    return random.choice(cls.state_abbr_to_zipcodes[state]) + cls.random_digits(2)
-                except:
+                # state_abbr_to_zipcodes is a defaultdict: looking up a
+                # missing state would add it
+                if state not in cls.state_abbr_to_zipcodes:
                     raise Exception('Invalid state "{0}"'.format(state))
+                return cls.random.choice(cls.state_abbr_to_zipcodes[state]) + cls.random_digits(2)
 
             # if n>1, state will contain an array of states
-            return [random.choice(cls.state_abbr_to_zipcodes[s]) + cls.random_digits(2) for s in state]
+            for s in state:
+                if s not in cls.state_abbr_to_zipcodes:
+                    raise Exception('Invalid state "{0}"'.format(s))
+            return [cls.random.choice(cls.state_abbr_to_zipcodes[s]) + cls.random_digits(2) for s in state]
+
+    @classmethod
+    def zipcode_batch(cls, state=None, n=2):
+        if not state:
+            randint = cls.random.randint
+            return ["%05d" % randint(501, 99950) for _ in range(n)]
+
+        # state_abbr_to_zipcodes is a defaultdict: looking up a missing
+        # state would add it
+        if state not in cls.state_abbr_to_zipcodes:
+            raise Exception('Invalid state "{0}"'.format(state))
+        zipcodes = cls.state_abbr_to_zipcodes[state]
+        return [prefix + suffix for prefix, suffix in zip(cls.random_element_batch(zipcodes, n),
+                                                          cls.random_digits_batch(2, n))]
 
     @classmethod
     def zipcode_plus4(cls, state=None):
-        return "%s-%04d" % (cls.zipcode(state), random.randint(1, 9999))
+        return "%s-%04d" % (cls.zipcode(state), cls.random.randint(1, 9999))
 
     @classmethod
     def military_ship(cls):
@@ -2,7 +2,6 @@
 from __future__ import unicode_literals
 
 from .. import Provider as AddressProvider
-from faker.generator import random
 
 
 class Provider(AddressProvider):
@@ -113,21 +112,21 @@ class Provider(AddressProvider):
         """
         :example '1丁目'
         """
-        return "%d丁目" % random.randint(1,42)
+        return "%d丁目" % cls.random.randint(1,42)
 
     @classmethod
     def ban(cls):
         """
         :example '3番'
         """
-        return "%d番" % random.randint(1,27)
+        return "%d番" % cls.random.randint(1,27)
 
     @classmethod
     def gou(cls):
         """
         :example '10号'
         """
-        return "%d号" % random.randint(1,20)
+        return "%d号" % cls.random.randint(1,20)
 
     @classmethod
     def building_name(cls):
@@ -141,4 +140,4 @@ class Provider(AddressProvider):
         """
         :example '101-1212'
         """
-        return "%03d-%04d" % (random.randint(0,999), random.randint(0,9999))
+        return "%03d-%04d" % (cls.random.randint(0,999), cls.random.randint(0,9999))
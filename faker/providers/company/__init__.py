@@ -19,6 +19,9 @@ class Provider(BaseProvider):
         pattern = self.random_element(self.formats)
         return self.generator.parse(pattern)
 
+    def company_batch(self, n=2):
+        return self._parse_batch(self.formats, n)
+
     @classmethod
     def company_suffix(cls):
         """
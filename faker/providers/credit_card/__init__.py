@@ -63,7 +63,7 @@ class Provider(BaseProvider):
 
     @classmethod
     def credit_card_expire(cls, start='now', end='+10y', date_format='%m/%y'):
-        expire_date = DateTimeProvider.date_time_between(start, end)
+        expire_date = cls._bound(DateTimeProvider).date_time_between(start, end)
         return expire_date.strftime(date_format)
 
     def credit_card_full(self, card_type=None):
@@ -9,7 +9,6 @@ from time import time, mktime
 from dateutil import relativedelta
 from dateutil.tz import tzlocal
 
-from faker.generator import random
 from faker.utils.datetime_safe import date, datetime, real_date, real_datetime
 from faker.utils import is_string
 
@@ -235,14 +234,21 @@ class Provider(BaseProvider):
         Get a timestamp between January 1, 1970 and now
         :example 1061306726
         """
-        return random.randint(0, int(time()))
+        return cls.random.randint(0, int(time()))
+
+    @classmethod
+    def unix_time_batch(cls, n=2):
+        """
+        Get a list of n timestamps between January 1, 1970 and now
+        """
+        return cls.random_int_batch(0, int(time()), n)
 
     @classmethod
     def time_delta(cls):
         """
         Get a timedelta object
         """
-        ts = random.randint(0, int(time()))
+        ts = cls.random.randint(0, int(time()))
         return timedelta(seconds=ts)
 
     @classmethod
@@ -255,6 +261,14 @@ class Provider(BaseProvider):
         """
         return datetime.fromtimestamp(cls.unix_time(), tzinfo)
 
+    @classmethod
+    def date_time_batch(cls, tzinfo=None, n=2):
+        """
+        Get a list of n datetime objects for dates between January 1, 1970 and now
+        :param tzinfo: timezone, instance of datetime.tzinfo subclass
+        """
+        return [datetime.fromtimestamp(ts, tzinfo) for ts in cls.unix_time_batch(n)]
+
     @classmethod
     def date_time_ad(cls, tzinfo=None):
         """
@@ -263,7 +277,7 @@ class Provider(BaseProvider):
         :example DateTime('1265-03-22 21:15:52')
         :return datetime
         """
-        ts = random.randint(-62135600400, int(time()))
+        ts = cls.random.randint(-62135600400, int(time()))
         # NOTE: using datetime.fromtimestamp(ts) directly will raise
         #       a "ValueError: timestamp out of range for platform time_t"
         #       on some platforms due to system C functions;
@@ -278,6 +292,10 @@ class Provider(BaseProvider):
         """
         return cls.date_time(tzinfo).isoformat()
 
+    @classmethod
+    def iso8601_batch(cls, tzinfo=None, n=2):
+        return [dt.isoformat() for dt in cls.date_time_batch(tzinfo, n)]
+
     @classmethod
     def date(cls, pattern='%Y-%m-%d'):
         """
@@ -287,6 +305,14 @@ class Provider(BaseProvider):
         """
         return cls.date_time().strftime(pattern)
 
+    @classmethod
+    def date_batch(cls, pattern='%Y-%m-%d', n=2):
+        """
+        Get a list of n date strings between January 1, 1970 and now
+        :param pattern format
+        """
+        return [dt.strftime(pattern) for dt in cls.date_time_batch(n=n)]
+
     @classmethod
     def time(cls, pattern='%H:%M:%S'):
         """
@@ -339,9 +365,19 @@ class Provider(BaseProvider):
         """
         start_date = cls._parse_date_time(start_date)
         end_date = cls._parse_date_time(end_date)
-        timestamp = random.randint(start_date, end_date)
+        timestamp = cls.random.randint(start_date, end_date)
         return datetime.fromtimestamp(timestamp, tzinfo)
 
+    @classmethod
+    def date_time_between_batch(cls, start_date='-30y', end_date='now', tzinfo=None, n=2):
+        """
+        Get a list of n DateTime objects between two given dates, which are
+        only parsed once for the whole list.
+        """
+        start_date = cls._parse_date_time(start_date)
+        end_date = cls._parse_date_time(end_date)
+        return [datetime.fromtimestamp(ts, tzinfo) for ts in cls.random_int_batch(start_date, end_date, n)]
+
     @classmethod
     def date_time_between_dates(cls, datetime_start=None, datetime_end=None, tzinfo=None):
         """
@@ -360,7 +396,7 @@ class Provider(BaseProvider):
         if datetime_end is None:
             datetime_end = datetime.now(tzinfo)
 
-        timestamp = random.randint(
+        timestamp = cls.random.randint(
             datetime_to_timestamp(datetime_start),
             datetime_to_timestamp(datetime_end),
         )
@@ -495,4 +531,4 @@ class Provider(BaseProvider):
 
     @classmethod
     def timezone(cls):
-        return random.choice(cls.random_element(cls.countries)['timezones'])
+        return cls.random.choice(cls.random_element(cls.countries)['timezones'])
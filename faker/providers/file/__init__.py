@@ -190,7 +190,7 @@ class Provider(BaseProvider):
         :param extension: file extension
         """
         extension = extension if extension else cls.file_extension(category)
-        filename = WordProvider.word()
+        filename = cls._bound(WordProvider).word()
         return '{0}.{1}'.format(filename, extension)
 
     @classmethod
@@ -3,8 +3,8 @@
 from __future__ import unicode_literals
 from .. import BaseProvider
 
-from faker.generator import random
 from faker.providers.lorem.la import Provider as Lorem
+from faker.utils import text
 from faker.utils.decorators import slugify, slugify_unicode
 
 localized = True
@@ -61,6 +61,9 @@ class Provider(BaseProvider):
         pattern = self.random_element(self.email_formats)
         return "".join(self.generator.parse(pattern).split(" "))
 
+    def email_batch(self, n=2):
+        return ["".join(email.split(" ")) for email in self._parse_batch(self.email_formats, n)]
+
     def safe_email(self):
         return self.user_name() + '@example.' + self.random_element(self.safe_email_tlds)
 
@@ -74,6 +77,10 @@ class Provider(BaseProvider):
     def free_email_domain(cls):
         return cls.random_element(cls.free_email_domains)
 
+    @classmethod
+    def free_email_domain_batch(cls, n=2):
+        return cls.random_element_batch(cls.free_email_domains, n)
+
     @slugify_unicode
     def user_name(self):
         pattern = self.random_element(self.user_name_formats)
@@ -82,9 +89,17 @@ class Provider(BaseProvider):
         ).lower())
         return username
 
+    def user_name_batch(self, n=2):
+        return [text.slugify(self._to_ascii(self.bothify(user_name).lower()), allow_unicode=True)
+                for user_name in self._parse_batch(self.user_name_formats, n)]
+
     def domain_name(self):
         return self.domain_word() + '.' + self.tld()
 
+    def domain_name_batch(self, n=2):
+        return [domain_word + '.' + tld
+                for domain_word, tld in zip(self.generator.batch('domain_word', n), self.generator.batch('tld', n))]
+
     @slugify_unicode
     def domain_word(self,):
         company = self.generator.format('company')
@@ -92,9 +107,16 @@ class Provider(BaseProvider):
         company = self._to_ascii(company_elements.pop(0))
         return company.lower()
 
+    def domain_word_batch(self, n=2):
+        return [text.slugify(self._to_ascii(company.split(' ')[0]).lower(), allow_unicode=True)
+                for company in self.generator.batch('company', n)]
+
     def tld(self):
         return self.random_element(self.tlds)
 
+    def tld_batch(self, n=2):
+        return self.random_element_batch(self.tlds, n)
+
     def url(self):
         pattern = self.random_element(self.url_formats)
         return self.generator.parse(pattern)
@@ -103,14 +125,14 @@ class Provider(BaseProvider):
         """
         Convert 32-bit integer to dotted IPv4 address.
         """
-        return ".".join(map(lambda n: str(random.randint(-2147483648, 2147483647) >> n & 0xFF), [24, 16, 8, 0]))
+        return ".".join(map(lambda n: str(self.random.randint(-2147483648, 2147483647) >> n & 0xFF), [24, 16, 8, 0]))
 
     def ipv6(self):
-        res = [hex(random.randint(0, 65535))[2:].zfill(4) for i in range(0, 8)]
+        res = [hex(self.random.randint(0, 65535))[2:].zfill(4) for i in range(0, 8)]
         return ":".join(res)
 
     def mac_address(self):
-        mac = [random.randint(0x00, 0xff) for i in range(0, 6)]
+        mac = [self.random.randint(0x00, 0xff) for i in range(0, 6)]
         return ":".join(map(lambda x: "%02x" % x, mac))
 
     @classmethod
@@ -119,7 +141,7 @@ class Provider(BaseProvider):
 
     @classmethod
     def uri_path(cls, deep=None):
-        deep = deep if deep else random.randint(1, 3)
+        deep = deep if deep else cls.random.randint(1, 3)
         return "/".join([cls.random_element(cls.uri_paths) for _ in range(0, deep)])
 
     @classmethod
@@ -137,7 +159,7 @@ class Provider(BaseProvider):
         Django algorithm
         """
         if value is None:
-            value = Lorem.text(20)
+            value = cls._bound(Lorem).text(20)
         return value
 
     @classmethod
@@ -2,8 +2,8 @@
 
 from __future__ import unicode_literals
 
-from faker.generator import random
 import faker.utils.stats as stats
+from faker.utils.unique import UniqueSequence
 
 from .. import BaseProvider
 
@@ -13,7 +13,7 @@ MRN_DIGITS = 7
 class Provider(BaseProvider):
     @classmethod
     def mrn(cls, prefix=''):
-        res = str(random.randint(0, pow(10, MRN_DIGITS) - 1))
+        res = str(cls.random.randint(0, pow(10, MRN_DIGITS) - 1))
 
         # if the number has fewer digits than needed, add leading zeros
         zeros = MRN_DIGITS - len(res)
@@ -21,36 +21,21 @@ class Provider(BaseProvider):
 
     @classmethod
     def mrn_unique(cls, n=2, prefix=''):
-        return [(prefix + s) for s in BaseProvider.random_digits_unique(digits=MRN_DIGITS, n=n)]
+        return [(prefix + s) for s in cls.random_digits_unique(digits=MRN_DIGITS, n=n)]
+
+    @classmethod
+    def mrn_unique_stream(cls, prefix=''):
+        return (prefix + s for s in cls.random_digits_unique_stream(digits=MRN_DIGITS))
+
+    @classmethod
+    def mrn_sequence(cls, prefix='', key=None):
+        fmt = prefix + '{0:0' + str(MRN_DIGITS) + 'd}'
+        return UniqueSequence(pow(10, MRN_DIGITS), key=key, transform=fmt.format, random=cls.random)
 
     def icd9(self, current_age=0,  age=0, gender=None):
         return self.generator.random_digits(3) + '.' + str(self.generator.random_int(min=0, max=200))
 
     def icd9_unique(self, current_age=0, gender=None, n=2):
-        class icd9_iterator():
-            def __init__(self):
-                self.i = 0
-                self.j = 0
-                self.n1 = 1000
-                self.n2 = 200
-
-            def __iter__(self):
-                return self
-
-            def __next__(self):
-                if self.i < self.n1:
-                    if self.j < self.n2:
-                        res = str(self.i).zfill(3) + '.' + str(self.j)
-                        self.j += 1
-                        return res
-                    else:
-                        self.j = 0
-                        self.i += 1
-                        if self.i == self.n1:
-                            raise StopIteration()
-
-                        return str(self.i).zfill(3) + '.' + str(self.j)
-                else:
-                    raise StopIteration()
-
-        return stats.reservoir_sampling(icd9_iterator(), n)
+        n1, n2 = 1000, 200
+        return ['{0:03d}.{1}'.format(k // n2, k % n2)
+                for k in stats.sample_range(0, n1 * n2 - 1, n, random=self.random)]
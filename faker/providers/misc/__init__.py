@@ -5,7 +5,6 @@ import hashlib
 import string
 import uuid
 
-from faker.generator import random
 from faker.providers.date_time import Provider as DatetimeProvider
 
 from .. import BaseProvider
@@ -16,7 +15,7 @@ class Provider(BaseProvider):
 
     @classmethod
     def boolean(cls, chance_of_getting_true=50):
-        return random.randint(1, 100) <= chance_of_getting_true
+        return cls.random.randint(1, 100) <= chance_of_getting_true
 
     @classmethod
     def null_boolean(cls):
@@ -24,7 +23,7 @@ class Provider(BaseProvider):
             0: None,
             1: True,
             -1: False
-        }[random.randint(-1, 1)]
+        }[cls.random.randint(-1, 1)]
 
     @classmethod
     def md5(cls, raw_output=False):
@@ -32,7 +31,7 @@ class Provider(BaseProvider):
         Calculates the md5 hash of a given string
         :example 'cfcd208495d565ef66e7dff9f98764da'
         """
-        res = hashlib.md5(str(random.random()).encode('utf-8'))
+        res = hashlib.md5(str(cls.random.random()).encode('utf-8'))
         if raw_output:
             return res.digest()
         return res.hexdigest()
@@ -43,7 +42,7 @@ class Provider(BaseProvider):
         Calculates the sha1 hash of a given string
         :example 'b5d86317c2a144cd04d0d7c03b2b02666fafadf2'
         """
-        res = hashlib.sha1(str(random.random()).encode('utf-8'))
+        res = hashlib.sha1(str(cls.random.random()).encode('utf-8'))
         if raw_output:
             return res.digest()
         return res.hexdigest()
@@ -54,7 +53,7 @@ class Provider(BaseProvider):
         Calculates the sha256 hash of a given string
         :example '85086017559ccc40638fcde2fecaf295e0de7ca51b7517b6aebeaaf75b4d4654'
         """
-        res = hashlib.sha256(str(random.random()).encode('utf-8'))
+        res = hashlib.sha256(str(cls.random.random()).encode('utf-8'))
         if raw_output:
             return res.digest()
         return res.hexdigest()
@@ -91,27 +90,27 @@ class Provider(BaseProvider):
         choices = ""
         required_tokens = []
         if special_chars:
-            required_tokens.append(random.choice("!@#$%^&*()_+"))
+            required_tokens.append(cls.random.choice("!@#$%^&*()_+"))
             choices += "!@#$%^&*()_+"
         if digits:
-            required_tokens.append(random.choice(string.digits))
+            required_tokens.append(cls.random.choice(string.digits))
             choices += string.digits
         if upper_case:
-            required_tokens.append(random.choice(string.ascii_uppercase))
+            required_tokens.append(cls.random.choice(string.ascii_uppercase))
             choices += string.ascii_uppercase
         if lower_case:
-            required_tokens.append(random.choice(string.ascii_lowercase))
+            required_tokens.append(cls.random.choice(string.ascii_lowercase))
             choices += string.ascii_lowercase
 
         assert len(required_tokens) <= length, "Required length is shorter than required characters"
 
         # Generate a first version of the password
-        chars = [random.choice(choices) for x in range(length)]
+        chars = [cls.random.choice(choices) for x in range(length)]
 
         # Pick some unique locations
         random_indexes = set()
         while len(random_indexes) < len(required_tokens):
-            random_indexes.add(random.randint(0, len(chars) - 1))
+            random_indexes.add(cls.random.randint(0, len(chars) - 1))
 
         # Replace them with the required characters
         for i, index in enumerate(random_indexes):
@@ -5,7 +5,6 @@ from datetime import timedelta
 
 from .. import BaseProvider
 from faker.utils.datetime_safe import date, datetime
-from faker.generator import random
 
 
 localized = True
@@ -25,6 +24,9 @@ class Provider(BaseProvider):
         pattern = self.random_element(self.formats)
         return self.generator.parse(pattern)
 
+    def name_batch(self, n=2):
+        return self._parse_batch(self.formats, n)
+
     def first_name(self, gender=None):
         if gender:
             if gender == "F":
@@ -34,10 +36,23 @@ class Provider(BaseProvider):
 
         return self.random_element(self.first_names)
 
+    def first_name_batch(self, gender=None, n=2):
+        if gender:
+            if gender == "F":
+                return self.generator.batch('first_name_female', n)
+            else:
+                return self.generator.batch('first_name_male', n)
+
+        return self.random_element_batch(self.first_names, n)
+
     @classmethod
     def last_name(cls):
         return cls.random_element(cls.last_names)
 
+    @classmethod
+    def last_name_batch(cls, n=2):
+        return cls.random_element_batch(cls.last_names, n)
+
     @classmethod
     def gender(cls):
         return cls.random_element(["F", "M"])
@@ -174,6 +189,6 @@ class Provider(BaseProvider):
         max_delta = latest_bdate - earliest_bdate
 
         # now pick a random date within the acceptable range
-        delta = timedelta(days=random.randint(0, max_delta.days))
+        delta = timedelta(days=self.random.randint(0, max_delta.days))
 
         return (earliest_bdate + delta).strftime('%Y-%m-%d')
@@ -1,10 +1,8 @@
 # coding=utf-8
 
-import csv
-
 from ..en import Provider as PersonProvider
-from faker.utils.distribution import choice_distribution
-from faker.generator import random
+from faker.utils.distribution import WeightedChoice
+from faker.utils.packed import PackedTable
 
 
 class Provider(PersonProvider):
@@ -27,35 +25,21 @@ class Provider(PersonProvider):
     age_freq_US = [6.5, 6.6, 6.7, 6.9, 7.1, 6.8, 6.6, 6.2, 6.7, 7.0,
                    7.2, 6.6, 5.7, 4.4, 3.2, 2.4, 1.9, 1.5, 0.1]
 
-    last_names_US = []
-    last_name_freq_US = []
-
-    with open('faker/providers/person/en_US/1990_census_surnames.csv', mode='r') as f:
-        reader = csv.reader(f)
-
-        for row in reader:
-            last_names_US.append(row[0].title())
-            last_name_freq_US.append(float(row[1]))
-
-    first_names_female_US = []
-    first_names_female_freq_US = []
-
-    with open('faker/providers/person/en_US/1990_census_first_female.csv', mode='r') as f:
-        reader = csv.reader(f)
-
-        for row in reader:
-            first_names_female_US.append(row[0].title())
-            first_names_female_freq_US.append(float(row[1]))
+    age_choice_US = WeightedChoice(age_ranges_US, age_freq_US)
 
-    first_names_male_US = []
-    first_names_male_freq_US = []
+    # the 1990 census name tables, prebuilt from the CSV files next to them
+    # (see faker.utils.packed) and loaded on first use
+    last_name_choice_US = PackedTable('1990_census_surnames.bin', package=__name__)
+    last_names_US = last_name_choice_US
+    last_name_freq_US = last_name_choice_US.weights
 
-    with open('faker/providers/person/en_US/1990_census_first_male.csv', mode='r') as f:
-        reader = csv.reader(f)
+    first_name_female_choice_US = PackedTable('1990_census_first_female.bin', package=__name__)
+    first_names_female_US = first_name_female_choice_US
+    first_names_female_freq_US = first_name_female_choice_US.weights
 
-        for row in reader:
-            first_names_male_US.append(row[0].title())
-            first_names_male_freq_US.append(float(row[1]))
+    first_name_male_choice_US = PackedTable('1990_census_first_male.bin', package=__name__)
+    first_names_male_US = first_name_male_choice_US
+    first_names_male_freq_US = first_name_male_choice_US.weights
 
     @classmethod
     def age(cls, minor=False):
@@ -63,17 +47,29 @@ class Provider(PersonProvider):
             # kids' ages are pretty evenly distributed..
             return cls.random_int(0, 20)
 
-        random_range = choice_distribution(cls.age_ranges_US, cls.age_freq_US)
-        return random.randint(*random_range)
+        random_range = cls.age_choice_US.choice(cls.random)
+        return cls.random.randint(*random_range)
 
     @classmethod
     def last_name(cls):
-        return choice_distribution(cls.last_names_US, cls.last_name_freq_US)
+        return cls.last_name_choice_US.choice(cls.random)
+
+    @classmethod
+    def last_name_batch(cls, n=2):
+        return cls.last_name_choice_US.choices(n, cls.random)
 
     @classmethod
     def first_name_female(cls):
-        return choice_distribution(cls.first_names_female_US, cls.first_names_female_freq_US)
+        return cls.first_name_female_choice_US.choice(cls.random)
+
+    @classmethod
+    def first_name_female_batch(cls, n=2):
+        return cls.first_name_female_choice_US.choices(n, cls.random)
 
     @classmethod
     def first_name_male(cls):
-        return choice_distribution(cls.first_names_male_US, cls.first_names_male_freq_US)
+        return cls.first_name_male_choice_US.choice(cls.random)
+
+    @classmethod
+    def first_name_male_batch(cls, n=2):
+        return cls.first_name_male_choice_US.choices(n, cls.random)
@@ -9,3 +9,7 @@ class Provider(BaseProvider):
     @classmethod
     def phone_number(cls):
         return cls.numerify(cls.random_element(cls.formats))
+
+    @classmethod
+    def phone_number_batch(cls, n=2):
+        return cls._format_batch(cls.formats, n, cls.numerify_batch)
@@ -2,9 +2,136 @@
 
 from .. import BaseProvider
 from faker import dag
+from faker.utils import is_string, unique
+from faker.utils.datasets import group_rows
 
+import collections
+import copy
+import functools
 import itertools
-import multiprocessing
+import os
+import pickle
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+# os.rename doesn't replace an existing file on Windows
+replace = getattr(os, 'replace', os.rename)
+
+
+# a field of a compiled profile definition; path is the id split on the dots
+# of nested fields, context the (parameter, field id) pairs it depends on,
+# and scope the ids of the fields its values are unique within (none for
+# values unique across all profiles)
+ProfileField = collections.namedtuple('ProfileField', ['id', 'path', 'type', 'options', 'sparsity',
+                                                       'unique', 'multiple', 'context', 'scope'])
+
+# prefix of the parameters passing the values of a field's scope to its
+# worker, for the scope fields that are not already in its context
+SCOPE_PARAMETER = 'scope:'
+
+# the parameter passing the seed of a run to the worker of a field
+SEED_PARAMETER = 'seed:'
+
+
+class ProfilePlan(object):
+    """
+    A profile definition compiled by Provider.compile_profile: its fields,
+    validated, in the topological order of their dependencies. Plans are
+    not modified once compiled, so they can be reused for any number of
+    spec_profile and iter_profiles calls, and they can be pickled to be
+    sent to other processes.
+    """
+
+    def __init__(self, fields, children):
+        self.fields = fields
+        self.children = children
+        self._generator = None
+        self._formatters = {}
+
+    def formatters(self, generator):
+        """
+        The formatter of each field, by field id, resolved on the generator.
+        They are kept for the last generator only, and are not pickled.
+        """
+        if generator is not self._generator:
+            self._formatters = dict((field.id, generator.get_formatter(field.type)) for field in self.fields)
+            self._generator = generator
+        return self._formatters
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_generator'] = None
+        state['_formatters'] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+
+class ProfileColumns(dict):
+    """
+    Profiles as columns: a dict of lists of values, by field id (with dots
+    for nested fields), as returned by spec_profile(output='columns').
+    """
+
+    def __init__(self, plan, columns, num):
+        dict.__init__(self, columns)
+        self.plan = plan
+        self.num = num
+
+    def rows(self):
+        """A read-only sequence of the profiles, each built when accessed."""
+        return ProfileRows(self)
+
+
+class ProfileRows(object):
+    def __init__(self, columns):
+        self._plan = columns.plan
+        self._columns = [columns[field.id] for field in columns.plan.fields]
+        self._num = columns.num
+
+    def __len__(self):
+        return self._num
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._num
+        if not 0 <= i < self._num:
+            raise IndexError('Profile index out of range')
+        return Provider._reshape_nested_results(self._plan, [column[i] for column in self._columns])
+
+    def __iter__(self):
+        for i in range(self._num):
+            yield self[i]
+
+
+OUTPUTS = ('rows', 'columns')
+
+# minimum number of seconds between two checkpoints of iter_profiles
+CHECKPOINT_INTERVAL = 60
+
+# executor='auto' generates fewer values than this (rows times fields) in
+# this process, as forking would take longer than generating them
+AUTO_SERIAL_VALUES = 100000
+
+
+def _backend(field):
+    # the backend of the set of the values of a unique field
+    return field.unique if is_string(field.unique) else 'memory'
+
+
+def _seen_set(field, path=None):
+    # the set of the values of a unique field, in its backend
+    backend = _backend(field)
+    options = {'path': path} if path is not None and backend != 'memory' else {}
+    if field.scope:
+        return unique.ScopedSet(backend, **options)
+    return unique.BACKENDS[backend](**options)
 
 
 class Provider(BaseProvider):
@@ -66,108 +193,455 @@ class Provider(BaseProvider):
 
         return d
 
-    def spec_profile(self, definition, num=1):
+    def compile_profile(self, definition):
+        """
+        Validate a profile definition and return it as a ProfilePlan, which
+        can be given to spec_profile and iter_profiles instead of the
+        definition, to only validate it once. The definition is not modified.
+        """
+        fields = []
+        self._compile_fields(copy.deepcopy(definition), fields)
+        fields = dict((field.id, field) for field in fields)
+
+        children = dict((id, []) for id in fields)
+        nodes = {}
+        for field in fields.values():
+            nodes[field.id] = dag.Node(field.id)
+            for parameter, dependency in self._dependencies(field):
+                if dependency not in fields:
+                    raise ValueError('Field ' + field.id + ' depends on unknown field ' + dependency)
+                nodes[field.id].add_parent(parameter, dependency)
+                if field.id not in children[dependency]:
+                    children[dependency].append(field.id)
+        for id in nodes:
+            nodes[id].children = children[id]
+
+        # also verifies that there are no cycles in the dependency graph
+        order = dag.validate(nodes)
+
+        plan = ProfilePlan(tuple(fields[id] for id in order),
+                           dict((id, tuple(children[id])) for id in children))
+        # fail early on unknown formatters
+        plan.formatters(self.generator)
+        return plan
+
+    def spec_profile(self, definition, num=1, processes=None, output='rows', executor='auto'):
         """
         Generate a given number of profiles based on the profile definition
+        (or a ProfilePlan compiled from it)
+
+        executor sets where the fields are generated:
+        - 'serial': one after the other, in this process;
+        - 'processes': on a pool of processes (by default, one per CPU, but
+          never more than there are fields);
+        - 'threads': on a pool of threads, as many as there would be
+          processes. The fields then share the generator's random instance
+          concurrently, so the profiles can't be reproduced with a seed.
+        - 'auto' (the default): 'serial' for a single profile, a single
+          field, or fewer than AUTO_SERIAL_VALUES values in all, and
+          'processes' otherwise.
+        With processes=1, the fields are always generated in this process.
+
+        With output='columns', a ProfileColumns is returned instead of a list
+        of profiles (or a single profile, if num=1).
         """
-        generators = {}
-        events = {}
+        self._validate_run_options(output, executor)
+        plan = self._get_plan(definition)
+        results = self._run_profile(plan, num, processes, executor)
 
-        mgr = multiprocessing.Manager()
-        results = mgr.dict()
+        if output == 'columns':
+            if num == 1:
+                results = dict((key, [value]) for key, value in results.items())
+            return ProfileColumns(plan, results, num)
 
-        self._get_generators(definition, num, generators, events, results)
+        if num == 1:
+            return self._reshape_nested_results(plan, results)
 
-        for id in generators:
-            if '.' in id:
-                parts = id.split('.')
-                d = definition[parts[0]]['fields']
-                for i in range(1, len(parts) - 1):
-                    d = d[parts[i]]['fields']
-                d = d[parts[-1]]
+        return self._rows(plan, results, num)
+
+    def iter_profiles(self, definition, num=None, chunk_size=10000, processes=None, output='rows',
+                      executor='auto', checkpoint=None, resume=False, output_file=None,
+                      checkpoint_interval=CHECKPOINT_INTERVAL):
+        """
+        Generate profiles based on the profile definition (or a ProfilePlan
+        compiled from it), chunk_size rows at a time, and yield them one by
+        one; num=None generates them forever. With output='columns', a
+        ProfileColumns is yielded per chunk instead. Each chunk is generated
+        as by spec_profile with the given processes and executor; with the
+        'processes' executor, the chunks are generated by the same processes.
+
+        While the profiles of a chunk are being consumed, the next chunk is
+        generated in a background thread, so at most three chunks are in
+        memory at once. The profiles are generated on a clone of the
+        generator (see Generator.clone), seeded from it, so the generator can
+        be used while they are consumed. Unique fields are unique across all
+        the profiles; they are generated in this process, whatever the number
+        of processes, to keep track of the values across chunks.
+
+        checkpoint is the path of a file where the state of the run (the
+        random state, the number of profiles yielded, the values of the
+        unique fields and the position in output_file, the file the profiles
+        are written to, if any) is saved once a chunk has been consumed, at
+        most every checkpoint_interval seconds. It is removed once all the
+        profiles are generated. With resume=True, the run continues from the
+        checkpoint if there is one, after truncating output_file to where it
+        was (and from the start, after emptying output_file, if there is
+        none): the profiles that follow are the same as if the run had not
+        been interrupted, if it uses the same definition, chunk_size and
+        seed. The 'disk' sets of unique values are then kept next to the
+        checkpoint, in files named after it.
+        """
+        self._validate_run_options(output, executor)
+        if resume and checkpoint is None:
+            raise ValueError('A checkpoint is required to resume a run')
+        plan = self._get_plan(definition)
+        # the sets of values generated so far for the unique fields
+        seen = {}
+        generated = 0
+        # the chunks are generated in the background by a copy of this
+        # provider, on a clone of the generator with its own random instance,
+        # so that the generator can be used meanwhile
+        provider = self._clone(self.generator.clone(seed=self.generator.random.getrandbits(64)))
+        random = provider.generator.random
+
+        if checkpoint is not None:
+            state = self._load_checkpoint(checkpoint) if resume else None
+            if state is not None:
+                if state['fields'] != plan.fields or state['chunk_size'] != chunk_size:
+                    raise ValueError('Checkpoint ' + checkpoint + ' was saved by a run with another '
+                                     'definition or chunk size')
+                generated = state['rows']
+                seen = state['seen']
+                random.setstate(state['random'])
+                if output_file is not None:
+                    output_file.seek(state['offset'])
+                    output_file.truncate()
             else:
-                d = definition[id]
-            if len(d['context']):
-                context = d['context'][0]
-                for parameter in context:
-                    dependency = context[parameter]
-                    generators[id].add_parent(parameter, dependency, events[dependency])
-                    generators[dependency].add_child(id)
-
-        # verify that there are no cycles in the dependency graph
-        dag.validate(generators)
-
-        for i in generators:
-            generators[i].start()
-        for i in generators:
-            generators[i].join()
+                if output_file is not None:
+                    # nothing to resume: whatever the file holds is from a
+                    # run that was interrupted before its first checkpoint
+                    output_file.seek(0)
+                    output_file.truncate()
+                for field in plan.fields:
+                    if field.unique:
+                        path = '{0}.{1}.db'.format(checkpoint, field.id)
+                        if os.path.exists(path):
+                            os.remove(path)
+                        seen[field.id] = _seen_set(field, path=path)
+
+        chunks = queue.Queue(maxsize=1)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def produce(generated):
+            # the nodes of a chunk, run again for the next chunks of the same
+            # size on the same processes
+            nodes, nodes_num = None, None
+            pool = dag.ProcessPool()
+            try:
+                saved = time.time()
+                while (num is None or generated < num) and not stop.is_set():
+                    n = chunk_size if num is None else min(chunk_size, num - generated)
+                    if n != nodes_num:
+                        nodes_num = n
+                        nodes = provider._profile_nodes(plan, n, seen)
+                    results = provider._run_profile(plan, n, processes, executor, seen=seen,
+                                                    nodes=nodes, pool=pool)
+                    if n == 1:
+                        results = dict((key, [value]) for key, value in results.items())
+                    generated += n
+
+                    # the state after this chunk, saved once it is consumed
+                    state = None
+                    if checkpoint is not None and time.time() - saved >= checkpoint_interval:
+                        state = pickle.dumps({'fields': plan.fields, 'chunk_size': chunk_size,
+                                              'rows': generated, 'seen': seen,
+                                              'random': random.getstate()},
+                                             pickle.HIGHEST_PROTOCOL)
+                        saved = time.time()
+                    put((n, results, state))
+                put(None)
+            except Exception as e:
+                put(e)
+            finally:
+                pool.close()
+
+        producer = threading.Thread(target=produce, args=(generated,))
+        producer.daemon = True
+        producer.start()
+        try:
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
+                if output == 'columns':
+                    yield ProfileColumns(plan, chunk[1], chunk[0])
+                else:
+                    for row in self._rows(plan, chunk[1], chunk[0]):
+                        yield row
+                if chunk[2] is not None:
+                    self._save_checkpoint(checkpoint, chunk[2], output_file)
+        finally:
+            stop.set()
+            # the chunk being generated, if any, is finished first
+            producer.join()
+
+        if checkpoint is not None:
+            for field in plan.fields:
+                if field.id in seen and hasattr(seen[field.id], 'close'):
+                    seen[field.id].close()
+                path = '{0}.{1}.db'.format(checkpoint, field.id)
+                if os.path.exists(path):
+                    os.remove(path)
+            if os.path.exists(checkpoint):
+                os.remove(checkpoint)
 
-        if num == 1:
-            return self._reshape_nested_results(results)
+    @staticmethod
+    def _load_checkpoint(path):
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as fh:
+            checkpoint = pickle.load(fh)
+        state = pickle.loads(checkpoint['state'])
+        state['offset'] = checkpoint['offset']
+        return state
 
+    @staticmethod
+    def _save_checkpoint(path, state, output_file):
+        offset = None
+        if output_file is not None:
+            output_file.flush()
+            offset = output_file.tell()
+        # written next to the checkpoint first, so that a run interrupted
+        # while saving it leaves the previous one
+        with open(path + '.tmp', 'wb') as fh:
+            pickle.dump({'state': state, 'offset': offset}, fh, pickle.HIGHEST_PROTOCOL)
+        replace(path + '.tmp', path)
+
+    @staticmethod
+    def _validate_run_options(output, executor):
+        if output not in OUTPUTS:
+            raise ValueError('Value of output must be one of: ' + ', '.join(OUTPUTS))
+        if executor != 'auto' and executor not in dag.EXECUTORS:
+            raise ValueError('Value of executor must be one of: auto, ' + ', '.join(dag.EXECUTORS))
+
+    def _get_plan(self, definition):
+        if isinstance(definition, ProfilePlan):
+            return definition
+        return self.compile_profile(definition)
+
+    def _profile_nodes(self, plan, num, seen=None, run_seen=None):
+        """
+        The dag nodes generating num values of each field of plan, to be
+        run by _run_profile. The unique fields keep their values in the sets
+        of seen, by field id, if given; otherwise the sets they need are
+        added to run_seen.
+        """
+        generators = {}
+        formatters = plan.formatters(self.generator)
+
+        for field in plan.fields:
+            unique_values = field.unique
+            if unique_values and seen is not None and field.id not in seen:
+                seen[field.id] = _seen_set(field)
+            elif unique_values and seen is None and (field.scope or _backend(field) != 'memory'):
+                run_seen[field.id] = _seen_set(field)
+            sets = seen if seen is not None else run_seen
+
+            if unique_values and field.scope:
+                formatter = self._scoped_unique(field, num, sets[field.id])
+            elif num == 1 and not unique_values and not field.multiple:
+                formatter = formatters[field.id]
+                if field.options:
+                    formatter = functools.partial(formatter, **field.options)
+            else:
+                if unique_values and field.id in sets:
+                    unique_values = sets[field.id]
+                formatter = self.generator.get_formatter(formatter=field.type,
+                                                         num=num,
+                                                         sparsity=field.sparsity,
+                                                         unique=unique_values,
+                                                         options=field.options,
+                                                         multiple=field.multiple)
+
+            # the sets kept across runs, and the databases of the disk
+            # backend, must be used in this process
+            local = seen is not None and field.id in seen or field.unique and _backend(field) != 'memory'
+            node = dag.TaskNode(field.id, self._seeded(formatter), local=bool(local))
+            for parameter, dependency in self._dependencies(field):
+                node.add_parent(parameter, dependency)
+            node.children = list(plan.children[field.id])
+            generators[field.id] = node
+
+        return generators
+
+    def _run_profile(self, plan, num, processes, executor, seen=None, nodes=None, pool=None):
+        # nodes from _profile_nodes(plan, num, seen) can be given, to run
+        # them again, e.g. on the same dag.ProcessPool
+        run_seen = {}
+        if nodes is None:
+            nodes = self._profile_nodes(plan, num, seen, run_seen)
+
+        if executor == 'auto':
+            if num == 1 or len(plan.fields) == 1 or num * len(plan.fields) < AUTO_SERIAL_VALUES:
+                executor = 'serial'
+            else:
+                executor = 'processes'
+
+        # every field gets its own seed, drawn from this generator's random
+        # instance, so the results do not depend on where the fields run
+        random = self.generator.random
+        seeds = dict((id, {SEED_PARAMETER: random.getrandbits(64)}) for id in sorted(nodes))
+        state = random.getstate()
+
+        try:
+            return dag.run(nodes, processes=processes, order=[field.id for field in plan.fields],
+                           executor=executor, pool=pool, arguments=seeds)
+        finally:
+            random.setstate(state)
+            for values in run_seen.values():
+                values.close()
+
+    def _rows(self, plan, results, num):
         # reformat the results from one giant dictionary to a list
         # of dictionaries, one per generated profile
+        columns = [results[field.id] for field in plan.fields]
         res = []
         for i in range(num):
-            res.append({})
-            for key in results.keys():
-                res[i][key] = results[key][i]
-
-        for i in range(num):
-            res[i] = self._reshape_nested_results(res[i])
+            res.append(self._reshape_nested_results(plan, [column[i] for column in columns]))
 
         return res
 
     @staticmethod
-    def _reshape_nested_results(results):
+    def _reshape_nested_results(plan, values):
+        # values are by field id, or in the order of the plan's fields
+        if isinstance(values, dict):
+            values = [values[field.id] for field in plan.fields]
         res = {}
-        for key in results.keys():
-            if '.' in key:
-                r = res
-                parts = key.split('.')
-                for part in parts[:-1]:
-                    r = r.setdefault(part, {})
-                r[parts[-1]] = results[key]
-            else:
-                res[key] = results[key]
+        for field, value in zip(plan.fields, values):
+            r = res
+            for part in field.path[:-1]:
+                r = r.setdefault(part, {})
+            r[field.path[-1]] = value
         return res
 
-    def _get_generators(self, definition, num, generators, events, results, prefix=None):
+    @staticmethod
+    def _dependencies(field):
+        # the (parameter, field id) pairs of the fields a field needs first
+        dependencies = list(field.context)
+        context = set(dependency for _, dependency in field.context)
+        for id in field.scope:
+            if id not in context:
+                dependencies.append((SCOPE_PARAMETER + id, id))
+        return dependencies
+
+    def _scoped_unique(self, field, num, scoped):
+        """
+        The worker of a field whose values are unique within the values of
+        the fields of its scope: the rows are grouped by their scope, and
+        each group's values are generated together, unique in the seen-set
+        of that scope.
+        """
+        generator = self.generator
+        unique_values = generator.unique(field.type, **field.options)
+        context = dict((dependency, parameter) for parameter, dependency in reversed(field.context))
+        parameters = [context.get(id, SCOPE_PARAMETER + id) for id in field.scope]
+
+        def scoped_worker(**args):
+            scope_values = [args[parameter] for parameter in parameters]
+            for parameter in parameters:
+                if parameter.startswith(SCOPE_PARAMETER):
+                    del args[parameter]
+
+            if num == 1:
+                unique_values.seen = scoped.partition(tuple(scope_values))
+                return unique_values(**args)
+
+            if field.sparsity:
+                randint = generator.random.randint
+                rows = [i for i in range(num) if randint(1, 100) > field.sparsity]
+            else:
+                rows = list(range(num))
+
+            res = [None] * num
+            groups = group_rows([tuple(values[i] for values in scope_values) for i in rows])
+            for scope, group in groups.items():
+                unique_values.seen = scoped.partition(scope)
+                # the context is part of the scope, so it is the same for the whole group
+                first = rows[group[0]]
+                values = unique_values.take(len(group), **dict((key, args[key][first]) for key in args))
+                for j, value in zip(group, values):
+                    res[rows[j]] = value
+            return res
+
+        return scoped_worker
+
+    def _seeded(self, worker):
+        # the seed of each run is given to the worker by dag.run
+        random = self.generator.random
+
+        def seeded_worker(**kwargs):
+            random.seed(kwargs.pop(SEED_PARAMETER))
+            return worker(**kwargs)
+
+        return seeded_worker
+
+    def _compile_fields(self, definition, fields, prefix=None):
         for key in definition:
             prefixed_key = prefix + '.' + key if prefix else key
 
             self._validate_field(key, definition[key])
+            field = definition[key]
 
-            if 'fields' in definition[key]:
-                self._get_generators(definition[key]['fields'], num, generators, events, results, prefix=prefixed_key)
+            if 'fields' in field:
+                self._compile_fields(field['fields'], fields, prefix=prefixed_key)
                 continue
 
-            if 'constant' in definition[key]:
-                formatter = self.generator.get_formatter(formatter='constant',
-                                                         num=num,
-                                                         sparsity=definition[key]['sparsity'],
-                                                         unique=False,
-                                                         options={'value': definition[key]['constant']},
-                                                         multiple=False)
+            context = []
+            if len(field['context']):
+                context = sorted(field['context'][0].items())
+
+            # unique values are unique among the profiles with the same context
+            scope = []
+            if field.get('unique') and not field['multiple']:
+                for id in [dependency for _, dependency in context] + field['within']:
+                    if id not in scope:
+                        scope.append(id)
+
+            if 'constant' in field:
+                fields.append(ProfileField(prefixed_key, tuple(prefixed_key.split('.')), 'constant',
+                                           {'value': field['constant']}, field['sparsity'], False, False,
+                                           tuple(context), ()))
             else:
-                formatter = self.generator.get_formatter(formatter=definition[key]['type'],
-                                                         num=num,
-                                                         sparsity=definition[key]['sparsity'],
-                                                         unique=definition[key]['unique'],
-                                                         options=definition[key]['options'],
-                                                         multiple=definition[key]['multiple'])
-
-            events[prefixed_key] = multiprocessing.Event()
-            generators[prefixed_key] = dag.ProcessNode(prefixed_key, formatter, events[prefixed_key], results)
+                fields.append(ProfileField(prefixed_key, tuple(prefixed_key.split('.')), field['type'],
+                                           field['options'], field['sparsity'], field['unique'],
+                                           field['multiple'], tuple(context), tuple(scope)))
 
     @classmethod
     def choice(cls, choices):
         return cls.random_element(choices)
 
-    @staticmethod
-    def constant(value):
+    @classmethod
+    def choice_batch(cls, choices, n=2):
+        return cls.random_element_batch(choices, n)
+
+    @classmethod
+    def constant(cls, value):
         return value
 
+    @classmethod
+    def constant_batch(cls, value, n=2):
+        return [value] * n
+
     @staticmethod
     def _validate_field(name, field):
         if 'choices' in field:
@@ -194,10 +668,23 @@ class Provider(BaseProvider):
             field['sparsity'] = 0
 
         if ('type' not in field and
-                'fields' not in field):
-            raise SyntaxError('Type not defined for field ' + field)
+                'fields' not in field and
+                'constant' not in field):
+            raise SyntaxError('Type not defined for field ' + name)
+
+        field['within'] = []
+        if isinstance(field.get('unique'), dict):
+            # e.g. {within: organization, backend: disk}
+            within = field['unique'].get('within', [])
+            field['within'] = [within] if is_string(within) else list(within)
+            field['unique'] = field['unique'].get('backend', True)
 
         if 'unique' in field:
-            field['unique'] = bool(field['unique'])
+            if is_string(field['unique']):
+                if field['unique'] not in unique.BACKENDS:
+                    raise ValueError('Value of ' + name + '.unique must be a boolean or one of: ' +
+                                     ', '.join(sorted(unique.BACKENDS)))
+            else:
+                field['unique'] = bool(field['unique'])
         else:
             field['unique'] = False
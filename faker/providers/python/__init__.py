@@ -90,7 +90,7 @@ class Provider(BaseProvider):
             nb_elements = self.randomize_nb_elements(nb_elements)
 
         return dict(zip(
-            Lorem.words(nb_elements),
+            self._bound(Lorem).words(nb_elements),
             self._pyiterable(nb_elements, False, *value_types)
         ))
 
@@ -107,9 +107,9 @@ class Provider(BaseProvider):
         d = {}
         nd = {}
         for i in range(count):
-            d[Lorem.word()] = self._random_type(value_types)
+            d[self._bound(Lorem).word()] = self._random_type(value_types)
             l.append(self._random_type(value_types))
-            nd[Lorem.word()] = {
+            nd[self._bound(Lorem).word()] = {
                 i: self._random_type(value_types),
                 i + 1: [self._random_type(value_types), self._random_type(value_types), self._random_type(value_types)],
                 i + 2: {
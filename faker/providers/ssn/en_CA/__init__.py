@@ -1,7 +1,6 @@
 # coding=utf-8
 from __future__ import unicode_literals
 from .. import Provider as SsnProvider
-from faker.generator import random
 
 
 class Provider(SsnProvider):
@@ -12,7 +11,7 @@ class Provider(SsnProvider):
     def ssn(cls):
        
         #create an array of 8 elements initialized randomly
-        digits = random.sample(range(10), 8)
+        digits = cls.random.sample(range(10), 8)
         
         # All of the digits must sum to a multiple of 10.  
         # sum the first 8 and set 9th to the value to get to a multiple of 10
@@ -2,7 +2,6 @@
 
 from __future__ import unicode_literals
 from .. import Provider as SsnProvider
-from faker.generator import random
 
 
 def checksum(digits):
@@ -29,7 +28,7 @@ class Provider(SsnProvider):
 
     @classmethod
     def ssn(cls):
-        digits = random.sample(range(10), 9)
+        digits = cls.random.sample(range(10), 9)
 
         dv = checksum(digits)
         digits.append(dv)
@@ -39,5 +38,5 @@ class Provider(SsnProvider):
 
     @classmethod
     def cpf(cls):
-        c = Provider.ssn()
+        c = cls.ssn()
         return c[:3] + '.' + c[3:6] + '.' + c[6:9] + '-' + c[9:]
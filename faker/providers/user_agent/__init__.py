@@ -4,7 +4,6 @@ from __future__ import unicode_literals
 
 from datetime import datetime
 
-from faker.generator import random
 from faker.providers.date_time import Provider as DatetimeProvider
 
 from .. import BaseProvider
@@ -43,24 +42,24 @@ class Provider(BaseProvider):
 
     @classmethod
     def chrome(cls):
-        saf = str(random.randint(531, 536)) + str(random.randint(0, 2))
+        saf = str(cls.random.randint(531, 536)) + str(cls.random.randint(0, 2))
         tmplt = '({0}) AppleWebKit/{1} (KHTML, like Gecko)' \
                 ' Chrome/{2}.0.{3}.0 Safari/{4}'
         platforms = (
             tmplt.format(cls.linux_platform_token(),
                          saf,
-                         random.randint(13, 15),
-                         random.randint(800, 899),
+                         cls.random.randint(13, 15),
+                         cls.random.randint(800, 899),
                          saf),
             tmplt.format(cls.windows_platform_token(),
                          saf,
-                         random.randint(13, 15),
-                         random.randint(800, 899),
+                         cls.random.randint(13, 15),
+                         cls.random.randint(800, 899),
                          saf),
             tmplt.format(cls.mac_platform_token(),
                          saf,
-                         random.randint(13, 15),
-                         random.randint(800, 899),
+                         cls.random.randint(13, 15),
+                         cls.random.randint(800, 899),
                          saf),
         )
 
@@ -70,13 +69,13 @@ class Provider(BaseProvider):
     def firefox(cls):
         ver = (
             'Gecko/{0} Firefox/{1}.0'.format(
-                DatetimeProvider.date_time_between(
-                    datetime(2011, 1, 1)), random.randint(4, 15)),
+                cls._bound(DatetimeProvider).date_time_between(
+                    datetime(2011, 1, 1)), cls.random.randint(4, 15)),
             'Gecko/{0} Firefox/3.6.{1}'.format(
-                DatetimeProvider.date_time_between(
-                    datetime(2010, 1, 1)), random.randint(1, 20)),
+                cls._bound(DatetimeProvider).date_time_between(
+                    datetime(2010, 1, 1)), cls.random.randint(1, 20)),
             'Gecko/{0} Firefox/3.8'.format(
-                DatetimeProvider.date_time_between(
+                cls._bound(DatetimeProvider).date_time_between(
                     datetime(2010, 1, 1)), ),
         )
         tmplt_win = '({0}; {1}; rv:1.9.{2}.20) {3}'
@@ -85,29 +84,29 @@ class Provider(BaseProvider):
         platforms = (
             tmplt_win.format(cls.windows_platform_token(),
                              cls.random_element(cls.langs),
-                             random.randint(0, 2),
-                             random.choice(ver)),
+                             cls.random.randint(0, 2),
+                             cls.random.choice(ver)),
             tmplt_lin.format(cls.linux_platform_token(),
-                             random.randint(5, 7),
-                             random.choice(ver)),
+                             cls.random.randint(5, 7),
+                             cls.random.choice(ver)),
             tmplt_mac.format(cls.mac_platform_token(),
-                             random.randint(2, 6),
-                             random.choice(ver)),
+                             cls.random.randint(2, 6),
+                             cls.random.choice(ver)),
         )
 
         return 'Mozilla/5.0 ' + cls.random_element(platforms)
 
     @classmethod
     def safari(cls):
-        saf = "{0}.{1}.{2}".format(random.randint(531, 535),
-                                   random.randint(1, 50),
-                                   random.randint(1, 7))
-        if random.randint(0, 1) == 0:
-            ver = "{0}.{1}".format(random.randint(4, 5),
-                                   random.randint(0, 1))
+        saf = "{0}.{1}.{2}".format(cls.random.randint(531, 535),
+                                   cls.random.randint(1, 50),
+                                   cls.random.randint(1, 7))
+        if cls.random.randint(0, 1) == 0:
+            ver = "{0}.{1}".format(cls.random.randint(4, 5),
+                                   cls.random.randint(0, 1))
         else:
-            ver = "{0}.0.{1}".format(random.randint(4, 5),
-                                     random.randint(1, 5))
+            ver = "{0}.0.{1}".format(cls.random.randint(4, 5),
+                                     cls.random.randint(1, 5))
         tmplt_win = '(Windows; U; {0}) AppleWebKit/{1} (KHTML, like Gecko)' \
                     ' Version/{2} Safari/{3}'
         tmplt_mac = '({0} rv:{1}.0; {2}) AppleWebKit/{3} (KHTML, like Gecko)' \
@@ -121,17 +120,17 @@ class Provider(BaseProvider):
                              ver,
                              saf),
             tmplt_mac.format(cls.mac_platform_token(),
-                             random.randint(2, 6),
+                             cls.random.randint(2, 6),
                              cls.random_element(cls.langs),
                              saf,
                              ver,
                              saf),
-            tmplt_ipod.format(random.randint(3, 4),
-                              random.randint(0, 3),
+            tmplt_ipod.format(cls.random.randint(3, 4),
+                              cls.random.randint(0, 3),
                               cls.random_element(cls.langs),
                               saf,
-                              random.randint(3, 4),
-                              random.randint(111, 119),
+                              cls.random.randint(3, 4),
+                              cls.random.randint(111, 119),
                               saf),
         )
 
@@ -143,24 +142,24 @@ class Provider(BaseProvider):
         platforms = (
             tmplt.format(cls.linux_platform_token(),
                          cls.random_element(cls.langs),
-                         random.randint(160, 190),
-                         random.randint(10, 12)),
+                         cls.random.randint(160, 190),
+                         cls.random.randint(10, 12)),
             tmplt.format(cls.windows_platform_token(),
                          cls.random_element(cls.langs),
-                         random.randint(160, 190),
-                         random.randint(10, 12)),
+                         cls.random.randint(160, 190),
+                         cls.random.randint(10, 12)),
         )
-        return 'Opera/{0}.{1}.{2}'.format(random.randint(8, 9),
-                                          random.randint(10, 99),
+        return 'Opera/{0}.{1}.{2}'.format(cls.random.randint(8, 9),
+                                          cls.random.randint(10, 99),
                                           cls.random_element(platforms))
 
     @classmethod
     def internet_explorer(cls):
         tmplt = 'Mozilla/5.0 (compatible; MSIE {0}.0; {1}; Trident/{2}.{3})'
-        return tmplt.format(random.randint(5, 9),
+        return tmplt.format(cls.random.randint(5, 9),
                             cls.windows_platform_token(),
-                            random.randint(3, 5),
-                            random.randint(0, 1))
+                            cls.random.randint(3, 5),
+                            cls.random.randint(0, 1))
 
     @classmethod
     def windows_platform_token(cls):
@@ -175,4 +174,4 @@ class Provider(BaseProvider):
     def mac_platform_token(cls):
         return 'Macintosh; {0} Mac OS X 10_{1}_{2}'.format(
             cls.random_element(cls.mac_processors),
-            random.randint(5, 8), random.randint(0, 9))
+            cls.random.randint(5, 8), cls.random.randint(0, 9))
@@ -7,6 +7,7 @@ __loader__ = None
 import datetime
 import json
 import os
+import re
 import time
 import unittest
 import string
@@ -127,6 +128,234 @@ class UtilsTestCase(unittest.TestCase):
         self.assertTrue(boundaries[2][0] > c_pop > boundaries[2][1])
         self.assertTrue(boundaries[3][0] > d_pop > boundaries[3][1])
 
+    def test_weighted_choice(self):
+        from faker.utils.distribution import WeightedChoice, cached_choice
+
+        a = ('a', 'b', 'c', 'd')
+        p = (5, 2, 2, 1)
+
+        weighted_choice = WeightedChoice(a, p)
+        self.assertEqual(len(weighted_choice), 4)
+
+        random.seed(0)
+        samples = [weighted_choice.choice() for _ in range(10000)]
+        for value, weight in zip(a, p):
+            self.assertAlmostEqual(samples.count(value) / 10000.0, weight / 10.0, delta=0.02)
+
+        self.assertEqual(WeightedChoice(['a'], [0.3]).choice(), 'a')
+        self.assertTrue(cached_choice({'a': 1, 'b': 2}) is cached_choice({'a': 1, 'b': 2}))
+        mapping = dict(('v{0}'.format(i), i + 1) for i in range(1000))
+        choice = cached_choice(mapping)
+        self.assertTrue(cached_choice(mapping) is choice)
+        mapping['v1000'] = 1
+        self.assertEqual(len(cached_choice(mapping)), 1001)
+
+        # a weight changed in place is taken into account
+        from faker.providers import BaseProvider
+        mapping = {'a': 1, 'b': 0}
+        self.assertEqual(BaseProvider.random_element(mapping), 'a')
+        mapping['a'], mapping['b'] = 0, 1
+        self.assertEqual(BaseProvider.random_element(mapping), 'b')
+        self.assertEqual(BaseProvider.random_element_batch(WeightedChoice(['a', 'b'], [0, 1]), n=3), ['b'] * 3)
+
+    def test_unique_sampling(self):
+        from faker.utils.stats import unique_sampling, sample_range
+
+        self.assertEqual(sorted(unique_sampling(3, 12)), list(range(3, 13)))
+        self.assertEqual(sorted(sample_range(0, 4, 5)), [0, 1, 2, 3, 4])
+
+        # only the values taken are generated, whatever the size of the range
+        sample = sample_range(0, 10 ** 18, 1000)
+        self.assertEqual(len(set(sample)), 1000)
+        self.assertTrue(all(0 <= i <= 10 ** 18 for i in sample))
+
+    def test_unique_sequence(self):
+        from faker.utils.unique import UniqueSequence
+
+        for size in (1, 2, 5, 100, 1001):
+            self.assertEqual(sorted(UniqueSequence(size, key=1)), list(range(size)))
+
+        sequence = UniqueSequence(10 ** 7, key=42, transform='{0:07d}'.format)
+        values = [sequence.next() for _ in range(10)]
+        self.assertEqual(len(set(values)), 10)
+        self.assertEqual(sequence.position, 10)
+        self.assertEqual(values[3], sequence.at(3))
+        self.assertEqual(values[2:6], UniqueSequence(10 ** 7, key=42, transform='{0:07d}'.format).slice(2, 6))
+        self.assertNotEqual(values, UniqueSequence(10 ** 7, key=43, transform='{0:07d}'.format).slice(0, 10))
+        self.assertRaises(IndexError, sequence.at, 10 ** 7)
+
+    def test_hash_set(self):
+        from faker.utils.unique import HashSet
+
+        hash_set = HashSet(capacity=4)
+        self.assertTrue(hash_set.add('a'))
+        self.assertFalse(hash_set.add('a'))
+        self.assertTrue(hash_set.add(1))
+        for i in range(1000):
+            hash_set.add(str(i))
+        self.assertEqual(len(hash_set), 1002)
+        self.assertTrue('999' in hash_set)
+        self.assertTrue(1 in hash_set)
+        self.assertFalse('1000' in hash_set)
+
+        # values of different types are different values
+        hash_set = HashSet()
+        self.assertTrue(hash_set.add(1))
+        self.assertTrue(hash_set.add('1'))
+        self.assertTrue(hash_set.add(b'1'))
+        self.assertFalse(hash_set.add(1))
+        fake = Factory.create()
+        self.assertEqual(sorted(fake.unique('random_element', elements=(1, '1')).take(2), key=repr), ['1', 1])
+
+    def test_disk_set(self):
+        import tempfile
+        from faker.utils.unique import DiskSet, ScalableBloomFilter, hash64
+
+        disk_set = DiskSet(capacity=100, buffer_size=10)
+        self.assertTrue(disk_set.add('a'))
+        for i in range(100):
+            disk_set.add(i)
+        self.assertFalse(disk_set.add('a'))
+        self.assertFalse(disk_set.add(5))
+        self.assertTrue(99 in disk_set)
+        self.assertFalse(100 in disk_set)
+        self.assertEqual(len(disk_set), 101)
+        disk_set.close()
+
+        # the Bloom filter grows past its capacity
+        bloom = ScalableBloomFilter(capacity=100, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(hash64(i))
+        self.assertTrue(all(hash64(i) in bloom for i in range(1000)))
+        self.assertTrue(sum(hash64(i) in bloom for i in range(1000, 11000)) < 200)
+
+        # values stored in a file are kept across runs
+        path = os.path.join(tempfile.mkdtemp(), 'unique.db')
+        disk_set = DiskSet(path)
+        disk_set.add('a')
+        disk_set.close()
+        disk_set = DiskSet(path)
+        self.assertEqual(len(disk_set), 1)
+        self.assertFalse(disk_set.add('a'))
+        self.assertTrue(disk_set.add('b'))
+        disk_set.close()
+        os.remove(path)
+
+    def test_manifest(self):
+        from faker.build_manifest import write_manifest
+        from faker.utils.loading import get_provider_locales
+
+        # run `python -m faker.build_manifest` if this fails
+        manifest = StringIO()
+        write_manifest(manifest)
+        with open(os.path.join(TEST_DIR, '..', 'manifest.py')) as fh:
+            self.assertEqual(manifest.getvalue(), fh.read())
+
+        self.assertTrue('en_US' in get_provider_locales('faker.providers.person'))
+        # providers that are not in the manifest are scanned
+        self.assertEqual(get_provider_locales('faker.tests.mymodule'), ['en_US'])
+
+    def test_packed_files(self):
+        import glob
+        import tempfile
+        from faker.utils.packed import read_csv, read_lines, write_strings, write_table
+
+        # run `python -m faker.utils.packed <source> <file>.bin` if this fails
+        directory = tempfile.mkdtemp()
+        paths = glob.glob(os.path.join(TEST_DIR, '..', 'providers', '*', '*', '*.bin'))
+        self.assertEqual(len(paths), 9)
+        for path in paths:
+            rebuilt = os.path.join(directory, os.path.basename(path))
+            source = os.path.splitext(path)[0]
+            if os.path.exists(source + '.txt'):
+                write_strings(rebuilt, read_lines(source + '.txt'))
+            else:
+                write_table(rebuilt, *read_csv(source + '.csv'))
+            with open(path, 'rb') as committed, open(rebuilt, 'rb') as fh:
+                self.assertTrue(committed.read() == fh.read(), path + ' is stale')
+            os.remove(rebuilt)
+        os.rmdir(directory)
+
+    def test_packed_table(self):
+        import tempfile
+        from faker.utils.distribution import WeightedChoice
+        from faker.utils.packed import PackedTable, write_table
+
+        values = ['Smith', 'Jöhnson', 'Li', '']
+        weights = [5.0, 2.5, 2.0, 0.5]
+        path = os.path.join(tempfile.mkdtemp(), 'table.bin')
+        write_table(path, values, weights)
+
+        table = PackedTable(path)
+        self.assertEqual(len(table), 4)
+        self.assertEqual(list(table), values)
+        self.assertEqual(table[-3], 'Jöhnson')
+        self.assertEqual(table.weight(1), 2.5)
+        self.assertEqual(table.total, 10.0)
+        self.assertEqual(table.index(7.6), 2)
+        self.assertEqual(list(table.weights), weights)
+        self.assertEqual(table.weights[-1], 0.5)
+
+        # the same values as a WeightedChoice of the same weights
+        random.seed(9)
+        expected = WeightedChoice(values, weights).choices(100)
+        random.seed(9)
+        self.assertEqual(table.choices(100), expected)
+
+        # the census tables are found relative to their package
+        from faker.providers.person.en_US import Provider
+        self.assertEqual(Provider.last_names_US[0], 'Smith')
+        self.assertAlmostEqual(Provider.last_name_freq_US[1], 0.81)
+        os.remove(path)
+
+    def test_string_table(self):
+        import pickle
+        import tempfile
+        from faker.providers import BaseProvider
+        from faker.utils.packed import StringTable, write_strings
+
+        values = ('Ωρωπού', 'Main St', '', 'Ψυχικού')
+        path = os.path.join(tempfile.mkdtemp(), 'values.bin')
+        write_strings(path, values)
+
+        table = StringTable(path)
+        self.assertEqual(len(table), 4)
+        self.assertEqual(tuple(table), values)
+        self.assertEqual(table[-1], 'Ψυχικού')
+        self.assertEqual(table[1:3], values[1:3])
+        self.assertTrue('Main St' in table)
+        self.assertEqual(table.index(''), 2)
+        self.assertRaises(IndexError, table.__getitem__, 4)
+        self.assertEqual(tuple(pickle.loads(pickle.dumps(table))), values)
+
+        # drawn like the tuple it stands for
+        random.seed(3)
+        expected = [BaseProvider.random_element(values) for _ in range(20)]
+        random.seed(3)
+        self.assertEqual([BaseProvider.random_element(table) for _ in range(20)], expected)
+
+        # the locale tables are found relative to their package
+        from faker.providers.address.el_GR import Provider
+        self.assertEqual(Provider.localities[-1], 'Ύδρας')
+        os.remove(path)
+
+    def test_column_transport(self):
+        from faker.utils import transport
+
+        columns = [
+            ['foo', 'bár', None, ''],
+            [1, None, -5, 2 ** 62],
+            [datetime.date(2016, 1, 1), None, 2 ** 70],
+            [True, 1],
+            [],
+        ]
+        for column in columns:
+            handle = transport.write_column(column)
+            values = transport.read_column(handle)
+            transport.release(handle)
+            self.assertEqual(values, column)
+            self.assertEqual([type(value) for value in values], [type(value) for value in column])
+
     def test_add_dicts(self):
         from faker.utils.datasets import add_dicts
 
@@ -207,6 +436,17 @@ class FactoryTestCase(unittest.TestCase):
                                        'foo', append='!')
         self.assertEqual('bazfoo!', result)
 
+    def test_format_calls_formatter_once(self):
+        calls = []
+
+        def failing_formatter():
+            calls.append(1)
+            raise KeyError('value')
+
+        self.generator.set_formatter('failing_formatter', failing_formatter)
+        self.assertRaises(KeyError, self.generator.format, 'failing_formatter')
+        self.assertEqual(len(calls), 1)
+
     def test_parse_returns_same_string_when_it_contains_no_curly_braces(self):
         self.assertEqual('fooBar#?', self.generator.parse('fooBar#?'))
 
@@ -215,6 +455,178 @@ class FactoryTestCase(unittest.TestCase):
             'This is {{foo_formatter}} a text with "{{ foo_formatter }}"')
         self.assertEqual('This is foobar a text with " foobar "', result)
 
+    def test_parse_uses_newly_added_formatters(self):
+        text = '{{foo_formatter}}, {{foo_formatter}}!'
+        self.assertEqual('foobar, foobar!', self.generator.parse(text))
+        self.assertEqual('foobar, foobar!', self.generator.parse(text))
+
+        self.generator.add_provider(BarProvider())
+        self.assertEqual('barfoo, barfoo!', self.generator.parse(text))
+
+        self.assertRaises(AttributeError, self.generator.parse, '{{ barFormatter }}')
+
+    def test_batch(self):
+        from faker.providers import BaseProvider
+
+        self.assertEqual(['foobar'] * 3, self.generator.batch('foo_formatter', 3))
+        self.assertEqual(['bazfoo!'] * 2,
+                         self.generator.batch('foo_formatter_with_arguments', 2, param='foo', append='!'))
+        self.assertEqual(['foobar-foobar'] * 2, self.generator.parse_batch('{{foo_formatter}}-{{foo_formatter}}', 2))
+
+        class BatchProvider(BaseProvider):
+            def foo_formatter(self):
+                return 'foo'
+
+            def foo_formatter_batch(self, n=2):
+                return ['batch'] * n
+
+        class OverridingProvider(BatchProvider):
+            def foo_formatter(self):
+                return 'override'
+
+        self.generator.add_provider(BatchProvider)
+        self.assertEqual(['batch'] * 3, self.generator.batch('foo_formatter', 3))
+        self.assertEqual(['batch', 'batch'], self.generator.get_formatter('foo_formatter', num=2)())
+
+        # a batch method is not used for a formatter overridden after it
+        self.generator.add_provider(OverridingProvider)
+        self.assertEqual(['override'] * 3, self.generator.batch('foo_formatter', 3))
+
+        self.assertRaises(AttributeError, self.generator.batch, 'barFormatter', 2)
+
+    def test_unique(self):
+        fake = Factory.create()
+
+        emails = fake.get_formatter('email', num=500, unique=True)()
+        self.assertEqual(len(set(emails)), 500)
+
+        digits = fake.get_formatter('random_digit', num=10, unique=True)()
+        self.assertEqual(sorted(digits), list(range(10)))
+        self.assertRaises(ValueError, fake.get_formatter('random_digit', num=11, unique=True))
+
+        unique_int = fake.unique('random_int', max_retries=100, min=1, max=3)
+        self.assertEqual(sorted(unique_int() for _ in range(3)), [1, 2, 3])
+        self.assertRaises(ValueError, unique_int)
+
+    def test_batch_grouped_by_arguments(self):
+        from faker.providers import BaseProvider
+
+        calls = []
+
+        class ContextProvider(BaseProvider):
+            def greeting(self, name, greeting='hello'):
+                return greeting + ' ' + name
+
+            def greeting_batch(self, name, greeting='hello', n=2):
+                calls.append((name, n))
+                return [greeting + ' ' + name] * n
+
+        self.generator.add_provider(ContextProvider)
+        names = ['ann', 'bob', 'ann', 'ann', 'bob']
+        values = self.generator.get_formatter('greeting', num=5)(name=names, greeting='hi')
+        self.assertEqual(values, ['hi ' + name for name in names])
+        self.assertEqual(sorted(calls), [('ann', 3), ('bob', 2)])
+
+        values = self.generator.get_formatter('greeting', num=5, sparsity=50)(name=names)
+        for name, value in zip(names, values):
+            self.assertTrue(value in (None, 'hello ' + name))
+
+    def test_lazy_factory(self):
+        fake = Factory.create('it_IT')
+        lazy = Factory.create('it_IT', lazy=True, includes=['faker.tests.mymodule'])
+        self.assertEqual(sorted(p.__provider__ for p in lazy.get_providers()), ['base', 'faker.tests.mymodule'])
+
+        fake.seed(4)
+        lazy.seed(4)
+        self.assertEqual([fake.name(), fake.format('city')] + fake.batch('last_name', 5),
+                         [lazy.name(), lazy.format('city')] + lazy.batch('last_name', 5))
+        self.assertEqual(sorted(p.__provider__ for p in lazy.get_providers()),
+                         ['base', 'faker.providers.address', 'faker.providers.person', 'faker.tests.mymodule'])
+        self.assertEqual(lazy.provider('faker.providers.person').__lang__, 'it_IT')
+        self.assertEqual(lazy.foo(), 'bar')
+        self.assertRaises(AttributeError, lazy.format, 'no_such_formatter')
+
+    def test_clone(self):
+        fake = Factory.create('fr_FR', includes=['faker.tests.mymodule'])
+        other = Factory.create('fr_FR', includes=['faker.tests.mymodule'])
+        self.assertFalse(other.random is fake.random)
+        self.assertFalse(other.provider('faker.providers.person') is fake.provider('faker.providers.person'))
+
+        fake.seed(7)
+        other.seed(7)
+        clone = fake.clone(seed=7)
+        values = [fake.name(), fake.random_int(), fake.address(), fake.foo()]
+        self.assertEqual([other.name(), other.random_int(), other.address(), other.foo()], values)
+        self.assertEqual([clone.name(), clone.random_int(), clone.address(), clone.foo()], values)
+        self.assertEqual(clone.provider('faker.providers.address').__lang__, 'fr_FR')
+        self.assertTrue(clone.name.__self__.generator is clone)
+
+        # the clone of a lazy generator loads its own providers
+        lazy = Factory.create('fr_FR', lazy=True)
+        lazy.seed(7)
+        clone = lazy.clone(seed=7)
+        self.assertEqual(clone.name(), lazy.name())
+        self.assertEqual(clone.provider('faker.providers.person').generator, clone)
+
+    def test_get_formatter_multiple(self):
+        from faker.utils.datasets import ListColumn
+
+        fake = Factory.create()
+        fake.seed(5)
+        multiple = {'duplicates': False, 'min': 0, 'max': 8, 'variance': 4, 'mean': 4}
+        genders = ['F', 'M'] * 50
+        column = fake.get_formatter('first_name', num=100, sparsity=20, multiple=multiple)(gender=genders)
+        self.assertTrue(isinstance(column, ListColumn))
+        self.assertEqual(len(column), 100)
+        self.assertEqual(column.offsets[-1], len(column.values))
+        self.assertTrue(any(values is None for values in column))
+        for i, values in enumerate(column):
+            if values is not None:
+                self.assertTrue(0 <= len(values) <= 8)
+                self.assertEqual(len(values), len(set(values)))
+                self.assertEqual(values, column[i])
+
+        multiple = {'duplicates': False, 'min': 5, 'max': 6, 'variance': 1, 'mean': 5}
+        self.assertRaises(ValueError, fake.get_formatter('random_int', num=10, options={'min': 1, 'max': 3},
+                                                         multiple=multiple))
+
+        self.assertEqual(ListColumn([0, 2, 2, 3], ['a', 'b', 'c'], [1, 0, 1]), [['a', 'b'], None, ['c']])
+
+        # a single value is a list too, whatever its length
+        for length in (0, 1, 3):
+            multiple = {'duplicates': False, 'min': length, 'max': length + 0.5, 'variance': 1, 'mean': length}
+            values = fake.get_formatter('random_int', num=1, multiple=multiple)()
+            self.assertTrue(isinstance(values, list))
+            self.assertEqual(len(values), length)
+        definition = {'numbers': {'type': 'random_int',
+                                  'multiple': {'duplicates': True, 'min': 1, 'max': 1.5, 'variance': 1, 'mean': 1}}}
+        self.assertTrue(isinstance(fake.spec_profile(definition, num=1)['numbers'], list))
+        profiles = list(fake.iter_profiles(definition, num=41, chunk_size=20))
+        self.assertTrue(all(profile['numbers'] == [profile['numbers'][0]] for profile in profiles))
+
+    def test_batch_values(self):
+        from faker.providers import BaseProvider
+
+        for value in BaseProvider.numerify_batch('#%-!@', n=100):
+            self.assertTrue(re.match(r'^\d[1-9]-\d?([1-9])?$', value))
+        for value in BaseProvider.bothify_batch('{##??}', n=100):
+            self.assertTrue(re.match(r'^\{\d\d[a-zA-Z]{2}\}$', value))
+
+        fake = Factory.create()
+        for name in ('name', 'address', 'email', 'phone_number', 'date', 'zipcode', 'company'):
+            values = fake.batch(name, 20)
+            self.assertEqual(len(values), 20)
+            self.assertTrue(all(isinstance(value, string_types) for value in values))
+        self.assertTrue(all('@' in email for email in fake.batch('email', 20)))
+
+        from faker.providers.address.en_US import Provider
+        self.assertTrue(all(z[:3] in Provider.state_abbr_to_zipcodes['CA'] for z in fake.zipcode_batch('CA', n=20)))
+        self.assertRaises(Exception, fake.zipcode_batch, 'XX', n=2)
+        self.assertRaises(Exception, fake.zipcode, 'XX')
+        self.assertRaises(Exception, fake.zipcode, ['XX', 'CA'], n=2)
+        self.assertEqual(len(fake.zipcode(['NY', 'CA'], n=2)), 2)
+        self.assertFalse('XX' in Provider.state_abbr_to_zipcodes)
+
 #   def testParseReturnsStringWithTokensReplacedByFormatterWithArguments(self):
 #       result = self.generator.parse(
 #           'This is {{foo_formatter_with_arguments:bar}}')
@@ -249,6 +661,17 @@ class FactoryTestCase(unittest.TestCase):
         finally:
             sys.stdout = orig_stdout
 
+    def test_command_checkpoint(self):
+        from faker.cli import Command
+        orig_stderr = sys.stderr
+        try:
+            sys.stderr = StringIO()
+            command = Command(['faker', 'profile', '-o', os.devnull, '--checkpoint', os.devnull + '.checkpoint'])
+            self.assertRaises(SystemExit, command.execute)
+            assert 'definition' in sys.stderr.getvalue()
+        finally:
+            sys.stderr = orig_stderr
+
     def test_command_custom_provider(self):
         from faker.cli import Command
         orig_stdout = sys.stdout
@@ -535,6 +958,254 @@ class FactoryTestCase(unittest.TestCase):
             email = factory.email()
             self.assertTrue('@' in email)
 
+    def test_spec_profile(self):
+        factory = Factory.create()
+        definition = {
+            'sex': {'choices': ['F', 'M']},
+            'name': {'type': 'first_name', 'context': {'gender': 'sex'}},
+            'address': {'fields': {'city': {'type': 'city'}, 'zipcode': {'type': 'zipcode', 'unique': True}}},
+        }
+
+        factory.seed(1)
+        profiles = factory.spec_profile(definition, num=50, processes=1)
+        self.assertEqual(len(profiles), 50)
+        self.assertEqual(set(profiles[0]), set(['sex', 'name', 'address']))
+        self.assertEqual(len(set(p['address']['zipcode'] for p in profiles)), 50)
+
+        # the same profiles whatever the number of processes
+        factory.seed(1)
+        self.assertEqual(profiles, factory.spec_profile(definition, num=50, processes=3, executor='processes'))
+        factory.seed(1)
+        self.assertEqual(profiles, factory.spec_profile(definition, num=50, executor='serial'))
+
+        profiles = factory.spec_profile(definition, num=50, processes=3, executor='threads')
+        self.assertEqual(len(set(p['address']['zipcode'] for p in profiles)), 50)
+        self.assertRaises(ValueError, factory.spec_profile, definition, executor='greenlets')
+
+        self.assertRaises(ValueError, factory.spec_profile,
+                          {'digit': {'type': 'random_digit', 'unique': True}, 'name': {'type': 'name'}}, num=11)
+        self.assertRaises(SyntaxError, factory.spec_profile,
+                          {'a': {'type': 'name', 'context': {'x': 'b'}}, 'b': {'type': 'name', 'context': {'x': 'a'}}})
+
+    def test_dag_processes(self):
+        import threading
+        from faker import dag
+
+        def make_nodes(offset):
+            nodes = {'a': dag.TaskNode('a', lambda: [offset, offset + 1]),
+                     'b': dag.TaskNode('b', lambda a, step: [value + step for value in a])}
+            nodes['a'].children = ['b']
+            nodes['b'].add_parent('a', 'a')
+            return nodes
+
+        # concurrent runs each have their own processes and nodes
+        results = {}
+
+        def run(offset):
+            results[offset] = dag.run(make_nodes(offset), processes=2, arguments={'b': {'step': 10}})
+
+        threads = [threading.Thread(target=run, args=(offset,)) for offset in (0, 100, 200)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for offset in (0, 100, 200):
+            self.assertEqual(results[offset], {'a': [offset, offset + 1], 'b': [offset + 10, offset + 11]})
+
+        # a pool is kept across runs of the same nodes
+        nodes = make_nodes(0)
+        with dag.ProcessPool() as pool:
+            for step in (1, 2):
+                self.assertEqual(dag.run(nodes, processes=2, pool=pool, arguments={'b': {'step': step}})['b'],
+                                 [step, step + 1])
+            self.assertTrue(pool.get(nodes, 2) is pool.get(nodes, 2))
+            self.assertEqual(dag.run(make_nodes(5), processes=2, pool=pool, arguments={'b': {'step': 0}})['b'],
+                             [5, 6])
+
+    def test_compile_profile(self):
+        import copy
+        import pickle
+
+        factory = Factory.create()
+        definition = {
+            'sex': {'choices': ['F', 'M']},
+            'name': {'type': 'first_name', 'context': {'gender': 'sex'}},
+            'address': {'fields': {'city': {'type': 'city'}}},
+            'version': {'constant': 2},
+        }
+        original = copy.deepcopy(definition)
+
+        plan = factory.compile_profile(definition)
+        self.assertEqual(definition, original)
+        order = [field.id for field in plan.fields]
+        self.assertTrue(order.index('sex') < order.index('name'))
+        self.assertEqual(sorted(order), ['address.city', 'name', 'sex', 'version'])
+
+        factory.seed(2)
+        profiles = factory.spec_profile(plan, num=5)
+        factory.seed(2)
+        self.assertEqual(profiles, factory.spec_profile(pickle.loads(pickle.dumps(plan)), num=5))
+        self.assertEqual(profiles[0]['version'], 2)
+        self.assertTrue(profiles[0]['address']['city'])
+
+        self.assertRaises(AttributeError, factory.compile_profile, {'a': {'type': 'no_such_formatter'}})
+        self.assertRaises(ValueError, factory.compile_profile, {'a': {'type': 'name', 'context': {'x': 'b'}}})
+
+    def test_spec_profile_columns(self):
+        factory = Factory.create()
+        definition = {
+            'sex': {'choices': ['F', 'M']},
+            'address': {'fields': {'city': {'type': 'city'}}},
+        }
+
+        factory.seed(4)
+        profiles = factory.spec_profile(definition, num=5)
+        factory.seed(4)
+        columns = factory.spec_profile(definition, num=5, output='columns')
+        self.assertEqual(sorted(columns), ['address.city', 'sex'])
+        self.assertEqual(columns['sex'], [p['sex'] for p in profiles])
+        rows = columns.rows()
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[-1], profiles[-1])
+        self.assertEqual(list(rows), profiles)
+
+        self.assertEqual(len(factory.spec_profile(definition, output='columns')['sex']), 1)
+        chunks = list(factory.iter_profiles(definition, num=12, chunk_size=5, output='columns'))
+        self.assertEqual([len(chunk['sex']) for chunk in chunks], [5, 5, 2])
+        self.assertRaises(ValueError, factory.spec_profile, definition, output='table')
+
+    def test_iter_profiles(self):
+        import itertools
+
+        factory = Factory.create()
+        definition = {
+            'sex': {'choices': ['F', 'M']},
+            'name': {'type': 'first_name', 'context': {'gender': 'sex'}},
+            'number': {'type': 'random_int', 'options': {'min': 0, 'max': 99}, 'unique': True},
+        }
+
+        profiles = list(factory.iter_profiles(definition, num=100, chunk_size=30, processes=1))
+        self.assertEqual(len(profiles), 100)
+        # unique across chunks
+        self.assertEqual(sorted(p['number'] for p in profiles), list(range(100)))
+
+        profiles = factory.iter_profiles(definition, num=101, chunk_size=30)
+        self.assertRaises(ValueError, list, profiles)
+
+        profiles = factory.iter_profiles({'name': {'type': 'name'}}, chunk_size=7)
+        self.assertEqual(len(list(itertools.islice(profiles, 20))), 20)
+        profiles.close()
+
+        # the profiles are generated with their own random instance, only
+        # seeded from the generator's
+        factory.seed(0)
+        expected = [factory.random_int() for _ in range(20)]
+        factory.seed(0)
+        factory.random.getrandbits(64)
+        expected_after_seed = [factory.random_int() for _ in range(40)]
+        factory.seed(0)
+        values = [factory.random_int() for _ in factory.iter_profiles(definition, num=40, chunk_size=7)]
+        self.assertEqual(values, expected_after_seed)
+
+        # and are not generated anymore once the profiles are closed
+        profiles = factory.iter_profiles({'name': {'type': 'name'}}, chunk_size=5000)
+        next(profiles)
+        profiles.close()
+        factory.seed(0)
+        self.assertEqual([factory.random_int() for _ in range(20)], expected)
+
+    def test_spec_profile_scoped_unique(self):
+        factory = Factory.create()
+        definition = {
+            'org': {'choices': ['a', 'b', 'c']},
+            'mrn': {'type': 'random_int', 'options': {'min': 0, 'max': 99}, 'unique': {'within': 'org'}},
+            'sex': {'choices': ['F', 'M']},
+            'name': {'type': 'first_name', 'context': {'gender': 'sex'}, 'unique': True, 'sparsity': 10},
+        }
+
+        def assert_unique(profiles, field, scope):
+            values = {}
+            for profile in profiles:
+                if profile[field] is not None:
+                    values.setdefault(profile[scope], []).append(profile[field])
+            for scope_values in values.values():
+                self.assertEqual(len(scope_values), len(set(scope_values)))
+
+        factory.seed(3)
+        profiles = factory.spec_profile(definition, num=200)
+        assert_unique(profiles, 'mrn', 'org')
+        assert_unique(profiles, 'name', 'sex')
+        # 200 values out of 100 can only be unique per organization
+        self.assertTrue(len(set(p['mrn'] for p in profiles)) <= 100)
+        factory.seed(3)
+        self.assertEqual(profiles, factory.spec_profile(definition, num=200, processes=3, executor='processes'))
+
+        definition['mrn']['unique'] = {'within': ['org'], 'backend': 'disk'}
+        profiles = list(factory.iter_profiles(definition, num=250, chunk_size=40, processes=2))
+        assert_unique(profiles, 'mrn', 'org')
+
+        # the databases of the disk backend are created and removed in this process
+        import glob
+        import tempfile
+        pattern = os.path.join(tempfile.gettempdir(), 'faker-unique-*.db')
+        before = set(glob.glob(pattern))
+        definition['number'] = {'type': 'random_int', 'options': {'min': 0, 'max': 999}, 'unique': 'disk'}
+        profiles = factory.spec_profile(definition, num=200, processes=3, executor='processes')
+        assert_unique(profiles, 'mrn', 'org')
+        self.assertEqual(len(set(p['number'] for p in profiles)), 200)
+        self.assertEqual(set(glob.glob(pattern)), before)
+        del definition['number']
+
+        definition['mrn']['unique'] = {'within': 'org', 'backend': 'cloud'}
+        self.assertRaises(ValueError, factory.compile_profile, definition)
+
+    def test_iter_profiles_resume(self):
+        import io
+        import tempfile
+
+        definition = {
+            'org': {'choices': ['a', 'b', 'c']},
+            'mrn': {'type': 'random_int', 'options': {'min': 0, 'max': 999},
+                    'unique': {'within': 'org', 'backend': 'disk'}},
+            'number': {'type': 'random_int', 'options': {'min': 0, 'max': 10 ** 6}, 'unique': True},
+        }
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'profiles.txt')
+        checkpoint = path + '.checkpoint'
+
+        def run(stop=None, resume=False):
+            factory = Factory.create()
+            factory.seed(7)
+            with io.open(path, 'r+' if resume else 'w') as output:
+                profiles = factory.iter_profiles(definition, num=300, chunk_size=37, checkpoint=checkpoint,
+                                                 resume=resume, output_file=output, checkpoint_interval=0)
+                for i, profile in enumerate(profiles):
+                    if i == stop:
+                        # interrupted while writing a profile
+                        output.write('{')
+                        return
+                    output.write('{0}\n'.format(profile))
+            with io.open(path) as output:
+                return output.read()
+
+        expected = run()
+        self.assertEqual(os.listdir(directory), ['profiles.txt'])
+
+        run(stop=100)
+        self.assertTrue(os.path.exists(checkpoint))
+        run(stop=200, resume=True)
+        self.assertEqual(run(resume=True), expected)
+        self.assertEqual(os.listdir(directory), ['profiles.txt'])
+
+        # interrupted before its first checkpoint
+        with io.open(path, 'w') as output:
+            output.write(expected + '{')
+        self.assertEqual(run(resume=True), expected)
+        os.remove(path)
+
+        profiles = Factory.create().iter_profiles(definition, num=10, resume=True)
+        self.assertRaises(ValueError, list, profiles)
+
 
 class GeneratorTestCase(unittest.TestCase):
 
@@ -552,6 +1223,41 @@ class GeneratorTestCase(unittest.TestCase):
         self.generator.seed(0)
         self.assertFalse(mock_system_random.called)
 
+    def test_generators_have_independent_random(self):
+        generator = Generator()
+        self.assertFalse(generator.random is self.generator.random)
+        self.assertFalse(generator.random is random)
+
+        fake1 = Factory.create()
+        fake2 = Factory.create()
+        fake1.seed(42)
+        fake2.seed(42)
+        names = [fake1.name() for _ in range(10)]
+        random.seed(0)
+        self.assertEqual(names, [fake2.name() for _ in range(10)])
+
+        # classmethods called through the generator use its random instance
+        fake1.seed(1)
+        numbers = [fake1.random_int() for _ in range(10)]
+        fake1.seed(1)
+        fake2.seed(2)
+        self.assertEqual(numbers, [fake1.random_int() for _ in range(10)])
+
+    def test_seed_shard(self):
+        def shard_values(shard, num_shards):
+            self.generator.seed(4321, shard=shard, num_shards=num_shards)
+            return [self.generator.random.random() for _ in range(5)]
+
+        shards = [shard_values(i, 4) for i in range(4)]
+        self.assertEqual(shards[2], shard_values(2, 4))
+        self.assertEqual(len(set(tuple(s) for s in shards)), 4)
+
+        self.generator.seed(4321)
+        self.assertNotEqual(shards[0], [self.generator.random.random() for _ in range(5)])
+
+        self.assertRaises(ValueError, self.generator.seed, 4321, shard=4, num_shards=4)
+        self.assertRaises(ValueError, self.generator.seed, None, shard=0)
+
 
 if __name__ == '__main__':
     unittest.main()
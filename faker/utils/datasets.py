@@ -22,3 +22,70 @@ def add_dicts(*args):
 
     counters = [Counter(arg) for arg in args]
     return dict(reduce(operator.add, counters))
+
+
+def group_rows(values):
+    """
+    Groups row indices by value, e.g. to generate the rows that share a value
+    together and then scatter the results back to their rows.
+
+        >>> group_rows(['F', 'M', 'F'])
+        {'F': [0, 2], 'M': [1]}
+
+    """
+    groups = {}
+    for i, value in enumerate(values):
+        try:
+            groups[value].append(i)
+        except KeyError:
+            groups[value] = [i]
+    return groups
+
+
+class ListColumn(object):
+    """
+    A column of lists of values, e.g. of a profile field with multiple
+    values, stored flat as in Arrow list arrays: the values of all the
+    lists in one list, and the offset of each list's first value in it
+    (plus the end of the last list). Rows that are None have no values and
+    a 0 in valid. Indexing a row returns its values as a new list.
+
+        >>> column = ListColumn([0, 2, 2, 3], ['a', 'b', 'c'], [1, 0, 1])
+        >>> list(column)
+        [['a', 'b'], None, ['c']]
+
+    """
+
+    def __init__(self, offsets, values, valid=None):
+        self.offsets = offsets
+        self.values = values
+        self.valid = valid if valid is not None else bytearray([1]) * (len(offsets) - 1)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('ListColumn index out of range')
+        if not self.valid[i]:
+            return None
+        return self.values[self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self):
+        offsets, values, valid = self.offsets, self.values, self.valid
+        for i in range(len(offsets) - 1):
+            yield values[offsets[i]:offsets[i + 1]] if valid[i] else None
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __repr__(self):
+        return 'ListColumn({0!r})'.format(list(self))
@@ -1,9 +1,15 @@
 # coding=utf-8
 
 import bisect
-from faker.generator import random
+from faker.generator import random as mod_random
 
-def random_sample():
+_cached_choices = {}
+_MAX_CACHED_CHOICES = 512
+
+
+def random_sample(random=None):
+    if random is None:
+        random = mod_random
     return random.uniform(0.0, 1.0)
 
 
@@ -14,13 +20,104 @@ def cumsum(it):
         yield total
 
 
-def choice_distribution(a, p):
+def choice_distribution(a, p, random=None):
     assert len(a) == len(p)
 
     cdf = list(cumsum(p))
     normal = cdf[-1]
     cdf2 = [float(i) / float(normal) for i in cdf]
-    uniform_sample = random_sample()
+    uniform_sample = random_sample(random)
     idx = bisect.bisect_right(cdf2, uniform_sample)
 
     return a[idx]
+
+
+class WeightedChoice(object):
+    """
+    Weighted random choice over a fixed set of values, using Walker's alias
+    method (Vose's variant).
+    https://en.wikipedia.org/wiki/Alias_method
+    The tables are built once, in O(n); every draw afterwards is O(1) and
+    consumes a single uniform sample, so this should be used instead of
+    choice_distribution whenever the same values and weights are sampled
+    repeatedly.
+    """
+
+    def __init__(self, values, weights):
+        assert len(values) == len(weights)
+        assert len(values) > 0
+
+        n = len(weights)
+        total = float(sum(weights))
+        scaled = [w * n / total for w in weights]
+
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+
+        # whatever is left over is only off from 1.0 by rounding errors,
+        # so these columns keep prob=1.0 and never use their alias
+
+        self.values = values
+        self._n = n
+        self._prob = prob
+        self._alias = alias
+
+    def __len__(self):
+        return self._n
+
+    def choice(self, random=None):
+        if random is None:
+            random = mod_random
+        u = random.random() * self._n
+        i = int(u)
+        if u - i >= self._prob[i]:
+            i = self._alias[i]
+        return self.values[i]
+
+    def choices(self, n, random=None):
+        """Returns a list of n values, drawn independently."""
+        if random is None:
+            random = mod_random
+        rnd = random.random
+        size, prob, alias, values = self._n, self._prob, self._alias, self.values
+        res = []
+        for _ in range(n):
+            u = rnd() * size
+            i = int(u)
+            if u - i >= prob[i]:
+                i = alias[i]
+            res.append(values[i])
+        return res
+
+
+def cached_choice(mapping):
+    """
+    Return a WeightedChoice for a {value: weight} mapping, reusing the one
+    built for an identical mapping before. The mapping is looked up by its
+    items, so changing it in place gives a new table; to draw repeatedly
+    from a large mapping, build its WeightedChoice once instead.
+    """
+    key = tuple(mapping.items())
+    try:
+        return _cached_choices[key]
+    except KeyError:
+        pass
+
+    if len(_cached_choices) >= _MAX_CACHED_CHOICES:
+        _cached_choices.clear()
+
+    choice = _cached_choices[key] = WeightedChoice([k for k, _ in key], [w for _, w in key])
+    return choice
@@ -2,6 +2,13 @@ import os
 from importlib import import_module
 import pkgutil
 
+MANIFEST_MODULE = 'faker.manifest'
+
+# the locales of the localized providers, by provider path; filled from the
+# manifest, and by scanning the providers that are not in it (e.g. included
+# third-party providers) the first time they are used
+_provider_locales = {}
+
 
 def list_module(module):
     path = os.path.dirname(module.__file__)
@@ -29,3 +36,30 @@ def find_available_providers(modules):
         providers = ['.'.join([providers_mod.__package__, mod]) for mod in list_module(providers_mod)]
         available_providers.update(providers)
     return sorted(available_providers)
+
+
+def load_manifest():
+    """The manifest module, or None if it has not been generated."""
+    try:
+        return import_module(MANIFEST_MODULE)
+    except ImportError:
+        return None
+
+
+def get_provider_locales(provider_path, provider_module=None):
+    """
+    The locales of a localized provider, from the manifest if it is in it,
+    or else found in its package (and remembered).
+    """
+    if not _provider_locales:
+        manifest = load_manifest()
+        if manifest is not None:
+            _provider_locales.update(manifest.LOCALES)
+    try:
+        return _provider_locales[provider_path]
+    except KeyError:
+        pass
+
+    provider_module = provider_module or import_module(provider_path)
+    locales = _provider_locales[provider_path] = sorted(list_module(provider_module))
+    return locales
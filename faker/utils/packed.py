@@ -0,0 +1,354 @@
+# coding=utf-8
+
+"""
+Packed tables: weighted lists of strings (e.g. census name frequencies),
+prebuilt into a binary file that is mapped into memory on first use,
+instead of being parsed from CSV into Python lists on import.
+
+A table file holds, after a 16 bytes header (b'FKPT', the format version,
+the number of values and the size of the strings), little-endian arrays of:
+- the cumulative weights of the values (float64);
+- the alias method tables of WeightedChoice for them (float64 and uint32),
+  so drawing a value is O(1) and gives the same values as a WeightedChoice
+  of the same weights, for the same random state;
+- the offsets of the values in the strings (uint32, one more than values);
+followed by the values, as UTF-8 strings one after the other.
+
+String tables are plain sequences of strings (e.g. the streets of a
+locale), packed the same way without the weights: after the header (with
+b'FKST' instead), the offsets of the values, followed by the values.
+
+Tables are built from CSV files of values and weights, and string tables
+from text files of one value per line, with:
+
+    python -m faker.utils.packed table.csv table.bin
+    python -m faker.utils.packed values.txt values.bin
+"""
+
+from __future__ import print_function
+
+from array import array
+import bisect
+import csv
+import io
+import mmap
+import os
+import pkgutil
+import struct
+import sys
+
+from faker.generator import random as mod_random
+from faker.utils.distribution import WeightedChoice
+
+MAGIC = b'FKPT'
+STRINGS_MAGIC = b'FKST'
+VERSION = 1
+_HEADER = struct.Struct('<4sIII')
+
+# number of values, from the start of a table, kept once decoded
+CACHED_VALUES = 4096
+
+
+def write_table(path, values, weights):
+    """Writes values and their weights to a packed table file."""
+    choice = WeightedChoice(values, weights)
+
+    cumulative = array('d')
+    total = 0.0
+    for weight in weights:
+        total += weight
+        cumulative.append(total)
+
+    parts = [cumulative, array('d', choice._prob), array('I', choice._alias)]
+    _write(path, MAGIC, parts, values)
+
+
+def write_strings(path, values):
+    """Writes a sequence of strings to a packed string table file."""
+    _write(path, STRINGS_MAGIC, [], values)
+
+
+def _write(path, magic, parts, values):
+    # the arrays of parts, then the offsets of the values, and the values
+    data = [value.encode('utf-8') for value in values]
+    offsets = array('I', [0])
+    for value in data:
+        offsets.append(offsets[-1] + len(value))
+    parts = parts + [offsets]
+
+    if sys.byteorder != 'little':
+        for part in parts:
+            part.byteswap()
+
+    with open(path, 'wb') as fh:
+        fh.write(_HEADER.pack(magic, VERSION, len(data), offsets[-1]))
+        for part in parts:
+            fh.write(_tobytes(part))
+        fh.write(b''.join(data))
+
+
+class PackedTable(object):
+    """
+    A packed table file (see write_table), read on first use. The file is
+    mapped into memory, so its pages are shared by all the processes using
+    it, and only those that are used are ever read. The path is relative
+    to the given package, if any; from a zipped package, the file is read
+    into memory instead.
+
+    A table is a read-only sequence of its values, and has the choice and
+    choices methods of WeightedChoice. Only the first CACHED_VALUES values
+    are kept once decoded (tables sorted by decreasing weight, like the
+    census tables, are drawn from them most of the time); the others are
+    decoded from the file every time, not to fill the process's memory
+    with them.
+    """
+
+    def __init__(self, path, package=None):
+        self.path = path
+        self.package = package
+        self._size = None
+
+    def _load(self):
+        data, size = _open(self.path, self.package, MAGIC)
+        position = _HEADER.size
+        self._cumulative, position = _view(data, position, size, 'd')
+        self._prob, position = _view(data, position, size, 'd')
+        self._alias, position = _view(data, position, size, 'I')
+        self._offsets, position = _view(data, position, size + 1, 'I')
+        self._start = position
+        self._data = data
+        self._cache = [None] * min(size, CACHED_VALUES)
+        self._size = size
+
+    def __len__(self):
+        if self._size is None:
+            self._load()
+        return self._size
+
+    def __getitem__(self, i):
+        if self._size is None:
+            self._load()
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError('Table index out of range')
+        return self._value(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._value(i)
+
+    def __contains__(self, value):
+        return any(v == value for v in self)
+
+    def _value(self, i):
+        cache = self._cache
+        if i < len(cache):
+            value = cache[i]
+            if value is None:
+                value = cache[i] = self._decode(i)
+            return value
+        return self._decode(i)
+
+    def _decode(self, i):
+        start = self._start
+        return self._data[start + self._offsets[i]:start + self._offsets[i + 1]].decode('utf-8')
+
+    @property
+    def weights(self):
+        """A read-only sequence of the weights of the values."""
+        return TableWeights(self)
+
+    @property
+    def total(self):
+        """The sum of the weights of the values."""
+        return self._cumulative[-1] if len(self) else 0.0
+
+    def weight(self, i):
+        """The weight of the i-th value."""
+        if self._size is None:
+            self._load()
+        return self._cumulative[i] - (self._cumulative[i - 1] if i else 0.0)
+
+    def index(self, x):
+        """The index of the value whose cumulative weight range covers x, for 0 <= x < total."""
+        if self._size is None:
+            self._load()
+        return min(bisect.bisect_right(self._cumulative, x), self._size - 1)
+
+    def choice(self, random=None):
+        if random is None:
+            random = mod_random
+        if self._size is None:
+            self._load()
+        u = random.random() * self._size
+        i = int(u)
+        if u - i >= self._prob[i]:
+            i = self._alias[i]
+        return self._value(i)
+
+    def choices(self, n, random=None):
+        """Returns a list of n values, drawn independently."""
+        if random is None:
+            random = mod_random
+        if self._size is None:
+            self._load()
+        rnd = random.random
+        size, prob, alias, cache, value = self._size, self._prob, self._alias, self._cache, self._value
+        cached = len(cache)
+        res = []
+        for _ in range(n):
+            u = rnd() * size
+            i = int(u)
+            if u - i >= prob[i]:
+                i = alias[i]
+            res.append(cache[i] if i < cached and cache[i] is not None else value(i))
+        return res
+
+
+class TableWeights(object):
+    """The weights of the values of a PackedTable, as a read-only sequence."""
+
+    def __init__(self, table):
+        self.table = table
+
+    def __len__(self):
+        return len(self.table)
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self.table)
+        if not 0 <= i < len(self.table):
+            raise IndexError('Table index out of range')
+        return self.table.weight(i)
+
+    def __iter__(self):
+        for i in range(len(self.table)):
+            yield self.table.weight(i)
+
+
+class StringTable(object):
+    """
+    A packed string table file (see write_strings), read on first use like a
+    PackedTable: a read-only sequence of its values, indexable like the
+    tuple it stands for. The values are decoded from the mapped file when
+    they are read rather than kept as Python strings, so that processes
+    sharing a table don't write to its pages (reference counts) and end up
+    with their own copy of them.
+    """
+
+    def __init__(self, path, package=None):
+        self.path = path
+        self.package = package
+        self._size = None
+
+    def _load(self):
+        data, size = _open(self.path, self.package, STRINGS_MAGIC)
+        self._offsets, self._start = _view(data, _HEADER.size, size + 1, 'I')
+        self._data = data
+        self._size = size
+
+    def __reduce__(self):
+        # opened again by the process it is sent to
+        return StringTable, (self.path, self.package)
+
+    def __len__(self):
+        if self._size is None:
+            self._load()
+        return self._size
+
+    def __getitem__(self, i):
+        if self._size is None:
+            self._load()
+        if isinstance(i, slice):
+            return tuple(self._value(j) for j in range(*i.indices(self._size)))
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError('Table index out of range')
+        return self._value(i)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._value(i)
+
+    def __contains__(self, value):
+        return any(v == value for v in self)
+
+    def index(self, value):
+        for i, v in enumerate(self):
+            if v == value:
+                return i
+        raise ValueError('{0!r} is not in table'.format(value))
+
+    def _value(self, i):
+        start = self._start
+        return self._data[start + self._offsets[i]:start + self._offsets[i + 1]].decode('utf-8')
+
+
+def _open(path, package, magic):
+    # the data of a table file, mapped into memory if possible, and its size
+    data = None
+    if package is not None:
+        module = sys.modules.get(package) or __import__(package, fromlist=['__name__'])
+        full_path = os.path.join(os.path.dirname(module.__file__), path)
+        if not os.path.isfile(full_path):
+            data = pkgutil.get_data(package, path)
+    else:
+        full_path = path
+
+    if data is None:
+        with open(full_path, 'rb') as fh:
+            data = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    file_magic, version, size, _ = _HEADER.unpack(data[:_HEADER.size])
+    if file_magic != magic or version != VERSION:
+        raise ValueError('{0} is not a packed {1} of version {2}'.format(
+            path, 'table' if magic == MAGIC else 'string table', VERSION))
+    return data, size
+
+
+def _view(data, position, count, typecode):
+    # the array of count items at position, without copying it if possible
+    end = position + count * array(typecode).itemsize
+    if sys.byteorder == 'little' and hasattr(memoryview, 'cast'):
+        return memoryview(data)[position:end].cast(typecode), end
+    values = array(typecode)
+    if hasattr(values, 'frombytes'):
+        values.frombytes(bytes(data[position:end]))
+    else:
+        values.fromstring(bytes(data[position:end]))
+    if sys.byteorder != 'little':
+        values.byteswap()
+    return values, end
+
+
+def _tobytes(a):
+    return a.tobytes() if hasattr(a, 'tobytes') else a.tostring()
+
+
+def read_lines(path):
+    """Reads the lines of a UTF-8 text file, without their line endings."""
+    with io.open(path, encoding='utf-8', newline='') as fh:
+        return [line.rstrip('\r\n') for line in fh]
+
+
+def read_csv(path):
+    """Reads the values (title-cased) and weights of the rows of a census CSV file."""
+    values = []
+    weights = []
+    with io.open(path, newline='') as fh:
+        for row in csv.reader(fh):
+            values.append(row[0].title())
+            weights.append(float(row[1]))
+    return values, weights
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print('usage: python -m faker.utils.packed table.csv|values.txt table.bin', file=sys.stderr)
+        sys.exit(2)
+    if sys.argv[1].endswith('.txt'):
+        write_strings(sys.argv[2], read_lines(sys.argv[1]))
+    else:
+        write_table(sys.argv[2], *read_csv(sys.argv[1]))
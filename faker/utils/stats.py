@@ -1,13 +1,13 @@
 # coding=utf-8
 
 import bisect
+import itertools
 import math
-import scipy.stats as stats
 
-from faker.generator import random
+from faker.generator import random as mod_random
 
 
-def reservoir_sampling(iterator, n=2):
+def reservoir_sampling(iterator, n=2, random=None):
     """
     Reservoir sampling method to generate a random sample of n elements
     from a given element stream (implementation of algorithm R).
@@ -16,6 +16,9 @@ def reservoir_sampling(iterator, n=2):
     because time complexity is dominated by the size of the original stream,
     not the number of elements selected from it.
     """
+    if random is None:
+        random = mod_random
+
     res = []
 
     # initialize the reservoir with the first n elements of the stream
@@ -34,8 +37,45 @@ def reservoir_sampling(iterator, n=2):
     return res
 
 
+def unique_sampling(min, max, random=None):
+    """
+    Lazily yield the integers from min to max (both inclusive) in random
+    order, each exactly once (a sparse Fisher-Yates shuffle).
+    https://en.wikipedia.org/wiki/Fisher%E2%80%93Yates_shuffle
+    Only the positions swapped so far are stored, so time and memory are
+    proportional to the number of values taken from the stream, not to the
+    size of the range.
+    """
+    if random is None:
+        random = mod_random
+
+    size = max - min + 1
+    swapped = {}
+    i = 0
+
+    while i < size:
+        j = random.randrange(i, size)
+        value = swapped.get(j, j)
+        if j != i:
+            swapped[j] = swapped.get(i, i)
+        swapped.pop(i, None)
+        i += 1
+        yield min + value
+
+
+def sample_range(min, max, n=2, random=None):
+    """
+    Return n unique integers from min to max (both inclusive), in O(n).
+    """
+    return list(itertools.islice(unique_sampling(min, max, random=random), n))
+
+
 class RandomNormalVar(object):
-    def __init__(self, mean=0, variance=1, min=None, max=None):
+    def __init__(self, mean=0, variance=1, min=None, max=None, random=None):
+        self.random = random if random is not None else mod_random
+        # scipy takes most of the time of importing faker; only import it when needed
+        import scipy.stats as stats
+
         std_dev = math.sqrt(variance)
         if (min is not None) and (max is not None):
             self.rand_var = stats.truncnorm((min - mean) / std_dev, (max - mean) / std_dev, loc=mean, scale=std_dev)
@@ -46,10 +86,23 @@ class RandomNormalVar(object):
 
     def get(self, n=1):
         if n < 2:
-            return self.rand_var.rvs(1)[0]
-        return list(self.rand_var.rvs(n))
+            return self.rand_var.rvs(1, random_state=self._random_state())[0]
+        return list(self.rand_var.rvs(n, random_state=self._random_state()))
 
     def get_int(self, n=1):
         if n < 2:
             return int(self.get())
         return [int(round(i)) for i in self.get(n)]
+
+    def get_list(self, n):
+        """Like get, but always returns a list of n values."""
+        return list(self.rand_var.rvs(n, random_state=self._random_state()))
+
+    def get_int_list(self, n):
+        """Like get_int, but always returns a list of n values."""
+        return [int(round(i)) for i in self.get_list(n)]
+
+    def _random_state(self):
+        # scipy draws from numpy's RNG; seed it from our own generator so
+        # the values are reproducible along with everything else
+        return self.random.getrandbits(32)
@@ -87,3 +87,15 @@ def slugify(value, allow_dots=False, allow_unicode=False):
     value = unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode('ascii')
     value = pattern.sub('', value).strip().lower()
     return _re_spaces.sub('-', value)
+
+
+def join_columns(literals, columns):
+    """
+    Interleaves literal segments with columns of values, row by row:
+    row i is literals[0] + columns[0][i] + literals[1] + ... + literals[-1].
+    """
+    fmt = literals[0].replace('{', '{{').replace('}', '}}')
+    for i, literal in enumerate(literals[1:]):
+        fmt += '{' + str(i) + '}' + literal.replace('{', '{{').replace('}', '}}')
+    fmt = fmt.format
+    return [fmt(*row) for row in zip(*columns)]
@@ -0,0 +1,193 @@
+# coding=utf-8
+
+"""
+Moves generated columns between processes through shared memory: the
+producer writes a column once, and hands a small picklable ColumnHandle to
+the processes that read it, instead of pickling the values through a pipe
+or a manager process.
+
+Columns of strings are stored as UTF-8 data behind a table of offsets and
+columns of integers as an array of 64-bit integers (both with None allowed);
+anything else is pickled. The memory is a multiprocessing.shared_memory
+segment where available (Python 3.8+), and an mmap'd temporary file
+otherwise.
+"""
+
+from array import array
+import mmap
+import os
+import pickle
+import tempfile
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+try:
+    text_type = unicode
+except NameError:
+    text_type = str
+
+STRINGS = 's'
+INTEGERS = 'i'
+PICKLED = 'p'
+
+_MIN_INT = -(1 << 63)
+_MAX_INT = (1 << 63) - 1
+
+
+class ColumnHandle(object):
+    __slots__ = ('name', 'kind', 'length', 'size')
+
+    def __init__(self, name, kind, length, size):
+        self.name = name
+        self.kind = kind
+        self.length = length
+        self.size = size
+
+    def __getstate__(self):
+        return self.name, self.kind, self.length, self.size
+
+    def __setstate__(self, state):
+        self.name, self.kind, self.length, self.size = state
+
+
+def prepare():
+    """
+    Call before forking processes that will write columns, so they share
+    this process's tracker of shared memory segments: one started by a
+    worker would free its segments when the worker exits.
+    """
+    if shared_memory is not None:
+        from multiprocessing import resource_tracker
+        resource_tracker.ensure_running()
+
+
+def write_column(values):
+    """Writes values to shared memory and returns its ColumnHandle."""
+    if isinstance(values, list):
+        kind = _column_kind(values)
+    else:
+        kind = PICKLED
+
+    if kind == STRINGS:
+        data = [value.encode('utf-8') if value is not None else b'' for value in values]
+        offsets = array('q', [0]) * (len(values) + 1)
+        position = 0
+        for i, value in enumerate(data):
+            position += len(value)
+            offsets[i + 1] = position
+        parts = [_tobytes(offsets), _nulls(values)] + data
+    elif kind == INTEGERS:
+        parts = [_tobytes(array('q', [value if value is not None else 0 for value in values])), _nulls(values)]
+    else:
+        parts = [pickle.dumps(values, pickle.HIGHEST_PROTOCOL)]
+
+    size = sum(len(part) for part in parts)
+    name, buf, close = _create(size)
+    try:
+        position = 0
+        for part in parts:
+            buf[position:position + len(part)] = part
+            position += len(part)
+    finally:
+        close()
+
+    return ColumnHandle(name, kind, len(values) if kind != PICKLED else None, size)
+
+
+def read_column(handle):
+    """Reads the values of a column written by write_column."""
+    buf, close = _open(handle.name, handle.size)
+    try:
+        if handle.kind == PICKLED:
+            return pickle.loads(bytes(buf[:handle.size]))
+
+        n = handle.length
+        if handle.kind == STRINGS:
+            offsets = _frombytes(buf[:8 * (n + 1)])
+            nulls = bytes(buf[8 * (n + 1):8 * (n + 1) + n])
+            start = 8 * (n + 1) + n
+            data = bytes(buf[start:handle.size])
+            return [data[offsets[i]:offsets[i + 1]].decode('utf-8') if nulls[i:i + 1] == b'\0' else None
+                    for i in range(n)]
+
+        values = _frombytes(buf[:8 * n]).tolist()
+        nulls = bytes(buf[8 * n:8 * n + n])
+        return [value if nulls[i:i + 1] == b'\0' else None for i, value in enumerate(values)]
+    finally:
+        close()
+
+
+def release(handle):
+    """Frees the memory of a column; it can't be read anymore afterwards."""
+    if shared_memory is not None:
+        try:
+            segment = shared_memory.SharedMemory(name=handle.name)
+        except FileNotFoundError:
+            return
+        segment.close()
+        segment.unlink()
+    elif os.path.exists(handle.name):
+        os.remove(handle.name)
+
+
+def _column_kind(values):
+    kind = None
+    for value in values:
+        if value is None:
+            continue
+        if isinstance(value, text_type):
+            value_kind = STRINGS
+        elif type(value) is int and _MIN_INT <= value <= _MAX_INT:
+            value_kind = INTEGERS
+        else:
+            return PICKLED
+        if kind is None:
+            kind = value_kind
+        elif kind != value_kind:
+            return PICKLED
+    return kind or PICKLED
+
+
+def _nulls(values):
+    return bytes(bytearray(1 if value is None else 0 for value in values))
+
+
+def _tobytes(a):
+    return a.tobytes() if hasattr(a, 'tobytes') else a.tostring()
+
+
+def _frombytes(data):
+    a = array('q')
+    if hasattr(a, 'frombytes'):
+        a.frombytes(bytes(data))
+    else:
+        a.fromstring(bytes(data))
+    return a
+
+
+def _create(size):
+    # zero-sized segments and mappings are not allowed
+    if shared_memory is not None:
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        return segment.name, segment.buf, segment.close
+
+    fd, path = tempfile.mkstemp(prefix='faker-column-')
+    try:
+        os.ftruncate(fd, max(size, 1))
+        buf = mmap.mmap(fd, max(size, 1))
+    finally:
+        os.close(fd)
+    return path, buf, buf.close
+
+
+def _open(name, size):
+    if shared_memory is not None:
+        segment = shared_memory.SharedMemory(name=name)
+        return segment.buf, segment.close
+
+    with open(name, 'rb') as fh:
+        buf = mmap.mmap(fh.fileno(), max(size, 1), access=mmap.ACCESS_READ)
+    return buf, buf.close
@@ -0,0 +1,504 @@
+# coding=utf-8
+
+from array import array
+import hashlib
+import math
+import os
+import sqlite3
+import struct
+import tempfile
+
+from faker.generator import random as mod_random
+
+_M64 = (1 << 64) - 1
+ROUNDS = 6
+MAX_RETRIES = 1000
+
+try:
+    _TYPECODE = 'Q'
+    array(_TYPECODE)
+except ValueError:
+    # Python 2 has no 'Q'; 'L' is 64 bits wide on most 64-bit platforms
+    _TYPECODE = 'L'
+_HASH_MASK = (1 << (8 * array(_TYPECODE).itemsize)) - 1
+
+try:
+    text_type = unicode
+except NameError:
+    text_type = str
+
+if hasattr(hashlib, 'blake2b'):
+    def _digest(data):
+        return hashlib.blake2b(data, digest_size=8).digest()
+else:
+    def _digest(data):
+        return hashlib.md5(data).digest()[:8]
+
+
+def _mix(x):
+    # splitmix64 finalizer
+    x = ((x ^ (x >> 30)) * 0xbf58476d1ce4e5b9) & _M64
+    x = ((x ^ (x >> 27)) * 0x94d049bb133111eb) & _M64
+    return x ^ (x >> 31)
+
+
+class UniqueSequence(object):
+    """
+    A keyed pseudo-random permutation of the integers 0 .. size - 1, mapped
+    to values by an optional transform (e.g. to zero-padded digit strings).
+
+    The i-th value is computed on demand with a balanced Feistel network
+    over the smallest even number of bits that covers the domain, walking
+    the cycle until it lands back inside the domain.
+    https://en.wikipedia.org/wiki/Format-preserving_encryption
+    Values never repeat and nothing is stored but the key and the current
+    position, so sequences sharing a key can hand out disjoint slices of
+    one stream (e.g. one per worker process) without coordinating.
+
+        >>> seq = UniqueSequence(10 ** 7, key=42, transform='{0:07d}'.format)
+        >>> seq.slice(0, 3) == [seq.next(), seq.next(), seq.next()]
+        True
+
+    """
+
+    def __init__(self, size, key=None, transform=None, position=0, random=None):
+        if size < 1:
+            raise ValueError('Sequence must have at least one value')
+        if key is None:
+            key = (random if random is not None else mod_random).getrandbits(64)
+
+        half = 1
+        while 1 << (2 * half) < size:
+            half += 1
+
+        self.size = size
+        self.key = key
+        self.transform = transform
+        self.position = position
+        self._half = half
+        self._mask = (1 << half) - 1
+        self._keys = [_mix((key + r * 0x9e3779b97f4a7c15) & _M64) for r in range(ROUNDS)]
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.position >= self.size:
+            raise StopIteration
+        return self.next()
+
+    def next(self):
+        """Returns the value at the current position and advances it."""
+        value = self.at(self.position)
+        self.position += 1
+        return value
+
+    def at(self, i):
+        """Returns the i-th value of the sequence."""
+        if not 0 <= i < self.size:
+            raise IndexError('Index {0} out of range for a sequence of {1} values'.format(i, self.size))
+        i = self._permute(i)
+        while i >= self.size:
+            i = self._permute(i)
+        return self.transform(i) if self.transform is not None else i
+
+    def slice(self, start, stop):
+        """Returns the values from position start up to, excluding, stop."""
+        return [self.at(i) for i in range(start, min(stop, self.size))]
+
+    def _permute(self, x):
+        half, mask = self._half, self._mask
+        left, right = x >> half, x & mask
+        for k in self._keys:
+            left, right = right, left ^ (_mix(right ^ k) & mask)
+        return (left << half) | right
+
+
+def hash64(value):
+    """
+    A stable 64-bit hash of a value (never 0). Values that are not strings
+    are hashed with their type, so that e.g. 1 and '1' are told apart.
+    """
+    if isinstance(value, text_type):
+        data = value.encode('utf-8')
+    else:
+        # b'\xff' never occurs in UTF-8, so these never collide with strings
+        value_type = type(value)
+        data = b'\xff' + '{0}.{1}:'.format(value_type.__module__, value_type.__name__).encode('utf-8')
+        data += value if isinstance(value, bytes) else repr(value).encode('utf-8')
+    # 0 marks empty slots
+    return (struct.unpack('<Q', _digest(data))[0] & _HASH_MASK) or 1
+
+
+class HashSet(object):
+    """
+    A set that only remembers the 64-bit hashes of its values, in an
+    array-backed open-addressing table: 12 to 24 bytes per value, instead
+    of a Python object and a set entry per value.
+
+    Distinct values colliding on all 64 bits are taken for one another,
+    which is negligible even at hundreds of millions of values.
+    """
+
+    def __init__(self, capacity=1024):
+        size = 8
+        while size * 2 < capacity * 3:
+            size *= 2
+        self._table = array(_TYPECODE, [0]) * size
+        self._mask = size - 1
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, value):
+        h = hash64(value)
+        table, mask = self._table, self._mask
+        i = h & mask
+        while table[i]:
+            if table[i] == h:
+                return True
+            i = (i + 1) & mask
+        return False
+
+    def add(self, value):
+        """Adds value to the set; returns whether it was not in it yet."""
+        h = hash64(value)
+        table, mask = self._table, self._mask
+        i = h & mask
+        while table[i]:
+            if table[i] == h:
+                return False
+            i = (i + 1) & mask
+        table[i] = h
+        self._len += 1
+        if self._len * 3 > len(table) * 2:
+            self._resize(len(table) * 2)
+        return True
+
+    def _resize(self, size):
+        old = self._table
+        table = self._table = array(_TYPECODE, [0]) * size
+        mask = self._mask = size - 1
+        for h in old:
+            if h:
+                i = h & mask
+                while table[i]:
+                    i = (i + 1) & mask
+                table[i] = h
+
+
+class BloomFilter(object):
+    """
+    A Bloom filter over 64-bit hashes (see hash64), sized for capacity
+    values at the given false positive rate.
+    https://en.wikipedia.org/wiki/Bloom_filter
+    """
+
+    def __init__(self, capacity=10 ** 7, error_rate=0.01):
+        bits = int(-capacity * math.log(error_rate) / math.log(2) ** 2) or 8
+        self._bits = bytearray((bits + 7) // 8)
+        self._size = len(self._bits) * 8
+        self._k = max(1, int(round(math.log(2) * self._size / capacity)))
+
+    def _positions(self, h):
+        # double hashing: the k positions are h1 + i * h2
+        h1, h2 = h & 0xffffffff, (h >> 32) | 1
+        size = self._size
+        return [(h1 + i * h2) % size for i in range(self._k)]
+
+    def add(self, h):
+        bits = self._bits
+        for p in self._positions(h):
+            bits[p >> 3] |= 1 << (p & 7)
+
+    def __contains__(self, h):
+        bits = self._bits
+        for p in self._positions(h):
+            if not bits[p >> 3] & (1 << (p & 7)):
+                return False
+        return True
+
+
+class ScalableBloomFilter(object):
+    """
+    A Bloom filter that grows past its capacity: when it is full, a new
+    filter of twice the capacity and half the false positive rate is
+    added, so the overall false positive rate stays below error_rate.
+    http://gsd.di.uminho.pt/members/cbm/ps/dbloom.pdf
+    """
+
+    def __init__(self, capacity=10 ** 6, error_rate=0.01):
+        self._capacity = capacity
+        self._error_rate = error_rate / 2
+        self._filters = []
+        self._count = 0
+        self._grow()
+
+    def _grow(self):
+        self._filters.append(BloomFilter(self._capacity, self._error_rate))
+        self._count = 0
+
+    def add(self, h):
+        if self._count >= self._capacity:
+            self._capacity *= 2
+            self._error_rate /= 2
+            self._grow()
+        self._filters[-1].add(h)
+        self._count += 1
+
+    def __contains__(self, h):
+        for bloom in self._filters:
+            if h in bloom:
+                return True
+        return False
+
+
+class DiskSet(object):
+    """
+    A HashSet that keeps the 64-bit hashes of its values in an SQLite
+    table on disk, for more values than fit in memory.
+
+    A Bloom filter in memory answers most lookups of new values without
+    touching the disk (it is sized for capacity values, and grows when
+    more are added), and new hashes are written in transactions of
+    buffer_size. The database is a temporary file unless a path is given,
+    and is opened on first use, so a DiskSet can be handed to a forked
+    process before use.
+
+    A DiskSet with a path can be pickled, e.g. to checkpoint a job: the
+    pickle only refers to the database, and the values added after it was
+    pickled are dropped from the database when it is loaded again.
+    """
+
+    def __init__(self, path=None, capacity=10 ** 6, error_rate=0.01, buffer_size=100000):
+        self.path = path
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.buffer_size = buffer_size
+        self._bloom = ScalableBloomFilter(capacity, error_rate)
+        # buffered hashes, and their insertion numbers
+        self._pending = {}
+        self._db = None
+        self._tempfile = None
+        self._len = 0
+        self._restored_len = None
+
+    def __len__(self):
+        if self._db is None and self.path is not None:
+            self._open()
+        return self._len
+
+    def __contains__(self, value):
+        return self._contains(hash64(value))
+
+    def add(self, value):
+        """Adds value to the set; returns whether it was not in it yet."""
+        h = hash64(value)
+        if self._contains(h):
+            return False
+        self._bloom.add(h)
+        self._pending[h] = self._len
+        self._len += 1
+        if len(self._pending) >= self.buffer_size:
+            self.flush()
+        return True
+
+    def flush(self):
+        """Writes the buffered hashes to disk."""
+        if not self._pending:
+            return
+        with self._db:
+            self._db.executemany('INSERT INTO seen VALUES (?, ?)',
+                                 ((_signed(h), n) for h, n in self._pending.items()))
+        self._pending.clear()
+
+    def close(self):
+        if self._db is not None:
+            self.flush()
+            self._db.close()
+            self._db = None
+            if self._tempfile is not None:
+                os.remove(self._tempfile)
+                self._tempfile = None
+
+    def _contains(self, h):
+        if self._db is None:
+            self._open()
+        if h not in self._bloom:
+            return False
+        if h in self._pending:
+            return True
+        return self._db.execute('SELECT 1 FROM seen WHERE h = ?', (_signed(h),)).fetchone() is not None
+
+    def _open(self):
+        path = self.path
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix='faker-unique-', suffix='.db')
+            os.close(fd)
+            self._tempfile = path
+        # a set may be used by one thread after another, never concurrently
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode = OFF')
+        self._db.execute('PRAGMA synchronous = OFF')
+        self._db.execute('CREATE TABLE IF NOT EXISTS seen (h INTEGER PRIMARY KEY, n INTEGER)')
+        if self._restored_len is not None:
+            with self._db:
+                self._db.execute('DELETE FROM seen WHERE n >= ?', (self._restored_len,))
+
+        # values stored by an earlier run
+        for (h,) in self._db.execute('SELECT h FROM seen'):
+            self._bloom.add(h & _M64)
+            self._len += 1
+
+    def __getstate__(self):
+        if self.path is None:
+            raise ValueError('Only a DiskSet with a path can be pickled')
+        if self._db is not None:
+            self.flush()
+        return {'path': self.path, 'capacity': self.capacity, 'error_rate': self.error_rate,
+                'buffer_size': self.buffer_size, 'length': len(self)}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['capacity'], state['error_rate'], state['buffer_size'])
+        self._restored_len = state['length']
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def _signed(h):
+    # SQLite integers are signed 64-bit
+    return h - (1 << 64) if h >= (1 << 63) else h
+
+
+# uniqueness backends, by the name used for them in profile definitions
+BACKENDS = {
+    'memory': HashSet,
+    'disk': DiskSet,
+}
+
+
+class ScopedSet(object):
+    """
+    Seen-sets partitioned by scope (e.g. by organization), for values that
+    only need to be unique among the values sharing a scope.
+
+    With the 'memory' backend, every scope gets its own HashSet, starting
+    small (a few hundred bytes) and growing with its values, so a million
+    scopes of a few values take far less memory than one global set of all
+    their values would need to be pre-sized for. Other backends (e.g.
+    'disk') keep a single set of the hashes of (scope, value) pairs.
+    """
+
+    # initial capacity of the HashSet of each scope
+    capacity = 8
+
+    def __init__(self, backend='memory', **options):
+        self.backend = backend
+        # options of the backend's set, other than 'memory'
+        self.options = options
+        self._sets = {}
+        self._shared = None
+
+    def __len__(self):
+        return sum(len(seen) for seen in self._sets.values())
+
+    def partition(self, scope):
+        """The seen-set of the values of a scope (a hashable key)."""
+        try:
+            return self._sets[scope]
+        except KeyError:
+            pass
+
+        if self.backend == 'memory':
+            seen = HashSet(self.capacity)
+        else:
+            if self._shared is None:
+                self._shared = BACKENDS[self.backend](**self.options)
+            seen = _ScopedPartition(self._shared, scope)
+        self._sets[scope] = seen
+        return seen
+
+    def close(self):
+        if self._shared is not None and hasattr(self._shared, 'close'):
+            self._shared.close()
+
+
+class _ScopedPartition(object):
+    __slots__ = ('_seen', '_scope', '_len')
+
+    def __init__(self, seen, scope):
+        self._seen = seen
+        self._scope = scope
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, value):
+        return (self._scope, value) in self._seen
+
+    def add(self, value):
+        added = self._seen.add((self._scope, value))
+        self._len += added
+        return added
+
+
+class UniqueValues(object):
+    """
+    Makes any formatter unique: calls it until it returns a value it has not
+    returned before, giving up with a ValueError after max_retries attempts
+    in a row without a new value (i.e. when its values are exhausted).
+
+    batch, if given, is called as batch(n, **kwargs) to generate values n at
+    a time, e.g. Generator.batch for the same formatter.
+    """
+
+    def __init__(self, formatter, max_retries=MAX_RETRIES, name=None, batch=None, seen=None):
+        self.formatter = formatter
+        self.max_retries = max_retries
+        self.name = name if name is not None else getattr(formatter, '__name__', repr(formatter))
+        self.batch = batch
+        self.seen = seen if seen is not None else HashSet()
+
+    def __len__(self):
+        return len(self.seen)
+
+    def __call__(self, *args, **kwargs):
+        add = self.seen.add
+        for _ in range(self.max_retries):
+            value = self.formatter(*args, **kwargs)
+            if add(value):
+                return value
+        raise self._saturated()
+
+    def take(self, n, **kwargs):
+        """Returns a list of n new values."""
+        if self.batch is None:
+            return [self(**kwargs) for _ in range(n)]
+
+        add = self.seen.add
+        res = []
+        failures = 0
+        while len(res) < n:
+            for value in self.batch(n - len(res), **kwargs):
+                if add(value):
+                    res.append(value)
+                    failures = 0
+                else:
+                    failures += 1
+                    if failures >= self.max_retries:
+                        raise self._saturated()
+        return res
+
+    def _saturated(self):
+        return ValueError('No new value for unique "{0}" after {1} attempts; '
+                          'it may have run out of values ({2} generated)'.format(
+                              self.name, self.max_retries, len(self.seen)))
@@ -50,6 +50,15 @@ setup(
     url='http://github.com/joke2k/faker',
     license='MIT License',
     packages=find_packages(),
+    package_data={
+        'faker.providers.address.el_GR': ['*.bin'],
+        'faker.providers.address.en_US': ['*.csv'],
+        'faker.providers.address.sk_SK': ['*.bin'],
+        'faker.providers.company.fa_IR': ['*.bin'],
+        'faker.providers.job.fr_FR': ['*.bin'],
+        'faker.providers.person.en_US': ['*.bin'],
+        'faker.providers.ssn.zh_CN': ['*.bin'],
+    },
     platforms=["any"],
     test_suite='faker.tests',
     zip_safe=zip_safe,